@@ -6,7 +6,14 @@ import logging
 import aiohttp
 import async_timeout
 
-from homeassistant.const import HTTP_ACCEPTED, MATCH_ALL, STATE_ON
+from homeassistant.const import (
+    HTTP_ACCEPTED,
+    HTTP_TOO_MANY_REQUESTS,
+    MATCH_ALL,
+    STATE_ON,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
 import homeassistant.util.dt as dt_util
 
 from .const import API_CHANGE, Cause
@@ -15,17 +22,32 @@ from .messages import AlexaResponse
 
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
+# Seconds state changes are collected to be reported together
+REPORT_STATE_WINDOW = 1
+# Delay of the first retry of failed reports, doubled for each next retry
+RETRY_DELAY = 5
+MAX_RETRIES = 5
 
 
 async def async_enable_proactive_mode(hass, smart_home_config):
     """Enable the proactive mode.
 
     Proactive mode makes this component report state changes to Alexa.
+    Changes within REPORT_STATE_WINDOW are collected and only the properties
+    differing from those last reported are sent, one ChangeReport per entity
+    as Alexa has no bulk report. Reports failing with a timeout or server
+    error are retried with backoff.
     """
     # Validate we can get access token.
     await smart_home_config.async_get_access_token()
 
+    pending = {}
+    reported = {}
+    unsub_report = None
+    retries = 0
+
     async def async_entity_state_listener(changed_entity, old_state, new_state):
+        nonlocal unsub_report
         if not hass.is_running:
             return
 
@@ -45,9 +67,16 @@ async def async_enable_proactive_mode(hass, smart_home_config):
 
         for interface in alexa_changed_entity.interfaces():
             if interface.properties_proactively_reported():
-                await async_send_changereport_message(
-                    hass, smart_home_config, alexa_changed_entity
-                )
+                properties = list(alexa_changed_entity.serialize_properties())
+                values = _property_values(properties)
+                if reported.get(changed_entity) == values:
+                    pending.pop(changed_entity, None)
+                    return
+                pending[changed_entity] = (alexa_changed_entity, properties, values)
+                if unsub_report is None:
+                    unsub_report = async_call_later(
+                        hass, REPORT_STATE_WINDOW, async_report_pending
+                    )
                 return
             if (
                 interface.name() == "Alexa.DoorbellEventSource"
@@ -58,16 +87,79 @@ async def async_enable_proactive_mode(hass, smart_home_config):
                 )
                 return
 
-    return hass.helpers.event.async_track_state_change(
+    async def async_report_pending(_now):
+        """Report the state changes collected since the last report."""
+        nonlocal unsub_report, retries
+        unsub_report = None
+        reports = pending.copy()
+        pending.clear()
+        for entity_id, (_, _, values) in reports.items():
+            reported[entity_id] = values
+
+        results = await asyncio.gather(
+            *(
+                async_send_changereport_message(
+                    hass, smart_home_config, alexa_entity, properties=properties
+                )
+                for alexa_entity, properties, _ in reports.values()
+            )
+        )
+        failed = {
+            entity_id: report
+            for (entity_id, report), delivered in zip(reports.items(), results)
+            if delivered is False
+        }
+        if not failed:
+            retries = 0
+            return
+
+        for entity_id, report in failed.items():
+            if reported.get(entity_id) is report[2]:
+                del reported[entity_id]
+            # Changes received since take precedence
+            pending.setdefault(entity_id, report)
+
+        if retries >= MAX_RETRIES:
+            _LOGGER.warning("Giving up reporting state after %d retries", retries)
+            retries = 0
+            pending.clear()
+            return
+
+        delay = RETRY_DELAY * 2 ** retries
+        retries += 1
+        if unsub_report is not None:
+            unsub_report()
+        unsub_report = async_call_later(hass, delay, async_report_pending)
+
+    unsub_listener = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
 
+    @callback
+    def unsub():
+        """Stop reporting state."""
+        unsub_listener()
+        if unsub_report is not None:
+            unsub_report()
+
+    return unsub
+
+
+def _property_values(properties):
+    """Return the values of serialized properties, without their sample time."""
+    return [
+        (prop["namespace"], prop.get("instance"), prop["name"], prop["value"])
+        for prop in properties
+    ]
+
 
 async def async_send_changereport_message(
-    hass, config, alexa_entity, *, invalidate_access_token=True
+    hass, config, alexa_entity, *, invalidate_access_token=True, properties=None
 ):
     """Send a ChangeReport message for an Alexa entity.
 
+    Return False if the report failed and can be retried.
+
     https://developer.amazon.com/docs/smarthome/state-reporting-for-a-smart-home-skill.html#report-state-with-changereport-events
     """
     token = await config.async_get_access_token()
@@ -79,7 +171,8 @@ async def async_send_changereport_message(
     # this sends all the properties of the Alexa Entity, whether they have
     # changed or not. this should be improved, and properties that have not
     # changed should be moved to the 'context' object
-    properties = list(alexa_entity.serialize_properties())
+    if properties is None:
+        properties = list(alexa_entity.serialize_properties())
 
     payload = {
         API_CHANGE: {"cause": {"type": Cause.APP_INTERACTION}, "properties": properties}
@@ -102,7 +195,7 @@ async def async_send_changereport_message(
 
     except (asyncio.TimeoutError, aiohttp.ClientError):
         _LOGGER.error("Timeout sending report to Alexa")
-        return
+        return False
 
     response_text = await response.text()
 
@@ -110,7 +203,11 @@ async def async_send_changereport_message(
     _LOGGER.debug("Received (%s): %s", response.status, response_text)
 
     if response.status == HTTP_ACCEPTED:
-        return
+        return True
+
+    if response.status == HTTP_TOO_MANY_REQUESTS or response.status >= 500:
+        _LOGGER.error("Error when sending ChangeReport to Alexa: %s", response.status)
+        return False
 
     response_json = json.loads(response_text)
 
@@ -120,7 +217,11 @@ async def async_send_changereport_message(
     ):
         config.async_invalidate_access_token()
         return await async_send_changereport_message(
-            hass, config, alexa_entity, invalidate_access_token=False
+            hass,
+            config,
+            alexa_entity,
+            invalidate_access_token=False,
+            properties=properties,
         )
 
     _LOGGER.error(
@@ -128,6 +229,7 @@ async def async_send_changereport_message(
         response_json["payload"]["code"],
         response_json["payload"]["description"],
     )
+    return True
 
 
 async def async_send_add_or_update_message(hass, config, entity_ids):
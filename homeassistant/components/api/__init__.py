@@ -2,8 +2,9 @@
 import asyncio
 import json
 import logging
+import secrets
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from aiohttp.web_exceptions import HTTPBadRequest
 import async_timeout
 import voluptuous as vol
@@ -17,6 +18,7 @@ from homeassistant.const import (
     HTTP_BAD_REQUEST,
     HTTP_CREATED,
     HTTP_NOT_FOUND,
+    HTTP_NOT_MODIFIED,
     HTTP_OK,
     MATCH_ALL,
     URL_API,
@@ -55,6 +57,16 @@ DOMAIN = "api"
 STREAM_PING_PAYLOAD = "ping"
 STREAM_PING_INTERVAL = 50  # seconds
 
+# Fields of a state that can be requested from the states view
+STATE_FIELDS = {
+    "entity_id",
+    "state",
+    "attributes",
+    "last_changed",
+    "last_updated",
+    "context",
+}
+
 
 def setup(hass, config):
     """Register the API with the HTTP interface."""
@@ -214,22 +226,84 @@ class APIDiscoveryView(HomeAssistantView):
 
 
 class APIStatesView(HomeAssistantView):
-    """View to handle States requests."""
+    """View to handle States requests.
+
+    The response can be limited with the entity_id and domain query
+    parameters, and the fields of each state with fields. The ETag is
+    derived from the change counter of the state machine, so a poll without
+    state changes is answered with 304 before any state is serialized.
+    """
 
     url = URL_API_STATES
     name = "api:states"
 
+    def __init__(self):
+        """Initialize the states view."""
+        # Distinguish ETags of this run from those handed out before a restart
+        self._etag_prefix = secrets.token_hex(4)
+
     @ha.callback
     def get(self, request):
         """Get current states."""
+        hass = request.app["hass"]
         user = request["hass_user"]
+        etag = f'"{self._etag_prefix}-{user.id}-{hass.states.change_count}"'
+        if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+            return web.Response(status=HTTP_NOT_MODIFIED, headers={hdrs.ETAG: etag})
+
+        query = request.query
+        entity_ids = _split_query(query, "entity_id", lower=True)
+        domains = _split_query(query, "domain", lower=True)
+        fields = _split_query(query, "fields")
+        if not all(
+            field in STATE_FIELDS or field.startswith("attributes.") for field in fields
+        ):
+            return self.json_message("Invalid fields specified.", HTTP_BAD_REQUEST)
+
+        if entity_ids:
+            states = [
+                state
+                for state in (hass.states.get(entity_id) for entity_id in entity_ids)
+                if state is not None
+            ]
+        else:
+            states = hass.states.async_all()
+        if domains:
+            domain_filter = set(domains)
+            states = [state for state in states if state.domain in domain_filter]
+
         entity_perm = user.permissions.check_entity
-        states = [
-            state
-            for state in request.app["hass"].states.async_all()
-            if entity_perm(state.entity_id, "read")
-        ]
-        return self.json(states)
+        states = [state for state in states if entity_perm(state.entity_id, "read")]
+        if fields:
+            states = [_project_state(state, fields) for state in states]
+        return self.json(states, headers={hdrs.ETAG: etag})
+
+
+def _split_query(query, key, lower=False):
+    """Return the comma separated values of a repeatable query parameter."""
+    values = {}
+    for param in query.getall(key, []):
+        for value in param.split(","):
+            value = value.strip()
+            if value:
+                values[value.lower() if lower else value] = None
+    return list(values)
+
+
+def _project_state(state, fields):
+    """Return the requested fields of a state, always with the entity_id."""
+    state_dict = state.as_dict()
+    result = {"entity_id": state.entity_id}
+    for field in fields:
+        if field in STATE_FIELDS:
+            result[field] = state_dict[field]
+        elif "attributes" not in fields:
+            attribute = field[len("attributes.") :]
+            if attribute in state.attributes:
+                result.setdefault("attributes", {})[attribute] = state.attributes[
+                    attribute
+                ]
+    return result
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -4,6 +4,8 @@ from typing import Any, Awaitable, Callable, List, Optional, Set, cast
 
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
+from homeassistant.components.homeassistant.triggers import state as state_trigger
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_NAME,
@@ -228,9 +230,22 @@ async def async_setup(hass, config):
         hass, DOMAIN, SERVICE_RELOAD, reload_service_handler, schema=vol.Schema({})
     )
 
+    hass.components.websocket_api.async_register_command(websocket_trigger_evaluations)
+
     return True
 
 
+@websocket_api.websocket_command(
+    {vol.Required("type"): "automation/trigger_evaluations"}
+)
+@callback
+def websocket_trigger_evaluations(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the number of state trigger evaluations of each automation."""
+    connection.send_result(msg["id"], state_trigger.async_get_trigger_evaluations(hass))
+
+
 class AutomationEntity(ToggleEntity, RestoreEntity):
     """Entity to show status of entity."""
 
@@ -495,6 +510,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
             self._name,
             log_cb,
             home_assistant_start,
+            entity_id=self.entity_id,
         )
 
     @property
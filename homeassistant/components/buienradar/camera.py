@@ -100,6 +100,11 @@ class BuienradarCam(Camera):
         """Return the component name."""
         return self._name
 
+    @property
+    def image_cache_ttl(self) -> float:
+        """Return 0 as the radar image is cached for the configured delta."""
+        return 0
+
     def __needs_refresh(self) -> bool:
         if not (self._delta and self._deadline and self._last_image):
             return True
@@ -8,6 +8,7 @@ import hashlib
 import logging
 import os
 from random import SystemRandom
+from typing import Optional
 
 from aiohttp import web
 import async_timeout
@@ -54,6 +55,8 @@ from homeassistant.helpers.network import get_url
 from homeassistant.loader import bind_hass
 
 from .const import DATA_CAMERA_PREFS, DOMAIN
+from .frame_broker import FRAME_BOUNDARY, FrameBroker, frame_image
+from .image_cache import CameraImageCache
 from .prefs import CameraPreferences
 
 # mypy: allow-untyped-calls, allow-untyped-defs
@@ -87,6 +90,7 @@ TOKEN_CHANGE_INTERVAL = timedelta(minutes=5)
 _RND = SystemRandom()
 
 MIN_STREAM_INTERVAL = 0.5  # seconds
+IMAGE_CACHE_TTL = 2  # seconds
 
 CAMERA_SERVICE_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTITY_ID): cv.comp_entity_ids})
 
@@ -114,6 +118,8 @@ SCHEMA_WS_CAMERA_THUMBNAIL = websocket_api.BASE_COMMAND_MESSAGE_SCHEMA.extend(
     {
         vol.Required("type"): WS_TYPE_CAMERA_THUMBNAIL,
         vol.Required("entity_id"): cv.entity_id,
+        vol.Optional("width"): cv.positive_int,
+        vol.Optional("height"): cv.positive_int,
     }
 )
 
@@ -186,21 +192,12 @@ async def async_get_still_stream(request, image_cb, content_type, interval):
     This method must be run in the event loop.
     """
     response = web.StreamResponse()
-    response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
+    response.content_type = CONTENT_TYPE_MULTIPART.format(FRAME_BOUNDARY)
     await response.prepare(request)
 
     async def write_to_mjpeg_stream(img_bytes):
         """Write image to stream."""
-        await response.write(
-            bytes(
-                "--frameboundary\r\n"
-                "Content-Type: {}\r\n"
-                "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
-                "utf-8",
-            )
-            + img_bytes
-            + b"\r\n"
-        )
+        await response.write(frame_image(content_type, img_bytes))
 
     last_image = None
 
@@ -327,6 +324,9 @@ async def async_unload_entry(hass, entry):
 class Camera(Entity):
     """The base class for camera entities."""
 
+    _frame_broker: Optional[FrameBroker] = None
+    _image_cache: Optional[CameraImageCache] = None
+
     def __init__(self):
         """Initialize a camera."""
         self.is_streaming = False
@@ -387,11 +387,32 @@ class Camera(Entity):
         """Return bytes of camera image."""
         return await self.hass.async_add_executor_job(self.camera_image)
 
+    @property
+    def image_cache_ttl(self):
+        """Return how many seconds a snapshot is served from the cache."""
+        return IMAGE_CACHE_TTL
+
+    async def async_cached_camera_image(self, width=None, height=None):
+        """Return a recent camera image, scaled down to fit width and height.
+
+        Only JPEG images are scaled down.
+        """
+        if self._image_cache is None:
+            self._image_cache = CameraImageCache(
+                self.hass, self.async_camera_image, self.image_cache_ttl
+            )
+        if self.content_type != DEFAULT_CONTENT_TYPE:
+            width = height = None
+        return await self._image_cache.async_get_image(width, height)
+
     async def handle_async_still_stream(self, request, interval):
-        """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
-        )
+        """Generate an HTTP MJPEG stream from camera images.
+
+        All viewers of the camera share the images fetched by one broker.
+        """
+        if self._frame_broker is None:
+            self._frame_broker = FrameBroker(self.async_camera_image, self.content_type)
+        return await self._frame_broker.async_stream(request, interval)
 
     async def handle_async_mjpeg_stream(self, request):
         """Serve an HTTP MJPEG stream from the camera.
@@ -513,10 +534,16 @@ class CameraImageView(CameraView):
     name = "api:camera:image"
 
     async def handle(self, request: web.Request, camera: Camera) -> web.Response:
-        """Serve camera image."""
+        """Serve camera image, scaled down if width or height is given."""
+        try:
+            width = _positive_int_query(request, "width")
+            height = _positive_int_query(request, "height")
+        except ValueError as err:
+            raise web.HTTPBadRequest() from err
+
         with suppress(asyncio.CancelledError, asyncio.TimeoutError):
             async with async_timeout.timeout(10):
-                image = await camera.async_camera_image()
+                image = await camera.async_cached_camera_image(width, height)
 
             if image:
                 return web.Response(body=image, content_type=camera.content_type)
@@ -524,6 +551,17 @@ class CameraImageView(CameraView):
         raise web.HTTPInternalServerError()
 
 
+def _positive_int_query(request, key):
+    """Return a positive integer query parameter or None if not given."""
+    value = request.query.get(key)
+    if value is None:
+        return None
+    value = int(value)
+    if value <= 0:
+        raise ValueError(f"{key} must be positive")
+    return value
+
+
 class CameraMjpegStream(CameraView):
     """Camera View to serve an MJPEG stream."""
 
@@ -554,12 +592,21 @@ async def websocket_camera_thumbnail(hass, connection, msg):
     """
     _LOGGER.warning("The websocket command 'camera_thumbnail' has been deprecated")
     try:
-        image = await async_get_image(hass, msg["entity_id"])
+        camera = _get_camera_from_entity_id(hass, msg["entity_id"])
+        image = None
+        with suppress(asyncio.CancelledError, asyncio.TimeoutError):
+            async with async_timeout.timeout(10):
+                image = await camera.async_cached_camera_image(
+                    msg.get("width"), msg.get("height")
+                )
+        if not image:
+            raise HomeAssistantError("Unable to get image")
+
         await connection.send_big_result(
             msg["id"],
             {
-                "content_type": image.content_type,
-                "content": base64.b64encode(image.content).decode("utf-8"),
+                "content_type": camera.content_type,
+                "content": base64.b64encode(image).decode("utf-8"),
             },
         )
     except HomeAssistantError:
@@ -0,0 +1,134 @@
+"""Share the still images of a camera between MJPEG viewers."""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Optional
+
+from aiohttp import web
+
+from homeassistant.const import CONTENT_TYPE_MULTIPART
+
+_LOGGER = logging.getLogger(__name__)
+
+FRAME_BOUNDARY = "--frameboundary"
+
+
+def frame_image(content_type: str, img_bytes: bytes) -> bytes:
+    """Wrap an image in a multipart frame."""
+    return (
+        bytes(
+            f"{FRAME_BOUNDARY}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(img_bytes)}\r\n\r\n",
+            "utf-8",
+        )
+        + img_bytes
+        + b"\r\n"
+    )
+
+
+class FrameBroker:
+    """Fetch camera images once and fan them out to all viewers.
+
+    The producer fetches at the shortest interval any viewer asked for and
+    keeps the latest framed image with a sequence number. Viewers always
+    write the latest frame, so a slow viewer skips frames instead of causing
+    more fetches.
+    """
+
+    def __init__(
+        self,
+        image_cb: Callable[[], Awaitable[Optional[bytes]]],
+        content_type: str,
+    ) -> None:
+        """Initialize the broker."""
+        self._image_cb = image_cb
+        self.content_type = content_type
+        self._viewers: Dict[object, float] = {}
+        self._producer: Optional[asyncio.Task] = None
+        self._new_frame = asyncio.Event()
+        self._ended = False
+        self.sequence = 0
+        self.frame: Optional[bytes] = None
+        self.fetches = 0
+
+    @property
+    def viewers(self) -> int:
+        """Return the number of connected viewers."""
+        return len(self._viewers)
+
+    async def async_stream(self, request: web.Request, interval: float) -> web.Response:
+        """Serve the shared frames as an HTTP MJPEG stream."""
+        response = web.StreamResponse()
+        response.content_type = CONTENT_TYPE_MULTIPART.format(FRAME_BOUNDARY)
+        await response.prepare(request)
+        await self.async_view(response.write, interval)
+        return response
+
+    async def async_view(
+        self, write: Callable[[bytes], Awaitable[None]], interval: float
+    ) -> None:
+        """Write frames until the camera stops returning images."""
+        viewer = object()
+        self._viewers[viewer] = interval
+        if self._producer is None:
+            self._ended = False
+            self.frame = None
+            self._producer = asyncio.create_task(self._async_produce())
+
+        last_sequence = None
+        try:
+            while True:
+                new_frame = self._new_frame
+                if self.frame is None or self.sequence == last_sequence:
+                    if self._ended:
+                        break
+                    await new_frame.wait()
+                    continue
+
+                sequence, frame = self.sequence, self.frame
+                await write(frame)
+                # Chrome seems to always ignore first picture,
+                # print it twice.
+                if last_sequence is None:
+                    await write(frame)
+                last_sequence = sequence
+                await asyncio.sleep(interval)
+        finally:
+            del self._viewers[viewer]
+            if not self._viewers and self._producer is not None:
+                self._producer.cancel()
+                self._producer = None
+
+    async def _async_produce(self) -> None:
+        """Fetch images while there are viewers."""
+        last_image = None
+        try:
+            while True:
+                img_bytes = await self._image_cb()
+                self.fetches += 1
+                if not img_bytes:
+                    break
+
+                if img_bytes != last_image:
+                    last_image = img_bytes
+                    self.frame = frame_image(self.content_type, img_bytes)
+                    self.sequence += 1
+                    self._notify()
+
+                await asyncio.sleep(min(self._viewers.values()))
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error fetching camera image for stream")
+
+        # A new viewer may have started another producer meanwhile
+        if self._producer is not asyncio.current_task():
+            return
+        self._ended = True
+        self._producer = None
+        self._notify()
+
+    def _notify(self) -> None:
+        """Wake up the viewers waiting for a frame."""
+        self._new_frame.set()
+        self._new_frame = asyncio.Event()
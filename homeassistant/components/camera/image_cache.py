@@ -0,0 +1,100 @@
+"""Cache recent camera snapshots and their scaled down variants."""
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.util.executor import EXECUTOR_CPU
+
+_LOGGER = logging.getLogger(__name__)
+
+# Maximum number of scaled down variants kept per snapshot
+MAX_VARIANTS = 8
+
+
+def _scale_image(image: bytes, width: Optional[int], height: Optional[int]) -> bytes:
+    """Scale down a JPEG image, return it unchanged if it can't be scaled."""
+    try:
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.util.pil import scale_jpeg_image
+    except ImportError:
+        return image
+
+    try:
+        return scale_jpeg_image(image, width, height)
+    except OSError as err:
+        # Includes the images pillow can't identify or decode
+        _LOGGER.debug("Unable to scale camera image: %s", err)
+        return image
+
+
+class CameraImageCache:
+    """Keep the last snapshot of a camera for a short time.
+
+    Concurrent requests for a snapshot share a single fetch from the camera.
+    Scaled down variants are rendered in the CPU executor and kept until the
+    next snapshot is fetched.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistantType,
+        image_cb: Callable[[], Awaitable[Optional[bytes]]],
+        ttl: float,
+    ) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._image_cb = image_cb
+        self.ttl = ttl
+        self._image: Optional[bytes] = None
+        self._fetched_at = 0.0
+        self._fetch: Optional[asyncio.Task] = None
+        self._variants: Dict[Tuple[Optional[int], Optional[int]], bytes] = {}
+        self.fetches = 0
+
+    async def async_get_image(
+        self, width: Optional[int] = None, height: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Return a recent snapshot, scaled down to fit width and height."""
+        image = await self._async_get_snapshot()
+        if not image or (width is None and height is None):
+            return image
+
+        key = (width, height)
+        scaled = self._variants.get(key)
+        if scaled is not None:
+            return scaled
+
+        scaled = await self._hass.async_add_executor_partition_job(
+            EXECUTOR_CPU, _scale_image, image, width, height
+        )
+        # Only keep the variant if no newer snapshot arrived while scaling
+        if image is self._image:
+            if len(self._variants) >= MAX_VARIANTS:
+                self._variants.clear()
+            self._variants[key] = scaled
+        return scaled
+
+    async def _async_get_snapshot(self) -> Optional[bytes]:
+        """Return the cached snapshot or join a fetch of a new one."""
+        if self._image is not None and time.monotonic() - self._fetched_at < self.ttl:
+            return self._image
+
+        if self._fetch is None:
+            self._fetch = self._hass.async_create_task(self._async_fetch())
+        return await asyncio.shield(self._fetch)
+
+    async def _async_fetch(self) -> Optional[bytes]:
+        """Fetch a snapshot from the camera."""
+        try:
+            image = await self._image_cb()
+        finally:
+            self._fetch = None
+        self.fetches += 1
+
+        if image:
+            self._image = image
+            self._fetched_at = time.monotonic()
+            self._variants = {}
+        return image
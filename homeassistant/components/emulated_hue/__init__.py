@@ -139,6 +139,9 @@ async def async_setup(hass, yaml_config):
         nonlocal site
         nonlocal runner
 
+        if config.state_cache is not None:
+            config.state_cache.async_stop()
+            config.state_cache = None
         if protocol:
             protocol.close()
         if site:
@@ -186,6 +189,7 @@ class Config:
         self.type = conf.get(CONF_TYPE)
         self.numbers = None
         self.cached_states = {}
+        self.state_cache = None
         self._exposed_cache = {}
 
         if self.type == TYPE_ALEXA:
@@ -1,5 +1,6 @@
 """Support for a Hue API to control Home Assistant."""
 import asyncio
+from collections import deque
 import hashlib
 from ipaddress import ip_address
 import logging
@@ -55,6 +56,7 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_SUPPORTED_FEATURES,
     ATTR_TEMPERATURE,
+    EVENT_STATE_CHANGED,
     HTTP_BAD_REQUEST,
     HTTP_NOT_FOUND,
     HTTP_UNAUTHORIZED,
@@ -76,6 +78,8 @@ _LOGGER = logging.getLogger(__name__)
 STATE_CHANGE_WAIT_TIMEOUT = 5.0
 # How long an entry state's cache will be valid for in seconds.
 STATE_CACHED_TIMEOUT = 2.0
+# Seconds of requests the request rates are calculated over
+REQUEST_RATE_WINDOW = 60
 
 STATE_BRIGHTNESS = "bri"
 STATE_COLORMODE = "colormode"
@@ -212,7 +216,9 @@ class HueAllLightsStateView(HomeAssistantView):
         if not is_local(ip_address(request.remote)):
             return self.json_message("Only local IPs allowed", HTTP_UNAUTHORIZED)
 
-        return self.json(create_list_of_entities(self.config, request))
+        state_cache = get_state_cache(self.config, request.app["hass"])
+        state_cache.record_request(self.name)
+        return self.json(state_cache.lights())
 
 
 class HueFullStateView(HomeAssistantView):
@@ -234,8 +240,10 @@ class HueFullStateView(HomeAssistantView):
         if username != HUE_API_USERNAME:
             return self.json(UNAUTHORIZED_USER)
 
+        state_cache = get_state_cache(self.config, request.app["hass"])
+        state_cache.record_request(self.name)
         json_response = {
-            "lights": create_list_of_entities(self.config, request),
+            "lights": state_cache.lights(),
             "config": create_config_model(self.config, request),
         }
 
@@ -283,6 +291,8 @@ class HueOneLightStateView(HomeAssistantView):
             return self.json_message("Only local IPs allowed", HTTP_UNAUTHORIZED)
 
         hass = request.app["hass"]
+        state_cache = get_state_cache(self.config, hass)
+        state_cache.record_request(self.name)
         hass_entity_id = self.config.number_to_entity_id(entity_id)
 
         if hass_entity_id is None:
@@ -302,7 +312,7 @@ class HueOneLightStateView(HomeAssistantView):
             _LOGGER.error("Entity not exposed: %s", entity_id)
             return self.json_message("Entity not exposed", HTTP_UNAUTHORIZED)
 
-        json_response = entity_to_json(self.config, entity)
+        json_response = state_cache.entity_json(entity)
 
         return self.json(json_response)
 
@@ -576,6 +586,131 @@ class HueOneLightChangeView(HomeAssistantView):
         return self.json(json_response)
 
 
+class HueStateCache:
+    """Hue JSON of the exposed entities, kept up to date by state changes.
+
+    The JSON of each exposed entity and the list of all lights are built on
+    first request and invalidated when an exposed entity changes state, so
+    polling the bridge usually costs a lookup. Entities with a state cached
+    after a command are converted on each request until that state expires.
+    """
+
+    def __init__(self, hass, config):
+        """Initialize the cache."""
+        self.hass = hass
+        self.config = config
+        self.hits = 0
+        self.misses = 0
+        self._entities = {}
+        self._lights = None
+        # Entities whose JSON in the lights list is from a cached state
+        self._overridden = set()
+        self._request_counts = {}
+        self._request_times = {}
+        self._unsub_state_changed = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed
+        )
+
+    @core.callback
+    def async_stop(self):
+        """Stop following state changes."""
+        if self._unsub_state_changed is not None:
+            self._unsub_state_changed()
+            self._unsub_state_changed = None
+
+    @core.callback
+    def _async_state_changed(self, event):
+        """Invalidate the lights list when an exposed entity changes."""
+        if event.data.get("new_state") is None:
+            self._entities.pop(event.data["entity_id"], None)
+        for state in (event.data.get("old_state"), event.data.get("new_state")):
+            if state is not None and self.config.is_entity_exposed(state):
+                self._lights = None
+                return
+
+    def record_request(self, view):
+        """Record a request to a view."""
+        now = time.monotonic()
+        self._request_counts[view] = self._request_counts.get(view, 0) + 1
+        times = self._request_times.setdefault(view, deque())
+        times.append(now)
+        while times[0] <= now - REQUEST_RATE_WINDOW:
+            times.popleft()
+
+    @property
+    def stats(self):
+        """Return the cache hits and misses and the requests per view."""
+        start = time.monotonic() - REQUEST_RATE_WINDOW
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "requests": {
+                view: {
+                    "count": count,
+                    "rate": sum(
+                        1 for req_time in self._request_times[view] if req_time > start
+                    )
+                    / REQUEST_RATE_WINDOW,
+                }
+                for view, count in self._request_counts.items()
+            },
+        }
+
+    def entity_json(self, entity):
+        """Return the Hue JSON of an entity."""
+        entity_id = entity.entity_id
+        if entity_id in self.config.cached_states:
+            data = entity_to_json(self.config, entity)
+            if entity_id in self.config.cached_states:
+                self._overridden.add(entity_id)
+                return data
+            # The cached state expired, data is from the entity state
+        else:
+            cached = self._entities.get(entity_id)
+            if cached is not None and cached[0] is entity:
+                return cached[1]
+            data = entity_to_json(self.config, entity)
+
+        self._entities[entity_id] = (entity, data)
+        return data
+
+    def lights(self):
+        """Return the Hue JSON of all exposed entities by their number."""
+        config = self.config
+        lights = self._lights
+        if lights is None:
+            self.misses += 1
+            lights = self._lights = {}
+            for entity in config.filter_exposed_entities(self.hass.states.async_all()):
+                number = config.entity_id_to_number(entity.entity_id)
+                lights[number] = self.entity_json(entity)
+        else:
+            self.hits += 1
+
+        if not self._overridden and not config.cached_states:
+            return lights
+
+        entity_ids = self._overridden.union(config.cached_states)
+        self._overridden = set()
+        response = dict(lights)
+        for entity_id in entity_ids:
+            entity = self.hass.states.get(entity_id)
+            if entity is None or not config.is_entity_exposed(entity):
+                continue
+            number = config.entity_id_to_number(entity_id)
+            response[number] = self.entity_json(entity)
+            if entity_id not in self._overridden:
+                lights[number] = response[number]
+        return response
+
+
+def get_state_cache(config, hass):
+    """Return the state cache of a bridge, create it on first use."""
+    if config.state_cache is None:
+        config.state_cache = HueStateCache(hass, config)
+    return config.state_cache
+
+
 def get_entity_state(config, entity):
     """Retrieve and convert state and brightness values for an entity."""
     cached_state_entry = config.cached_states.get(entity.entity_id, None)
@@ -809,18 +944,6 @@ def create_config_model(config, request):
     }
 
 
-def create_list_of_entities(config, request):
-    """Create a list of all entities."""
-    hass = request.app["hass"]
-    json_response = {}
-
-    for entity in config.filter_exposed_entities(hass.states.async_all()):
-        number = config.entity_id_to_number(entity.entity_id)
-        json_response[number] = entity_to_json(config, entity)
-
-    return json_response
-
-
 def hue_brightness_to_hass(value):
     """Convert hue brightness 1..254 to hass format 0..255."""
     return min(255, round((value / HUE_API_STATE_BRI_MAX) * 255))
@@ -113,16 +113,22 @@ class AbstractConfig(ABC):
         return True
 
     async def async_report_state(self, message, agent_user_id: str):
-        """Send a state report to Google."""
+        """Send a state report to Google.
+
+        Return the HTTP status of the report, or None if not known.
+        """
         raise NotImplementedError
 
     async def async_report_state_all(self, message):
-        """Send a state report to Google for all previously synced users."""
+        """Send a state report to Google for all previously synced users.
+
+        Return the result of the report to each user.
+        """
         jobs = [
             self.async_report_state(message, agent_user_id)
             for agent_user_id in self._store.agent_user_ids
         ]
-        await gather(*jobs)
+        return await gather(*jobs)
 
     @callback
     def async_enable_report_state(self):
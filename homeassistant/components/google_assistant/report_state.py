@@ -1,7 +1,7 @@
 """Google Report State implementation."""
 import logging
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import HTTP_TOO_MANY_REQUESTS, MATCH_ALL
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 
@@ -12,15 +12,37 @@ from .helpers import AbstractConfig, GoogleEntity, async_get_entities
 # https://github.com/actions-on-google/smart-home-nodejs/issues/196#issuecomment-439156639
 INITIAL_REPORT_DELAY = 60
 
+# Seconds state changes are collected to be reported together
+REPORT_STATE_WINDOW = 1
+# Delay of the first retry of a failed report, doubled for each next retry
+RETRY_DELAY = 5
+MAX_RETRIES = 5
+
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _should_retry(status) -> bool:
+    """Return if a report answered with a status should be retried."""
+    return status is not None and (status == HTTP_TOO_MANY_REQUESTS or status >= 500)
+
+
 @callback
 def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig):
-    """Enable state reporting."""
-
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
+    """Enable state reporting.
+
+    State changes within REPORT_STATE_WINDOW are reported together, only
+    including entities whose serialized state differs from the one last
+    reported. Reports failing with a server error are retried with backoff.
+    """
+    pending = {}
+    reported = {}
+    unsub_report = None
+    retries = 0
+
+    @callback
+    def async_entity_state_listener(changed_entity, old_state, new_state):
+        nonlocal unsub_report
         if not hass.is_running:
             return
 
@@ -41,18 +63,51 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             _LOGGER.debug("Not reporting state for %s: %s", changed_entity, err.code)
             return
 
-        if old_state:
-            old_entity = GoogleEntity(hass, google_config, old_state)
+        # Only report to Google if data that Google cares about has changed
+        if reported.get(changed_entity) == entity_data:
+            pending.pop(changed_entity, None)
+            return
 
-            # Only report to Google if data that Google cares about has changed
-            if entity_data == old_entity.query_serialize():
-                return
+        pending[changed_entity] = entity_data
+        if unsub_report is None:
+            unsub_report = async_call_later(
+                hass, REPORT_STATE_WINDOW, async_report_pending
+            )
+
+    async def async_report_pending(_now):
+        """Report the state changes collected since the last report."""
+        nonlocal unsub_report, retries
+        unsub_report = None
+        states = pending.copy()
+        pending.clear()
+        reported.update(states)
+
+        _LOGGER.debug("Reporting state for %s", states)
+        statuses = await google_config.async_report_state_all(
+            {"devices": {"states": states}}
+        )
+        if not any(_should_retry(status) for status in statuses or ()):
+            retries = 0
+            return
 
-        _LOGGER.debug("Reporting state for %s: %s", changed_entity, entity_data)
+        for entity_id, entity_data in states.items():
+            if reported.get(entity_id) is entity_data:
+                del reported[entity_id]
+            # Changes received since take precedence
+            pending.setdefault(entity_id, entity_data)
 
-        await google_config.async_report_state_all(
-            {"devices": {"states": {changed_entity: entity_data}}}
-        )
+        if retries >= MAX_RETRIES:
+            _LOGGER.warning("Giving up reporting state after %d retries", retries)
+            retries = 0
+            pending.clear()
+            return
+
+        delay = RETRY_DELAY * 2 ** retries
+        retries += 1
+        _LOGGER.debug("Reporting state failed, retrying in %s seconds", delay)
+        if unsub_report is not None:
+            unsub_report()
+        unsub_report = async_call_later(hass, delay, async_report_pending)
 
     async def inital_report(_now):
         """Report initially all states."""
@@ -70,10 +125,20 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
         if not entities:
             return
 
+        reported.update(entities)
         await google_config.async_report_state_all({"devices": {"states": entities}})
 
-    async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
-
-    return hass.helpers.event.async_track_state_change(
+    unsub_initial = async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
+    unsub_listener = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
+
+    @callback
+    def unsub():
+        """Stop reporting state."""
+        unsub_listener()
+        unsub_initial()
+        if unsub_report is not None:
+            unsub_report()
+
+    return unsub
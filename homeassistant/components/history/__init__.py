@@ -34,6 +34,7 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.executor import EXECUTOR_DB_READ
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
@@ -504,7 +505,8 @@ class HistoryPeriodView(HomeAssistantView):
 
         return cast(
             web.Response,
-            await hass.async_add_executor_job(
+            await hass.async_add_executor_partition_job(
+                EXECUTOR_DB_READ,
                 self._sorted_significant_states_json,
                 hass,
                 start_time,
@@ -59,6 +59,13 @@ TRIGGER_SCHEMA = vol.All(
 _LOGGER = logging.getLogger(__name__)
 
 
+def _watched_value(state, attribute):
+    """Return the value of a state a trigger watches."""
+    if attribute is None:
+        return state.state
+    return state.attributes.get(attribute)
+
+
 async def async_attach_trigger(
     hass, config, action, automation_info, *, platform_type="numeric_state"
 ) -> CALLBACK_TYPE:
@@ -78,12 +85,19 @@ async def async_attach_trigger(
     if value_template is not None:
         value_template.hass = hass
 
+    check = condition.async_numeric_state_checker(
+        below, above, value_template, attribute
+    )
+
     @callback
     def check_numeric_state(entity, from_s, to_s):
         """Return True if criteria are now met."""
         if to_s is None:
             return False
 
+        if value_template is None:
+            return check(hass, to_s, None)
+
         variables = {
             "trigger": {
                 "platform": "numeric_state",
@@ -93,9 +107,7 @@ async def async_attach_trigger(
                 "attribute": attribute,
             }
         }
-        return condition.async_numeric_state(
-            hass, to_s, below, above, value_template, variables, attribute
-        )
+        return check(hass, to_s, variables)
 
     @callback
     def state_automation_listener(event):
@@ -124,6 +136,16 @@ async def async_attach_trigger(
                 to_s.context,
             )
 
+        # The criteria are only met again after the value crossed the
+        # limits, so changes leaving the watched value unchanged are ignored
+        if (
+            value_template is None
+            and from_s is not None
+            and to_s is not None
+            and _watched_value(from_s, attribute) == _watched_value(to_s, attribute)
+        ):
+            return
+
         matching = check_numeric_state(entity, from_s, to_s)
 
         if not matching:
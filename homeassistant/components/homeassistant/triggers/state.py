@@ -1,7 +1,10 @@
 """Offer state listening automation rules."""
-from datetime import timedelta
+from datetime import datetime, timedelta
+import heapq
+import itertools
 import logging
-from typing import Any, Dict, Optional
+import math
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import voluptuous as vol
 
@@ -11,10 +14,11 @@ from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, State, cal
 from homeassistant.helpers import config_validation as cv, template
 from homeassistant.helpers.event import (
     Event,
-    async_track_same_state,
+    async_track_point_in_utc_time,
     async_track_state_change_event,
     process_state_match,
 )
+import homeassistant.util.dt as dt_util
 
 # mypy: allow-incomplete-defs, allow-untyped-calls, allow-untyped-defs
 # mypy: no-check-untyped-defs
@@ -25,6 +29,10 @@ CONF_ENTITY_ID = "entity_id"
 CONF_FROM = "from"
 CONF_TO = "to"
 
+DATA_STATE_TRIGGER_INDEX = "state_trigger_index"
+# Seconds between the ticks the timers of `for` are rounded up to
+TIMER_TICK = 1
+
 BASE_SCHEMA = {
     vol.Required(CONF_PLATFORM): "state",
     vol.Required(CONF_ENTITY_ID): cv.entity_ids,
@@ -63,135 +71,434 @@ def TRIGGER_SCHEMA(value: Any) -> dict:  # pylint: disable=invalid-name
     return TRIGGER_STATE_SCHEMA(value)
 
 
-async def async_attach_trigger(
-    hass: HomeAssistant,
-    config,
-    action,
-    automation_info,
-    *,
-    platform_type: str = "state",
-) -> CALLBACK_TYPE:
-    """Listen for state changes based on configuration."""
-    entity_id = config.get(CONF_ENTITY_ID)
-    from_state = config.get(CONF_FROM, MATCH_ALL)
-    to_state = config.get(CONF_TO, MATCH_ALL)
-    time_delta = config.get(CONF_FOR)
-    template.attach(hass, time_delta)
-    match_all = from_state == MATCH_ALL and to_state == MATCH_ALL
-    unsub_track_same = {}
-    period: Dict[str, timedelta] = {}
-    match_from_state = process_state_match(from_state)
-    match_to_state = process_state_match(to_state)
-    attribute = config.get(CONF_ATTRIBUTE)
-    job = HassJob(action)
+class _TimerWheel:
+    """Timers bucketed in ticks and driven by one scheduled callback.
+
+    Due times are rounded up to the next tick, so the timers due in the same
+    tick fire together, at most a tick late and never early. Only the
+    earliest tick with timers is scheduled on the event loop.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the timers."""
+        self.hass = hass
+        self._slots: Dict[datetime, Dict[int, Callable[[], None]]] = {}
+        self._ticks: List[datetime] = []
+        self._next: Optional[datetime] = None
+        self._unsub: Optional[CALLBACK_TYPE] = None
+        self._ids = itertools.count()
 
     @callback
-    def state_automation_listener(event: Event):
-        """Listen for state changes and calls action."""
-        entity: str = event.data["entity_id"]
-        from_s: Optional[State] = event.data.get("old_state")
-        to_s: Optional[State] = event.data.get("new_state")
+    def async_schedule(
+        self, due: datetime, action: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Call an action at a point in time, return a callback cancelling it."""
+        tick = dt_util.utc_from_timestamp(
+            math.ceil(due.timestamp() / TIMER_TICK) * TIMER_TICK
+        )
+        slot = self._slots.get(tick)
+        if slot is None:
+            slot = self._slots[tick] = {}
+            heapq.heappush(self._ticks, tick)
+            if self._next is None or tick < self._next:
+                self._async_arm(tick)
+        timer_id = next(self._ids)
+        slot[timer_id] = action
 
-        if from_s is None:
-            old_value = None
-        elif attribute is None:
-            old_value = from_s.state
-        else:
-            old_value = from_s.attributes.get(attribute)
+        @callback
+        def async_cancel() -> None:
+            """Cancel the timer."""
+            slot = self._slots.get(tick)
+            if slot is None or slot.pop(timer_id, None) is None:
+                return
+            if slot:
+                return
+            del self._slots[tick]
+            if not self._slots and self._unsub is not None:
+                self._unsub()
+                self._unsub = self._next = None
+                self._ticks.clear()
+
+        return async_cancel
+
+    @callback
+    def _async_arm(self, tick: datetime) -> None:
+        """Schedule the callback for the earliest tick with timers."""
+        if self._unsub is not None:
+            self._unsub()
+        self._next = tick
+        self._unsub = async_track_point_in_utc_time(self.hass, self._async_fire, tick)
 
-        if to_s is None:
-            new_value = None
-        elif attribute is None:
-            new_value = to_s.state
+    @callback
+    def _async_fire(self, now: datetime) -> None:
+        """Call the actions of the timers due."""
+        self._unsub = self._next = None
+        while self._ticks and self._ticks[0] <= now:
+            slot = self._slots.pop(heapq.heappop(self._ticks), None)
+            if slot is None:
+                continue
+            for action in slot.values():
+                action()
+
+        # Skip the ticks whose timers were all cancelled
+        while self._ticks and self._ticks[0] not in self._slots:
+            heapq.heappop(self._ticks)
+        if self._ticks and self._ticks[0] != self._next:
+            self._async_arm(self._ticks[0])
+
+
+class _StateTrigger:
+    """A state trigger compiled to the values it matches."""
+
+    def __init__(
+        self,
+        index: "StateTriggerIndex",
+        config: Dict[str, Any],
+        action: Callable,
+        automation_info: Optional[Dict[str, Any]],
+        platform_type: str,
+    ) -> None:
+        """Compile the trigger."""
+        self.index = index
+        self.sequence = next(index.sequence)
+        self.name = automation_info.get("name") if automation_info else None
+        # Evaluations are counted per automation, or per domain for triggers
+        # attached without an entity like the wait_for_trigger of scripts
+        self.owner = (
+            automation_info.get("entity_id") or automation_info.get("domain")
+            if automation_info
+            else None
+        )
+        self.entity_ids = list(
+            dict.fromkeys(entity_id.lower() for entity_id in config[CONF_ENTITY_ID])
+        )
+        self.attribute = config.get(CONF_ATTRIBUTE)
+        self.from_state = config.get(CONF_FROM, MATCH_ALL)
+        self.to_state = config.get(CONF_TO, MATCH_ALL)
+        self.match_all = self.from_state == MATCH_ALL and self.to_state == MATCH_ALL
+        self.match_from_state = process_state_match(self.from_state)
+        self.match_to_state = process_state_match(self.to_state)
+        # A trigger with only `from` waits for the value to stay away from it
+        self.for_leaves_from = CONF_FROM in config and CONF_TO not in config
+        self.time_delta = config.get(CONF_FOR)
+        self.job = HassJob(action)
+        self.platform_type = platform_type
+        # Values a trigger waits on for `for` and the timer of each entity
+        self.waiting: Dict[str, Tuple[Any, Any, CALLBACK_TYPE]] = {}
+
+    @property
+    def to_values(self) -> Optional[List[Any]]:
+        """Return the values the trigger matches, None if it matches any."""
+        if self.to_state is None or self.to_state == MATCH_ALL:
+            return None
+        if isinstance(self.to_state, str) or not hasattr(self.to_state, "__iter__"):
+            values = [self.to_state]
         else:
-            new_value = to_s.attributes.get(attribute)
+            values = list(self.to_state)
+        try:
+            return list(dict.fromkeys(values))
+        except TypeError:
+            return None
+
+    def matches(self, old_value: Any, new_value: Any) -> bool:
+        """Return if a change of the watched value fires the trigger."""
+        return (
+            self.match_from_state(old_value)
+            and self.match_to_state(new_value)
+            and (self.match_all or old_value != new_value)
+        )
+
+    def is_same(self, old_value: Any, new_value: Any, cur_value: Any) -> bool:
+        """Return if the value is still the one waited on for `for`."""
+        if self.for_leaves_from:
+            return bool(cur_value != old_value)
+        return bool(cur_value == new_value)
+
+
+class _AttributeTriggers:
+    """Triggers watching the same value of an entity, by the value they match."""
+
+    __slots__ = ("by_value", "any_value")
 
-        # When we listen for state changes with `match_all`, we
-        # will trigger even if just an attribute changes. When
-        # we listen to just an attribute, we should ignore all
-        # other attribute changes.
-        if attribute is not None and old_value == new_value:
+    def __init__(self) -> None:
+        """Initialize the triggers."""
+        self.by_value: Dict[Any, List[_StateTrigger]] = {}
+        self.any_value: List[_StateTrigger] = []
+
+    def __bool__(self) -> bool:
+        """Return if there are triggers."""
+        return bool(self.by_value or self.any_value)
+
+    def add(self, trigger: _StateTrigger) -> None:
+        """Add a trigger."""
+        values = trigger.to_values
+        if values is None:
+            self.any_value.append(trigger)
             return
+        for value in values:
+            self.by_value.setdefault(value, []).append(trigger)
 
-        if (
-            not match_from_state(old_value)
-            or not match_to_state(new_value)
-            or (not match_all and old_value == new_value)
-        ):
+    def remove(self, trigger: _StateTrigger) -> None:
+        """Remove a trigger."""
+        values = trigger.to_values
+        if values is None:
+            self.any_value.remove(trigger)
             return
+        for value in values:
+            triggers = self.by_value[value]
+            triggers.remove(trigger)
+            if not triggers:
+                del self.by_value[value]
+
+    def candidates(self, new_value: Any) -> List[_StateTrigger]:
+        """Return the triggers which may match a new value."""
+        try:
+            triggers = self.by_value.get(new_value)
+        except TypeError:
+            return [
+                *self.any_value,
+                *(
+                    trigger
+                    for triggers in self.by_value.values()
+                    for trigger in triggers
+                ),
+            ]
+        if triggers is None:
+            return self.any_value
+        return [*self.any_value, *triggers]
+
+
+def _watched_value(state: Optional[State], attribute: Optional[str]) -> Any:
+    """Return the value of a state a trigger watches."""
+    if state is None:
+        return None
+    if attribute is None:
+        return state.state
+    return state.attributes.get(attribute)
+
+
+class StateTriggerIndex:
+    """State triggers grouped by entity and watched attribute.
+
+    The changes of an entity are dispatched once for all its triggers. The
+    watched values are read once per attribute and only the triggers matching
+    the new value are evaluated. Triggers waiting for a value to stay for a
+    duration are checked in the same pass, and their timers share one
+    scheduled callback per due time.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self.sequence = itertools.count()
+        self.evaluations: Dict[str, int] = {}
+        self.timers = _TimerWheel(hass)
+        self._entities: Dict[str, Dict[Optional[str], _AttributeTriggers]] = {}
+        self._waiting: Dict[str, Dict[_StateTrigger, None]] = {}
+        self._unsubs: Dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def async_add(self, trigger: _StateTrigger) -> CALLBACK_TYPE:
+        """Add a trigger, return a callback removing it."""
+        for entity_id in trigger.entity_ids:
+            groups = self._entities.get(entity_id)
+            if groups is None:
+                groups = self._entities[entity_id] = {}
+                self._unsubs[entity_id] = async_track_state_change_event(
+                    self.hass, entity_id, self._async_state_changed
+                )
+            group = groups.get(trigger.attribute)
+            if group is None:
+                group = groups[trigger.attribute] = _AttributeTriggers()
+            group.add(trigger)
 
         @callback
-        def call_action():
-            """Call action with right context."""
-            hass.async_run_hass_job(
-                job,
-                {
-                    "trigger": {
-                        "platform": platform_type,
-                        "entity_id": entity,
-                        "from_state": from_s,
-                        "to_state": to_s,
-                        "for": time_delta if not time_delta else period[entity],
-                        "attribute": attribute,
-                        "description": f"state of {entity}",
-                    }
-                },
-                event.context,
-            )
+        def async_remove() -> None:
+            """Remove the trigger and cancel its timers."""
+            for entity_id in list(trigger.waiting):
+                self._async_stop_waiting(trigger, entity_id)
+            for entity_id in trigger.entity_ids:
+                groups = self._entities[entity_id]
+                group = groups[trigger.attribute]
+                group.remove(trigger)
+                if group:
+                    continue
+                del groups[trigger.attribute]
+                if not groups:
+                    del self._entities[entity_id]
+                    self._unsubs.pop(entity_id)()
 
-        if not time_delta:
-            call_action()
+        return async_remove
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Dispatch a state change to the triggers of the entity."""
+        entity_id: str = event.data["entity_id"]
+        groups = self._entities.get(entity_id)
+        if groups is None:
             return
+        from_s: Optional[State] = event.data.get("old_state")
+        to_s: Optional[State] = event.data.get("new_state")
+
+        waiting = self._waiting.get(entity_id)
+        if waiting:
+            for trigger in list(waiting):
+                old_value, new_value, _ = trigger.waiting[entity_id]
+                cur_value = (
+                    None if to_s is None else _watched_value(to_s, trigger.attribute)
+                )
+                if to_s is None or not trigger.is_same(old_value, new_value, cur_value):
+                    self._async_stop_waiting(trigger, entity_id)
+
+        fired = []
+        for attribute, group in groups.items():
+            old_value = _watched_value(from_s, attribute)
+            new_value = _watched_value(to_s, attribute)
+
+            # When we listen for state changes with `match_all`, we
+            # will trigger even if just an attribute changes. When
+            # we listen to just an attribute, we should ignore all
+            # other attribute changes.
+            if old_value == new_value:
+                if attribute is not None:
+                    continue
+                candidates = [
+                    trigger for trigger in group.any_value if trigger.match_all
+                ]
+            else:
+                candidates = group.candidates(new_value)
+
+            for trigger in candidates:
+                if trigger.owner is not None:
+                    self.evaluations[trigger.owner] = (
+                        self.evaluations.get(trigger.owner, 0) + 1
+                    )
+                if trigger.matches(old_value, new_value):
+                    fired.append((trigger, old_value, new_value))
 
+        if len(fired) > 1:
+            fired.sort(key=lambda item: item[0].sequence)
+        now = None
+        for trigger, old_value, new_value in fired:
+            if not trigger.time_delta:
+                self._async_call_action(trigger, entity_id, from_s, to_s, event)
+                continue
+            if now is None:
+                now = dt_util.utcnow()
+            self._async_start_waiting(
+                trigger, entity_id, from_s, to_s, old_value, new_value, event, now
+            )
+
+    @callback
+    def _async_start_waiting(
+        self,
+        trigger: _StateTrigger,
+        entity_id: str,
+        from_s: Optional[State],
+        to_s: Optional[State],
+        old_value: Any,
+        new_value: Any,
+        event: Event,
+        now: datetime,
+    ) -> None:
+        """Wait for a value to stay for the duration of a trigger."""
         variables = {
             "trigger": {
                 "platform": "state",
-                "entity_id": entity,
+                "entity_id": entity_id,
                 "from_state": from_s,
                 "to_state": to_s,
             }
         }
 
         try:
-            period[entity] = cv.positive_time_period(
-                template.render_complex(time_delta, variables)
+            period = cv.positive_time_period(
+                template.render_complex(trigger.time_delta, variables)
             )
         except (exceptions.TemplateError, vol.Invalid) as ex:
-            _LOGGER.error(
-                "Error rendering '%s' for template: %s", automation_info["name"], ex
-            )
+            _LOGGER.error("Error rendering '%s' for template: %s", trigger.name, ex)
             return
 
-        def _check_same_state(_, _2, new_st: State):
-            if new_st is None:
-                return False
+        if entity_id in trigger.waiting:
+            self._async_stop_waiting(trigger, entity_id)
 
-            if attribute is None:
-                cur_value = new_st.state
-            else:
-                cur_value = new_st.attributes.get(attribute)
+        @callback
+        def async_done() -> None:
+            """Call the action once the value stayed for the duration."""
+            self._async_stop_waiting(trigger, entity_id)
+            self._async_call_action(trigger, entity_id, from_s, to_s, event, period)
 
-            if CONF_FROM in config and CONF_TO not in config:
-                return cur_value != old_value
+        trigger.waiting[entity_id] = (
+            old_value,
+            new_value,
+            self.timers.async_schedule(now + period, async_done),
+        )
+        self._waiting.setdefault(entity_id, {})[trigger] = None
 
-            return cur_value == new_value
+    @callback
+    def _async_stop_waiting(self, trigger: _StateTrigger, entity_id: str) -> None:
+        """Stop waiting for the value of an entity to stay."""
+        _, _, cancel = trigger.waiting.pop(entity_id)
+        cancel()
+        waiting = self._waiting[entity_id]
+        del waiting[trigger]
+        if not waiting:
+            del self._waiting[entity_id]
 
-        unsub_track_same[entity] = async_track_same_state(
-            hass,
-            period[entity],
-            call_action,
-            _check_same_state,
-            entity_ids=entity,
+    @callback
+    def _async_call_action(
+        self,
+        trigger: _StateTrigger,
+        entity_id: str,
+        from_s: Optional[State],
+        to_s: Optional[State],
+        event: Event,
+        period: Optional[timedelta] = None,
+    ) -> None:
+        """Call the action of a trigger with the right context."""
+        self.hass.async_run_hass_job(
+            trigger.job,
+            {
+                "trigger": {
+                    "platform": trigger.platform_type,
+                    "entity_id": entity_id,
+                    "from_state": from_s,
+                    "to_state": to_s,
+                    "for": trigger.time_delta if not trigger.time_delta else period,
+                    "attribute": trigger.attribute,
+                    "description": f"state of {entity_id}",
+                }
+            },
+            event.context,
         )
 
-    unsub = async_track_state_change_event(hass, entity_id, state_automation_listener)
 
-    @callback
-    def async_remove():
-        """Remove state listeners async."""
-        unsub()
-        for async_remove in unsub_track_same.values():
-            async_remove()
-        unsub_track_same.clear()
-
-    return async_remove
+@callback
+def _async_get_index(hass: HomeAssistant) -> StateTriggerIndex:
+    """Return the index of the state triggers."""
+    index: Optional[StateTriggerIndex] = hass.data.get(DATA_STATE_TRIGGER_INDEX)
+    if index is None:
+        index = hass.data[DATA_STATE_TRIGGER_INDEX] = StateTriggerIndex(hass)
+    return index
+
+
+@callback
+def async_get_trigger_evaluations(hass: HomeAssistant) -> Dict[str, int]:
+    """Return the number of state trigger evaluations by automation entity id."""
+    return dict(_async_get_index(hass).evaluations)
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config,
+    action,
+    automation_info,
+    *,
+    platform_type: str = "state",
+) -> CALLBACK_TYPE:
+    """Listen for state changes based on configuration."""
+    template.attach(hass, config.get(CONF_FOR))
+    index = _async_get_index(hass)
+    return index.async_add(
+        _StateTrigger(index, config, action, automation_info, platform_type)
+    )
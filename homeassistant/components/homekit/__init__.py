@@ -79,7 +79,9 @@ from .const import (
 )
 from .util import (
     dismiss_setup_message,
+    find_next_available_port,
     get_persist_fullpath_for_entry_id,
+    get_shard_entry_id,
     migrate_filesystem_state_data_for_primary_imported_entry_id,
     port_is_available,
     remove_state_files_for_entry_id,
@@ -90,6 +92,10 @@ from .util import (
 _LOGGER = logging.getLogger(__name__)
 
 MAX_DEVICES = 150
+# Bridges an entry is sharded into when its entities don't fit in one
+MAX_SHARDS = 10
+# Distance between the first ports tried for the additional bridges
+SHARD_PORT_OFFSET = 100
 
 # #### Driver Status ####
 STATUS_READY = 0
@@ -282,6 +288,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     if homekit.status == STATUS_RUNNING:
         await homekit.async_stop()
 
+    homekit.async_remove_shards()
+
     for _ in range(0, SHUTDOWN_TIMEOUT):
         if not await hass.async_add_executor_job(
             port_is_available, entry.data[CONF_PORT]
@@ -421,81 +429,170 @@ class HomeKit:
 
         self.bridge = None
         self.driver = None
+        # Driver and bridge of each additional bridge
+        self.shards = []
+        self._zeroconf_instance = None
 
     def setup(self, zeroconf_instance):
         """Set up bridge and accessory driver."""
         # pylint: disable=import-outside-toplevel
-        from .accessories import HomeBridge, HomeDriver
+        from .accessories import HomeBridge
 
         self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self.async_stop)
+        self._zeroconf_instance = zeroconf_instance
+        self.driver = self._create_driver(self._entry_id, self._name, self._port)
+        self.bridge = HomeBridge(self.hass, self.driver, self._name)
+        if self._safe_mode:
+            _LOGGER.debug("Safe_mode selected for %s", self._name)
+
+    def _create_driver(self, entry_id, name, port):
+        """Create the accessory driver of a bridge."""
+        # pylint: disable=import-outside-toplevel
+        from .accessories import HomeDriver
+
         ip_addr = self._ip_address or get_local_ip()
-        persist_file = get_persist_fullpath_for_entry_id(self.hass, self._entry_id)
+        persist_file = get_persist_fullpath_for_entry_id(self.hass, entry_id)
 
-        self.driver = HomeDriver(
+        driver = HomeDriver(
             self.hass,
-            self._entry_id,
-            self._name,
+            entry_id,
+            name,
             loop=self.hass.loop,
             address=ip_addr,
-            port=self._port,
+            port=port,
             persist_file=persist_file,
             advertised_address=self._advertise_ip,
-            zeroconf_instance=zeroconf_instance,
+            zeroconf_instance=self._zeroconf_instance,
         )
 
         # If we do not load the mac address will be wrong
         # as pyhap uses a random one until state is restored
         if os.path.exists(persist_file):
-            self.driver.load()
+            driver.load()
         else:
-            self.driver.persist()
+            driver.persist()
 
-        self.bridge = HomeBridge(self.hass, self.driver, self._name)
         if self._safe_mode:
-            _LOGGER.debug("Safe_mode selected for %s", self._name)
-            self.driver.safe_mode = True
+            driver.safe_mode = True
+        return driver
+
+    def _add_shard(self):
+        """Create an additional bridge, return its driver and bridge."""
+        # pylint: disable=import-outside-toplevel
+        from .accessories import HomeBridge
+
+        shard = len(self.shards) + 1
+        entry_id = get_shard_entry_id(self._entry_id, shard)
+        name = self._get_shard_name(shard)
+        port = find_next_available_port(self._port + SHARD_PORT_OFFSET * shard)
+        _LOGGER.info(
+            "HomeKit Bridge %s is full, adding bridge %s on port %s",
+            self._name,
+            name,
+            port,
+        )
+        # Holds the pairing QR code of the bridge
+        self.hass.data[DOMAIN].setdefault(entry_id, {})
+        driver = self._create_driver(entry_id, name, port)
+        bridge = HomeBridge(self.hass, driver, name)
+        self.shards.append((driver, bridge))
+        return driver, bridge
+
+    @callback
+    def async_remove_shards(self):
+        """Remove the setup messages and data of the additional bridges."""
+        for shard in range(1, len(self.shards) + 1):
+            entry_id = self._get_shard_entry_id(shard)
+            dismiss_setup_message(self.hass, entry_id)
+            self.hass.data[DOMAIN].pop(entry_id, None)
+
+    def _get_shard_name(self, shard):
+        """Return the name of a bridge."""
+        if not shard:
+            return self._name
+        return f"{self._name} {shard + 1}"
+
+    def _get_shard_entry_id(self, shard):
+        """Return the id the state of a bridge is stored with."""
+        if not shard:
+            return self._entry_id
+        return get_shard_entry_id(self._entry_id, shard)
+
+    def _get_drivers_and_bridges(self):
+        """Return the driver and bridge of all bridges."""
+        return [(self.driver, self.bridge), *self.shards]
+
+    def _get_shard_with_room(self, entity_id):
+        """Return the driver and bridge to add an entity to.
+
+        Entities stay on the bridge they were first added to, as long as it
+        has room for them. Other entities are added to the first bridge with
+        room, a new bridge is added when all are full.
+        """
+        aid_storage = self.hass.data[DOMAIN][self._entry_id][AID_STORAGE]
+        shards = self._get_drivers_and_bridges()
+        shard = aid_storage.get_shard_for_entity_id(entity_id)
+        if shard is not None and shard < MAX_SHARDS:
+            while len(shards) <= shard:
+                shards.append(self._add_shard())
+            if _bridge_has_room(shards[shard][1]):
+                return shards[shard]
+
+        for shard, (driver, bridge) in enumerate(shards):
+            if _bridge_has_room(bridge):
+                break
+        else:
+            if len(shards) >= MAX_SHARDS:
+                return None
+            shard = len(shards)
+            driver, bridge = self._add_shard()
+
+        aid_storage.set_shard_for_entity_id(entity_id, shard)
+        return driver, bridge
 
     def reset_accessories(self, entity_ids):
         """Reset the accessory to load the latest configuration."""
         aid_storage = self.hass.data[DOMAIN][self._entry_id][AID_STORAGE]
-        removed = []
-        for entity_id in entity_ids:
-            aid = aid_storage.get_or_allocate_aid_for_entity_id(entity_id)
-            if aid not in self.bridge.accessories:
-                continue
-
-            _LOGGER.info(
-                "HomeKit Bridge %s will reset accessory with linked entity_id %s",
-                self._name,
-                entity_id,
-            )
+        for driver, bridge in self._get_drivers_and_bridges():
+            removed = []
+            for entity_id in entity_ids:
+                aid = aid_storage.get_or_allocate_aid_for_entity_id(entity_id)
+                if aid not in bridge.accessories:
+                    continue
+
+                _LOGGER.info(
+                    "HomeKit Bridge %s will reset accessory with linked entity_id %s",
+                    bridge.display_name,
+                    entity_id,
+                )
 
-            acc = self.remove_bridge_accessory(aid)
-            removed.append(acc)
+                removed.append(bridge.accessories.pop(aid))
 
-        if not removed:
-            # No matched accessories, probably on another bridge
-            return
+            if not removed:
+                # No matched accessories, probably on another bridge
+                continue
 
-        self.driver.config_changed()
+            driver.config_changed()
 
-        for acc in removed:
-            self.bridge.add_accessory(acc)
-        self.driver.config_changed()
+            for acc in removed:
+                bridge.add_accessory(acc)
+            driver.config_changed()
 
     def add_bridge_accessory(self, state):
         """Try adding accessory to bridge if configured beforehand."""
         if not self._filter(state.entity_id):
             return
 
-        # The bridge itself counts as an accessory
-        if len(self.bridge.accessories) + 1 >= MAX_DEVICES:
+        shard = self._get_shard_with_room(state.entity_id)
+        if shard is None:
             _LOGGER.warning(
-                "Cannot add %s as this would exceeded the %d device limit. Consider using the filter option",
+                "Cannot add %s as this would exceeded the %d device limit of %d bridges. Consider using the filter option",
                 state.entity_id,
                 MAX_DEVICES,
+                MAX_SHARDS,
             )
             return
+        driver, bridge = shard
 
         aid = self.hass.data[DOMAIN][self._entry_id][
             AID_STORAGE
@@ -505,20 +602,20 @@ class HomeKit:
         # of any kind (usually in pyhap) it should not prevent
         # the rest of the accessories from being created
         try:
-            acc = get_accessory(self.hass, self.driver, state, aid, conf)
+            acc = get_accessory(self.hass, driver, state, aid, conf)
             if acc is not None:
-                self.bridge.add_accessory(acc)
+                bridge.add_accessory(acc)
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception(
                 "Failed to create a HomeKit accessory for %s", state.entity_id
             )
 
     def remove_bridge_accessory(self, aid):
-        """Try adding accessory to bridge if configured beforehand."""
-        acc = None
-        if aid in self.bridge.accessories:
-            acc = self.bridge.accessories.pop(aid)
-        return acc
+        """Try removing accessory from the bridge it was added to."""
+        for _, bridge in self._get_drivers_and_bridges():
+            if aid in bridge.accessories:
+                return bridge.accessories.pop(aid)
+        return None
 
     async def async_start(self, *args):
         """Start the accessory driver."""
@@ -553,16 +650,16 @@ class HomeKit:
 
             bridged_states.append(state)
 
-        self._async_register_bridge(dev_reg)
         await self.hass.async_add_executor_job(self._start, bridged_states)
-        _LOGGER.debug("Driver start for %s", self._name)
-        self.hass.add_job(self.driver.start_service)
+        self._async_register_bridges(dev_reg)
+        for driver, bridge in self._get_drivers_and_bridges():
+            _LOGGER.debug("Driver start for %s", bridge.display_name)
+            self.hass.add_job(driver.start_service)
         self.status = STATUS_RUNNING
 
     @callback
-    def _async_register_bridge(self, dev_reg):
-        """Register the bridge as a device so homekit_controller and exclude it from discovery."""
-        formatted_mac = device_registry.format_mac(self.driver.state.mac)
+    def _async_register_bridges(self, dev_reg):
+        """Register the bridges as devices so homekit_controller and exclude them from discovery."""
         # Connections and identifiers are both used here.
         #
         # connections exists so homekit_controller can know the
@@ -575,26 +672,36 @@ class HomeKit:
         # because this was the way you had to fix homekit when pairing
         # failed.
         #
-        connection = (device_registry.CONNECTION_NETWORK_MAC, formatted_mac)
-        identifier = (DOMAIN, self._entry_id, BRIDGE_SERIAL_NUMBER)
-        self._async_purge_old_bridges(dev_reg, identifier, connection)
-        dev_reg.async_get_or_create(
-            config_entry_id=self._entry_id,
-            identifiers={identifier},
-            connections={connection},
-            manufacturer=MANUFACTURER,
-            name=self._name,
-            model="Home Assistant HomeKit Bridge",
-        )
+        devices = []
+        for shard, (driver, _) in enumerate(self._get_drivers_and_bridges()):
+            formatted_mac = device_registry.format_mac(driver.state.mac)
+            connection = (device_registry.CONNECTION_NETWORK_MAC, formatted_mac)
+            identifier = (
+                DOMAIN,
+                self._get_shard_entry_id(shard),
+                BRIDGE_SERIAL_NUMBER,
+            )
+            devices.append((identifier, connection, self._get_shard_name(shard)))
+
+        self._async_purge_old_bridges(dev_reg, devices)
+        for identifier, connection, name in devices:
+            dev_reg.async_get_or_create(
+                config_entry_id=self._entry_id,
+                identifiers={identifier},
+                connections={connection},
+                manufacturer=MANUFACTURER,
+                name=name,
+                model="Home Assistant HomeKit Bridge",
+            )
 
     @callback
-    def _async_purge_old_bridges(self, dev_reg, identifier, connection):
+    def _async_purge_old_bridges(self, dev_reg, devices):
         """Purge bridges that exist from failed pairing or manual resets."""
         devices_to_purge = []
         for entry in dev_reg.devices.values():
-            if self._entry_id in entry.config_entries and (
-                identifier not in entry.identifiers
-                or connection not in entry.connections
+            if self._entry_id in entry.config_entries and not any(
+                identifier in entry.identifiers and connection in entry.connections
+                for identifier, connection, _ in devices
             ):
                 devices_to_purge.append(entry.id)
 
@@ -616,29 +723,38 @@ class HomeKit:
             type_thermostats,
         )
 
+        # Entities already assigned to a bridge are added first, so they
+        # keep their bridge
+        aid_storage = self.hass.data[DOMAIN][self._entry_id][AID_STORAGE]
+        bridged_states.sort(
+            key=lambda state: aid_storage.get_shard_for_entity_id(state.entity_id)
+            is None
+        )
         for state in bridged_states:
             self.add_bridge_accessory(state)
 
-        self.driver.add_accessory(self.bridge)
+        for shard, (driver, bridge) in enumerate(self._get_drivers_and_bridges()):
+            driver.add_accessory(bridge)
 
-        if not self.driver.state.paired:
-            show_setup_message(
-                self.hass,
-                self._entry_id,
-                self._name,
-                self.driver.state.pincode,
-                self.bridge.xhm_uri(),
-            )
+            if not driver.state.paired:
+                show_setup_message(
+                    self.hass,
+                    self._get_shard_entry_id(shard),
+                    self._get_shard_name(shard),
+                    driver.state.pincode,
+                    bridge.xhm_uri(),
+                )
 
     async def async_stop(self, *args):
-        """Stop the accessory driver."""
+        """Stop the accessory drivers."""
         if self.status != STATUS_RUNNING:
             return
         self.status = STATUS_STOPPED
-        _LOGGER.debug("Driver stop for %s", self._name)
-        await self.driver.async_stop()
-        for acc in self.bridge.accessories.values():
-            acc.async_stop()
+        for driver, bridge in self._get_drivers_and_bridges():
+            _LOGGER.debug("Driver stop for %s", bridge.display_name)
+            await driver.async_stop()
+            for acc in bridge.accessories.values():
+                acc.async_stop()
 
     @callback
     def _async_configure_linked_sensors(self, ent_reg_ent, device_lookup, state):
@@ -721,6 +837,12 @@ class HomeKit:
                 ent_cfg[ATTR_INTERGRATION] = ent_reg_ent.platform
 
 
+def _bridge_has_room(bridge):
+    """Return if an accessory can be added to a bridge."""
+    # The bridge itself counts as an accessory
+    return len(bridge.accessories) + 1 < MAX_DEVICES
+
+
 class HomeKitPairingQRView(HomeAssistantView):
     """Display the homekit pairing code at a protected url."""
 
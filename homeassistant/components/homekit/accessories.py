@@ -1,12 +1,21 @@
 """Extend the basic Accessory and Bridge functions."""
+from collections import deque
 from datetime import timedelta
 from functools import partial, wraps
 from inspect import getmodule
+import json
 import logging
+from typing import Deque
 
-from pyhap.accessory import Accessory, Bridge
+from pyhap.accessory import Accessory, Bridge, get_topic
 from pyhap.accessory_driver import AccessoryDriver
-from pyhap.const import CATEGORY_OTHER
+from pyhap.const import (
+    CATEGORY_OTHER,
+    HAP_REPR_AID,
+    HAP_REPR_CHARS,
+    HAP_REPR_IID,
+    HAP_REPR_VALUE,
+)
 
 from homeassistant.components import cover, vacuum
 from homeassistant.components.cover import (
@@ -553,6 +562,66 @@ class HomeDriver(AccessoryDriver):
         self.hass = hass
         self._entry_id = entry_id
         self._bridge_name = bridge_name
+        self._pending_events: Deque = deque()
+        self._send_events_scheduled = False
+        # Last value sent for each topic
+        self._event_values = {}
+
+    def subscribe_client_topic(self, client, topic, subscribe=True):
+        """Override super function to send the next value to new subscribers."""
+        super().subscribe_client_topic(client, topic, subscribe)
+        if subscribe:
+            self._event_values.pop(topic, None)
+
+    def publish(self, data, sender_client_addr=None):
+        """Override super function to send events in batches.
+
+        Characteristic changes published until the event loop gets to them
+        are sent together, in one event per group of subscribed clients. Only
+        the last value of a characteristic is sent, and only if it differs
+        from the value sent before.
+        """
+        topic = get_topic(data[HAP_REPR_AID], data[HAP_REPR_IID])
+        if topic not in self.topics:
+            return
+
+        self._pending_events.append((topic, data, sender_client_addr))
+        if not self._send_events_scheduled:
+            self._send_events_scheduled = True
+            self.hass.loop.call_soon_threadsafe(self._async_send_events)
+
+    @ha_callback
+    def _async_send_events(self):
+        """Queue the events published since the last batch to be sent."""
+        # Reset before draining so an event published meanwhile schedules a batch
+        self._send_events_scheduled = False
+        events = {}
+        pending = self._pending_events
+        while pending:
+            topic, data, sender_client_addr = pending.popleft()
+            events[topic] = (data, sender_client_addr)
+
+        batches = {}
+        for topic, (data, sender_client_addr) in events.items():
+            clients = self.topics.get(topic)
+            if not clients:
+                continue
+            value = data[HAP_REPR_VALUE]
+            if topic in self._event_values and self._event_values[topic] == value:
+                continue
+            self._event_values[topic] = value
+            key = (frozenset(clients), sender_client_addr)
+            batch = batches.get(key)
+            if batch is None:
+                batches[key] = (topic, [data])
+            else:
+                batch[1].append(data)
+
+        for (_, sender_client_addr), (topic, chars) in batches.items():
+            # The sender thread sends to the clients subscribed to topic,
+            # which are the clients of all the characteristics of the batch
+            bytedata = json.dumps({HAP_REPR_CHARS: chars}).encode()
+            self.event_queue.put((topic, bytedata, sender_client_addr))
 
     def pair(self, client_uuid, client_public):
         """Override super function to dismiss setup message if paired."""
@@ -24,6 +24,7 @@ AID_MANAGER_STORAGE_VERSION = 1
 AID_MANAGER_SAVE_DELAY = 2
 
 ALLOCATIONS_KEY = "allocations"
+SHARDS_KEY = "shards"
 UNIQUE_IDS_KEY = "unique_ids"
 
 INVALID_AIDS = (0, 1)
@@ -70,6 +71,7 @@ class AccessoryAidStorage:
         self.hass = hass
         self.allocations = {}
         self.allocated_aids = set()
+        self.shards = {}
         self._entry = entry
         self.store = None
         self._entity_registry = None
@@ -89,6 +91,7 @@ class AccessoryAidStorage:
 
         self.allocations = raw_storage.get(ALLOCATIONS_KEY, {})
         self.allocated_aids = set(self.allocations.values())
+        self.shards = raw_storage.get(SHARDS_KEY, {})
 
     def get_or_allocate_aid_for_entity_id(self, entity_id: str):
         """Generate a stable aid for an entity id."""
@@ -99,6 +102,25 @@ class AccessoryAidStorage:
         sys_unique_id = get_system_unique_id(entity)
         return self._get_or_allocate_aid(sys_unique_id, entity_id)
 
+    def get_shard_for_entity_id(self, entity_id: str):
+        """Return the bridge an entity id was assigned to, None if not assigned."""
+        return self.shards.get(self._get_storage_key(entity_id))
+
+    def set_shard_for_entity_id(self, entity_id: str, shard: int):
+        """Assign an entity id to a bridge."""
+        storage_key = self._get_storage_key(entity_id)
+        if self.shards.get(storage_key) == shard:
+            return
+        self.shards[storage_key] = shard
+        self.async_schedule_save()
+
+    def _get_storage_key(self, entity_id: str):
+        """Return the key data of an entity id is stored with."""
+        entity = self._entity_registry.async_get(entity_id)
+        if not entity:
+            return entity_id
+        return get_system_unique_id(entity)
+
     def _get_or_allocate_aid(self, unique_id: str, entity_id: str):
         """Allocate (and return) a new aid for an accessory."""
         if unique_id and unique_id in self.allocations:
@@ -128,6 +150,7 @@ class AccessoryAidStorage:
 
         aid = self.allocations.pop(storage_key)
         self.allocated_aids.discard(aid)
+        self.shards.pop(storage_key, None)
         self.async_schedule_save()
 
     @callback
@@ -142,4 +165,4 @@ class AccessoryAidStorage:
     @callback
     def _data_to_save(self):
         """Return data of entity map to store in a file."""
-        return {ALLOCATIONS_KEY: self.allocations}
+        return {ALLOCATIONS_KEY: self.allocations, SHARDS_KEY: self.shards}
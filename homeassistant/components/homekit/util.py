@@ -422,6 +422,11 @@ def get_persist_filename_for_entry_id(entry_id: str):
     return f"{DOMAIN}.{entry_id}.state"
 
 
+def get_shard_entry_id(entry_id: str, shard: int):
+    """Determine the id the state of an additional bridge is stored with."""
+    return f"{entry_id}_{shard}"
+
+
 def get_aid_storage_filename_for_entry_id(entry_id: str):
     """Determine the ilename of homekit aid storage file."""
     return f"{DOMAIN}.{entry_id}.aids"
@@ -472,6 +477,15 @@ def remove_state_files_for_entry_id(hass: HomeAssistant, entry_id: str):
     os.unlink(persist_file_path)
     if os.path.exists(aid_storage_path):
         os.unlink(aid_storage_path)
+    shard = 1
+    while True:
+        shard_file_path = get_persist_fullpath_for_entry_id(
+            hass, get_shard_entry_id(entry_id, shard)
+        )
+        if not os.path.exists(shard_file_path):
+            break
+        os.unlink(shard_file_path)
+        shard += 1
     return True
 
 
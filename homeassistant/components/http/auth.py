@@ -1,11 +1,17 @@
 """Authentication for HTTP component."""
+from collections import OrderedDict
+import hashlib
 import logging
 import secrets
+import time
+from typing import Optional, Tuple
 
 from aiohttp import hdrs
 from aiohttp.web import middleware
 import jwt
 
+from homeassistant.auth import EVENT_USER_REMOVED
+from homeassistant.auth.models import RefreshToken
 from homeassistant.core import callback
 from homeassistant.util import dt as dt_util
 
@@ -17,8 +23,17 @@ _LOGGER = logging.getLogger(__name__)
 
 DATA_API_PASSWORD = "api_password"
 DATA_SIGN_SECRET = "http.auth.sign_secret"
+DATA_TOKEN_CACHE = "http.auth.token_cache"
 SIGN_QUERY_PARAM = "authSig"
 
+TOKEN_CACHE_SIZE = 512
+TOKEN_CACHE_TTL = 60
+# Leeway applied by the auth manager when verifying the expiration
+ACCESS_TOKEN_LEEWAY = 10
+
+# Refresh token of a validated token, path the token is signed for, expiration
+_CachedToken = Tuple[RefreshToken, Optional[str], float]
+
 
 @callback
 def async_sign_path(hass, refresh_token_id, path, expiration):
@@ -37,9 +52,108 @@ def async_sign_path(hass, refresh_token_id, path, expiration):
     return f"{path}?{SIGN_QUERY_PARAM}=" f"{encoded.decode()}"
 
 
+class ValidatedTokenCache:
+    """Remember recently validated tokens to skip the JWT verification.
+
+    Entries are keyed by a hash of the token and expire after the TTL or
+    when the token itself expires, whichever comes first. A cached token is
+    only accepted while its refresh token still exists and its user is
+    active, entries of removed users are dropped right away.
+    """
+
+    def __init__(self, max_size: int = TOKEN_CACHE_SIZE, ttl: float = TOKEN_CACHE_TTL):
+        """Initialize the cache."""
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, _CachedToken]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached tokens."""
+        return len(self._entries)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        """Return the cache key of a token."""
+        return hashlib.sha256(token.encode()).digest()
+
+    @callback
+    def async_get(
+        self, token: str, path: Optional[str] = None
+    ) -> Optional[RefreshToken]:
+        """Return the refresh token of a validated token, None on a miss."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        refresh_token, entry_path, expires = entry
+        user = refresh_token.user
+        if (
+            time.time() >= expires
+            or not user.is_active
+            or user.refresh_tokens.get(refresh_token.id) is not refresh_token
+        ):
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        if entry_path != path:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return refresh_token
+
+    @callback
+    def async_put(
+        self,
+        token: str,
+        refresh_token: RefreshToken,
+        expires: float,
+        path: Optional[str] = None,
+    ) -> None:
+        """Remember a validated token until it expires."""
+        key = self._key(token)
+        self._entries[key] = (
+            refresh_token,
+            path,
+            min(expires, time.time() + self.ttl),
+        )
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    @callback
+    def async_invalidate_user(self, user_id: str) -> None:
+        """Drop the cached tokens of a user."""
+        for key in [
+            key
+            for key, (refresh_token, _, _) in self._entries.items()
+            if refresh_token.user.id == user_id
+        ]:
+            del self._entries[key]
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop all cached tokens."""
+        self._entries.clear()
+
+
 @callback
 def setup_auth(hass, app):
     """Create auth middleware for the app."""
+    token_cache = hass.data[DATA_TOKEN_CACHE] = ValidatedTokenCache()
+
+    @callback
+    def async_user_removed(event):
+        """Drop the cached tokens of a removed user."""
+        token_cache.async_invalidate_user(event.data["user_id"])
+
+    hass.bus.async_listen(EVENT_USER_REMOVED, async_user_removed)
 
     async def async_validate_auth_header(request):
         """
@@ -56,10 +170,18 @@ def setup_auth(hass, app):
         if auth_type != "Bearer":
             return False
 
-        refresh_token = await hass.auth.async_validate_access_token(auth_val)
+        refresh_token = token_cache.async_get(auth_val)
 
         if refresh_token is None:
-            return False
+            refresh_token = await hass.auth.async_validate_access_token(auth_val)
+
+            if refresh_token is None:
+                return False
+
+            claims = jwt.decode(auth_val, verify=False)
+            token_cache.async_put(
+                auth_val, refresh_token, claims["exp"] + ACCESS_TOKEN_LEEWAY
+            )
 
         request[KEY_HASS_USER] = refresh_token.user
         return True
@@ -76,6 +198,12 @@ def setup_auth(hass, app):
         if signature is None:
             return False
 
+        refresh_token = token_cache.async_get(signature, request.path)
+
+        if refresh_token is not None:
+            request[KEY_HASS_USER] = refresh_token.user
+            return True
+
         try:
             claims = jwt.decode(
                 signature, secret, algorithms=["HS256"], options={"verify_iss": False}
@@ -88,9 +216,12 @@ def setup_auth(hass, app):
 
         refresh_token = await hass.auth.async_get_refresh_token(claims["iss"])
 
-        if refresh_token is None:
+        # Inactive users are rejected like for access tokens, so the result
+        # does not depend on whether the signature is cached
+        if refresh_token is None or not refresh_token.user.is_active:
             return False
 
+        token_cache.async_put(signature, refresh_token, claims["exp"], request.path)
         request[KEY_HASS_USER] = refresh_token.user
         return True
 
@@ -1,8 +1,12 @@
 """Static file handling for HTTP component."""
+import mimetypes
 from pathlib import Path
+import stat
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional, Set, Tuple
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
 
@@ -11,22 +15,152 @@ from aiohttp.web_urldispatcher import StaticResource
 CACHE_TIME = 31 * 86400  # = 1 month
 CACHE_HEADERS = {hdrs.CACHE_CONTROL: f"public, max-age={CACHE_TIME}"}
 
+# Precompressed siblings, in order of preference
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+# Seconds a resolved path and the stat of its files are trusted
+STAT_CACHE_TTL = 10
+STAT_CACHE_SIZE = 1024
+
+
+class FileVariant(NamedTuple):
+    """A file to serve for a static path, possibly precompressed."""
+
+    path: Path
+    encoding: Optional[str]
+    etag: str
+    mtime: float
+
+
+class StaticFile(NamedTuple):
+    """A resolved static path and its variants, keyed by content coding."""
+
+    content_type: str
+    variants: Dict[Optional[str], FileVariant]
+
+
+def _file_variant(path: Path, encoding: Optional[str]) -> Optional[FileVariant]:
+    """Stat a file, return None if it is not a regular file."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    # Same format as the ETag of aiohttp's FileResponse
+    return FileVariant(
+        path, encoding, f'"{st.st_mtime_ns:x}-{st.st_size:x}"', st.st_mtime
+    )
+
+
+def accepted_encodings(accept_encoding: str) -> Set[str]:
+    """Return the content codings accepted by a client."""
+    encodings = set()
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if not float(params[2:]):
+                    continue
+            except ValueError:
+                continue
+        encodings.add(coding.strip())
+    return encodings
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """Return if an ETag matches an If-None-Match header, weak comparison."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or (tag[2:] if tag.startswith("W/") else tag) == etag:
+            return True
+    return False
+
+
+class CachedFileResponse(FileResponse):
+    """File response that answers 404 if the file was removed since cached."""
+
+    def __init__(
+        self, path: Path, on_missing: Callable[[], Any], **kwargs: Any
+    ) -> None:
+        """Initialize the response."""
+        super().__init__(path, **kwargs)
+        self._on_missing = on_missing
+
+    async def prepare(self, request):
+        """Send the file, or a 404 when it no longer exists."""
+        try:
+            return await super().prepare(request)
+        except FileNotFoundError:
+            self._on_missing()
+            self.set_status(HTTPNotFound.status_code)
+            for header in (hdrs.CONTENT_ENCODING, hdrs.ETAG, hdrs.VARY):
+                self.headers.pop(header, None)
+            self.content_length = 0
+            return await StreamResponse.prepare(self, request)
+
 
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
 
-    async def _handle(self, request):
+    Resolved paths and the stat of their files are cached for a short time.
+    Precompressed .br and .gz siblings are served to clients accepting them
+    and conditional requests are answered with 304 Not Modified.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the resource."""
+        super().__init__(*args, **kwargs)
+        self._file_cache: Dict[str, Tuple[float, Optional[StaticFile]]] = {}
+
+    def _resolve(self, rel_url: str) -> Optional[StaticFile]:
+        """Resolve a path to its file and variants, None for a directory."""
+        filename = Path(rel_url)
+        if filename.anchor:
+            # rel_url is an absolute name like
+            # /static/\\machine_name\c$ or /static/D:\path
+            # where the static dir is totally different
+            raise HTTPForbidden()
+        filepath = self._directory.joinpath(filename).resolve()
+        if not self._follow_symlinks:
+            filepath.relative_to(self._directory)
+
+        # on opening a dir, load its contents if allowed
+        if filepath.is_dir():
+            return None
+
+        identity = _file_variant(filepath, None)
+        if identity is None:
+            raise HTTPNotFound
+
+        variants: Dict[Optional[str], FileVariant] = {None: identity}
+        for encoding, suffix in PRECOMPRESSED:
+            variant = _file_variant(
+                filepath.with_name(filepath.name + suffix), encoding
+            )
+            if variant is not None:
+                variants[encoding] = variant
+
+        content_type, file_encoding = mimetypes.guess_type(str(filepath))
+        if file_encoding:
+            # The file itself is compressed, serve it as is like aiohttp
+            variants = {file_encoding: identity._replace(encoding=file_encoding)}
+        return StaticFile(content_type or "application/octet-stream", variants)
+
+    async def _async_get_file(self, request: Request) -> Optional[StaticFile]:
+        """Return the cached resolution of a path, resolve it on a miss."""
         rel_url = request.match_info["filename"]
+        now = time.monotonic()
+        cached = self._file_cache.get(rel_url)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
         try:
-            filename = Path(rel_url)
-            if filename.anchor:
-                # rel_url is an absolute name like
-                # /static/\\machine_name\c$ or /static/D:\path
-                # where the static dir is totally different
-                raise HTTPForbidden()
-            filepath = self._directory.joinpath(filename).resolve()
-            if not self._follow_symlinks:
-                filepath.relative_to(self._directory)
+            static_file: Optional[StaticFile] = await request.app.loop.run_in_executor(
+                None, self._resolve, rel_url
+            )
+        except (HTTPForbidden, HTTPNotFound):
+            raise
         except (ValueError, FileNotFoundError) as error:
             # relatively safe
             raise HTTPNotFound() from error
@@ -35,14 +169,50 @@ class CachingStaticResource(StaticResource):
             request.app.logger.exception(error)
             raise HTTPNotFound() from error
 
-        # on opening a dir, load its contents if allowed
-        if filepath.is_dir():
+        if len(self._file_cache) >= STAT_CACHE_SIZE:
+            self._file_cache.clear()
+        self._file_cache[rel_url] = (now + STAT_CACHE_TTL, static_file)
+        return static_file
+
+    async def _handle(self, request):
+        static_file = await self._async_get_file(request)
+        if static_file is None:
             return await super()._handle(request)
-        if filepath.is_file():
-            return FileResponse(
-                filepath,
-                chunk_size=self._chunk_size,
-                # type ignore: https://github.com/aio-libs/aiohttp/pull/3976
-                headers=CACHE_HEADERS,  # type: ignore
+
+        variants = static_file.variants
+        variant = variants.get(None)
+        if len(variants) > 1 or variant is None:
+            accepted = accepted_encodings(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+            for encoding, _ in PRECOMPRESSED:
+                if encoding in variants and encoding in accepted:
+                    variant = variants[encoding]
+                    break
+            if variant is None:
+                variant = next(iter(variants.values()))
+
+        headers = {**CACHE_HEADERS, hdrs.ETAG: variant.etag}
+        if len(variants) > 1:
+            headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+
+        # If-Modified-Since is ignored when If-None-Match is present
+        if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+        if if_none_match is not None:
+            not_modified = _etag_matches(variant.etag, if_none_match)
+        else:
+            if_modified_since = request.if_modified_since
+            not_modified = (
+                if_modified_since is not None
+                and variant.mtime <= if_modified_since.timestamp()
             )
-        raise HTTPNotFound
+        if not_modified:
+            return Response(status=304, headers=headers)  # type: ignore
+
+        headers[hdrs.CONTENT_TYPE] = static_file.content_type
+        if variant.encoding:
+            headers[hdrs.CONTENT_ENCODING] = variant.encoding
+        return CachedFileResponse(
+            variant.path,
+            lambda: self._file_cache.pop(request.match_info["filename"], None),
+            chunk_size=self._chunk_size,
+            headers=headers,
+        )
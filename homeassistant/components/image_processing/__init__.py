@@ -7,18 +7,21 @@ import voluptuous as vol
 
 from homeassistant.const import ATTR_ENTITY_ID, ATTR_NAME, CONF_ENTITY_ID, CONF_NAME
 from homeassistant.core import callback
-from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.executor import EXECUTOR_CPU
+
+from .scheduler import ImageProcessingScheduler
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "image_processing"
+DATA_SCHEDULER = "image_processing_scheduler"
 SCAN_INTERVAL = timedelta(seconds=10)
 
 DEVICE_CLASSES = [
@@ -66,6 +69,9 @@ PLATFORM_SCHEMA_BASE = cv.PLATFORM_SCHEMA_BASE.extend(PLATFORM_SCHEMA.schema)
 async def async_setup(hass, config):
     """Set up the image processing."""
     component = EntityComponent(_LOGGER, DOMAIN, hass, SCAN_INTERVAL)
+    hass.data[DATA_SCHEDULER] = ImageProcessingScheduler(
+        hass, hass.executors.get(EXECUTOR_CPU).max_workers
+    )
 
     await component.async_setup(config)
 
@@ -107,29 +113,23 @@ class ImageProcessingEntity(Entity):
         """Process image."""
         raise NotImplementedError()
 
+    @property
+    def processing_stats(self):
+        """Return the latency and dropped frames of this processor."""
+        return self.hass.data[DATA_SCHEDULER].stats.get(self.entity_id)
+
     async def async_process_image(self, image):
         """Process image."""
-        return await self.hass.async_add_job(self.process_image, image)
+        return await self.hass.async_add_executor_partition_job(
+            EXECUTOR_CPU, self.process_image, image
+        )
 
     async def async_update(self):
         """Update image and process it.
 
         This method is a coroutine.
         """
-        camera = self.hass.components.camera
-        image = None
-
-        try:
-            image = await camera.async_get_image(
-                self.camera_entity, timeout=self.timeout
-            )
-
-        except HomeAssistantError as err:
-            _LOGGER.error("Error on receive image from entity: %s", err)
-            return
-
-        # process image data
-        await self.async_process_image(image.content)
+        await self.hass.data[DATA_SCHEDULER].async_process(self)
 
 
 class ImageProcessingFaceEntity(ImageProcessingEntity):
@@ -0,0 +1,136 @@
+"""Schedule image processing, sharing camera frames between processors."""
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.typing import HomeAssistantType
+
+if TYPE_CHECKING:
+    from homeassistant.components.camera import Image
+
+    from . import ImageProcessingEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ImageProcessingScheduler:
+    """Run image processing with one fetch per camera and bounded concurrency.
+
+    Each processor runs one update at a time. An update requested while the
+    processor is busy waits for the next run and replaces an update already
+    waiting, which is counted as a dropped frame, so the next run always
+    processes a fresh frame. Processors watching the same camera share the
+    fetch of a frame and are submitted together when it arrives.
+    """
+
+    def __init__(self, hass: HomeAssistantType, max_parallel: int) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.max_parallel = max_parallel
+        self._semaphore = asyncio.Semaphore(max_parallel)
+        self._fetches: Dict[Optional[str], asyncio.Task] = {}
+        self._running: Set[str] = set()
+        self._waiting: Dict[str, asyncio.Future] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the processing statistics of each processor."""
+        return {
+            entity_id: {
+                **stats,
+                "average_latency": (
+                    stats["total_latency"] / stats["processed"]
+                    if stats["processed"]
+                    else 0.0
+                ),
+            }
+            for entity_id, stats in self._stats.items()
+        }
+
+    def _get_stats(self, entity_id: str) -> Dict[str, Any]:
+        """Return the statistics of a processor, create them on first use."""
+        stats = self._stats.get(entity_id)
+        if stats is None:
+            stats = self._stats[entity_id] = {
+                "processed": 0,
+                "dropped_frames": 0,
+                "latency": 0.0,
+                "max_latency": 0.0,
+                "total_latency": 0.0,
+            }
+        return stats
+
+    async def async_process(self, entity: "ImageProcessingEntity") -> None:
+        """Process the latest frame of the camera of an image processing entity."""
+        entity_id = entity.entity_id
+        if entity_id in self._running:
+            previous = self._waiting.get(entity_id)
+            if previous is not None and not previous.done():
+                self._get_stats(entity_id)["dropped_frames"] += 1
+                previous.set_result(None)
+            waiter = self._waiting[entity_id] = self.hass.loop.create_future()
+            await waiter
+            return
+
+        self._running.add(entity_id)
+        try:
+            await self._async_run(entity)
+            while entity_id in self._waiting:
+                waiter = self._waiting.pop(entity_id)
+                try:
+                    await self._async_run(entity)
+                finally:
+                    if not waiter.done():
+                        waiter.set_result(None)
+        finally:
+            self._running.discard(entity_id)
+            # Release an update left waiting when a run failed
+            if entity_id in self._waiting:
+                waiter = self._waiting.pop(entity_id)
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    async def _async_run(self, entity: "ImageProcessingEntity") -> None:
+        """Fetch a frame and process it."""
+        try:
+            image = await self._async_get_frame(entity.camera_entity, entity.timeout)
+        except HomeAssistantError as err:
+            _LOGGER.error("Error on receive image from entity: %s", err)
+            return
+
+        start = time.monotonic()
+        async with self._semaphore:
+            await entity.async_process_image(  # type: ignore[no-untyped-call]
+                image.content
+            )
+
+        latency = time.monotonic() - start
+        stats = self._get_stats(entity.entity_id)
+        stats["processed"] += 1
+        stats["latency"] = latency
+        stats["total_latency"] += latency
+        stats["max_latency"] = max(stats["max_latency"], latency)
+
+    async def _async_get_frame(
+        self, camera_entity: Optional[str], timeout: int
+    ) -> "Image":
+        """Fetch an image from a camera, joining a fetch already running."""
+        fetch = self._fetches.get(camera_entity)
+        if fetch is None:
+            fetch = self._fetches[camera_entity] = self.hass.async_create_task(
+                self._async_fetch(camera_entity, timeout)
+            )
+        return await asyncio.shield(fetch)
+
+    async def _async_fetch(self, camera_entity: Optional[str], timeout: int) -> "Image":
+        """Fetch an image from a camera."""
+        try:
+            image: "Image" = await self.hass.components.camera.async_get_image(
+                camera_entity, timeout=timeout
+            )
+            return image
+        finally:
+            del self._fetches[camera_entity]
@@ -1,11 +1,12 @@
 """Support for sending data to an Influx database."""
 from dataclasses import dataclass
+import gzip
 import logging
 import math
 import queue
 import threading
 import time
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from influxdb import InfluxDBClient, exceptions
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
@@ -33,11 +34,14 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 
 from .const import (
     API_VERSION_2,
     BATCH_BUFFER_SIZE,
     BATCH_TIMEOUT,
+    BUFFER_FULL_MESSAGE,
+    BUFFERED_MESSAGE,
     CATCHING_UP_MESSAGE,
     CLIENT_ERROR_V1,
     CLIENT_ERROR_V2,
@@ -50,6 +54,7 @@ from .const import (
     CONF_COMPONENT_CONFIG_GLOB,
     CONF_DB_NAME,
     CONF_DEFAULT_MEASUREMENT,
+    CONF_GZIP,
     CONF_HOST,
     CONF_IGNORE_ATTRIBUTES,
     CONF_ORG,
@@ -58,6 +63,7 @@ from .const import (
     CONF_PATH,
     CONF_PORT,
     CONF_PRECISION,
+    CONF_RETRY_BUFFER_SIZE,
     CONF_RETRY_COUNT,
     CONF_SSL,
     CONF_TAGS,
@@ -70,6 +76,7 @@ from .const import (
     DEFAULT_HOST_V2,
     DEFAULT_SSL_V2,
     DOMAIN,
+    DRAINED_MESSAGE,
     EVENT_NEW_STATE,
     INFLUX_CONF_FIELDS,
     INFLUX_CONF_MEASUREMENT,
@@ -83,6 +90,7 @@ from .const import (
     RE_DECIMAL,
     RE_DIGIT_TAIL,
     RESUMED_MESSAGE,
+    RETRY_BUFFER_FILE,
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
@@ -92,6 +100,8 @@ from .const import (
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
+from .line_protocol import points_to_lines
+from .retry_buffer import RetryBuffer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -153,6 +163,9 @@ _CUSTOMIZE_ENTITY_SCHEMA = vol.Schema(
 _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {
         vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
+        # Size of the on-disk buffer for events that could not be written in MB
+        vol.Optional(CONF_RETRY_BUFFER_SIZE, default=0): cv.positive_int,
+        vol.Optional(CONF_GZIP, default=False): cv.boolean,
         vol.Optional(CONF_DEFAULT_MEASUREMENT): cv.string,
         vol.Optional(CONF_OVERRIDE_MEASUREMENT): cv.string,
         vol.Optional(CONF_TAGS, default={}): vol.Schema({cv.string: cv.string}),
@@ -301,6 +314,7 @@ class InfluxClient:
     write: Callable[[str], None]
     query: Callable[[str, str], List[Any]]
     close: Callable[[], None]
+    write_lines: Optional[Callable[[List[str]], None]] = None
 
 
 def get_influx_connection(conf, test_write=False, test_read=False):
@@ -314,11 +328,14 @@ def get_influx_connection(conf, test_write=False, test_read=False):
         kwargs[CONF_URL] = conf[CONF_URL]
         kwargs[CONF_TOKEN] = conf[CONF_TOKEN]
         kwargs[INFLUX_CONF_ORG] = conf[CONF_ORG]
+        if conf.get(CONF_GZIP):
+            kwargs["enable_gzip"] = True
         bucket = conf.get(CONF_BUCKET)
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
         initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
         write_api = influx.write_api(write_options=initial_write_mode)
+        lines_write_api = influx.write_api(write_options=SYNCHRONOUS)
 
         def write_v2(json):
             """Write data to V2 influx."""
@@ -331,6 +348,19 @@ def get_influx_connection(conf, test_write=False, test_read=False):
                     raise ValueError(WRITE_ERROR % (json, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
+        def write_lines_v2(lines):
+            """Write line protocol lines to V2 influx and wait for the result."""
+            try:
+                lines_write_api.write(
+                    bucket=bucket, record=lines, write_precision=precision
+                )
+            except (urllib3.exceptions.HTTPError, OSError) as exc:
+                raise ConnectionError(CONNECTION_ERROR % exc) from exc
+            except ApiException as exc:
+                if exc.status == CODE_INVALID_INPUTS:
+                    raise ValueError(WRITE_ERROR % (lines, exc)) from exc
+                raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
+
         def query_v2(query, _=None):
             """Query V2 influx."""
             try:
@@ -363,7 +393,7 @@ def get_influx_connection(conf, test_write=False, test_read=False):
             else:
                 buckets = []
 
-        return InfluxClient(buckets, write_v2, query_v2, close_v2)
+        return InfluxClient(buckets, write_v2, query_v2, close_v2, write_lines_v2)
 
     # Else it's a V1 client
     kwargs[CONF_VERIFY_SSL] = conf[CONF_VERIFY_SSL]
@@ -390,9 +420,17 @@ def get_influx_connection(conf, test_write=False, test_read=False):
         kwargs[CONF_SSL] = conf[CONF_SSL]
 
     influx = InfluxDBClient(**kwargs)
+    use_gzip = conf.get(CONF_GZIP, False)
+    write_params = {"db": conf.get(CONF_DB_NAME)}
+    if precision:
+        write_params["precision"] = precision
 
     def write_v1(json):
         """Write data to V1 influx."""
+        if use_gzip:
+            write_lines_v1(points_to_lines(json, precision))
+            return
+
         try:
             influx.write_points(json, time_precision=precision)
         except (
@@ -406,6 +444,34 @@ def get_influx_connection(conf, test_write=False, test_read=False):
                 raise ValueError(WRITE_ERROR % (json, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
+    def write_lines_v1(lines):
+        """Write line protocol lines to V1 influx, compressed if configured."""
+        data = "".join(f"{line}\n" for line in lines).encode("utf-8")
+        headers = {"Content-Type": "application/octet-stream"}
+        if use_gzip:
+            data = gzip.compress(data)
+            headers["Content-Encoding"] = "gzip"
+
+        try:
+            influx.request(
+                "write",
+                method="POST",
+                params=write_params,
+                data=data,
+                expected_response_code=204,
+                headers=headers,
+            )
+        except (
+            requests.exceptions.RequestException,
+            exceptions.InfluxDBServerError,
+            OSError,
+        ) as exc:
+            raise ConnectionError(CONNECTION_ERROR % exc) from exc
+        except exceptions.InfluxDBClientError as exc:
+            if exc.code == CODE_INVALID_INPUTS:
+                raise ValueError(WRITE_ERROR % (lines, exc)) from exc
+            raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
+
     def query_v1(query, database=None):
         """Query V1 influx."""
         try:
@@ -432,7 +498,7 @@ def get_influx_connection(conf, test_write=False, test_read=False):
     if test_read:
         databases = [db["name"] for db in query_v1(TEST_QUERY_V1)]
 
-    return InfluxClient(databases, write_v1, query_v1, close_v1)
+    return InfluxClient(databases, write_v1, query_v1, close_v1, write_lines_v1)
 
 
 def setup(hass, config):
@@ -447,7 +513,15 @@ def setup(hass, config):
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    retry_buffer = None
+    if conf[CONF_RETRY_BUFFER_SIZE]:
+        retry_buffer = RetryBuffer(
+            hass.config.path(STORAGE_DIR, RETRY_BUFFER_FILE),
+            conf[CONF_RETRY_BUFFER_SIZE] * 1024 * 1024,
+        )
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, event_to_json, max_tries, retry_buffer, conf.get(CONF_PRECISION)
+    )
     instance.start()
 
     def shutdown(event):
@@ -464,15 +538,28 @@ def setup(hass, config):
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(
+        self, hass, influx, event_to_json, max_tries, retry_buffer=None, precision=None
+    ):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue = queue.Queue()
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
+        self.retry_buffer = retry_buffer
+        self.precision = precision
         self.write_errors = 0
         self.shutdown = False
+        self._batch_queued_at = None
+        self._next_drain = 0.0
+        self.events_written = 0
+        self.events_buffered = 0
+        self.events_dropped = 0
+        self.batches_written = 0
+        self.write_time = 0.0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     def _event_listener(self, event):
@@ -485,6 +572,23 @@ class InfluxThread(threading.Thread):
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return throughput and lag statistics of the writer."""
+        return {
+            "queue_size": self.queue.qsize(),
+            "events_written": self.events_written,
+            "events_buffered": self.events_buffered,
+            "events_dropped": self.events_dropped,
+            "batches_written": self.batches_written,
+            "average_write_time": self.write_time / self.batches_written
+            if self.batches_written
+            else 0.0,
+            "last_lag": self.last_lag,
+            "max_lag": self.max_lag,
+            "retry_buffer_size": self.retry_buffer.size if self.retry_buffer else 0,
+        }
+
     def get_events_json(self):
         """Return a batch of events formatted for writing."""
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
@@ -493,6 +597,7 @@ class InfluxThread(threading.Thread):
         json = []
 
         dropped = 0
+        self._batch_queued_at = None
 
         try:
             while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
@@ -506,10 +611,13 @@ class InfluxThread(threading.Thread):
                     timestamp, event = item
                     age = time.monotonic() - timestamp
 
-                    if age < queue_seconds:
+                    # Old events are kept when they can be buffered on disk
+                    if age < queue_seconds or self.retry_buffer is not None:
                         event_json = self.event_to_json(event)
                         if event_json:
                             json.append(event_json)
+                            if self._batch_queued_at is None:
+                                self._batch_queued_at = timestamp
                     else:
                         dropped += 1
 
@@ -517,15 +625,34 @@ class InfluxThread(threading.Thread):
             pass
 
         if dropped:
+            self.events_dropped += dropped
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
 
         return count, json
 
+    def _record_write(self, events, started):
+        """Update the statistics after a successful write."""
+        now = time.monotonic()
+        self.events_written += events
+        self.batches_written += 1
+        self.write_time += now - started
+        if self._batch_queued_at is not None:
+            self.last_lag = now - self._batch_queued_at
+            self.max_lag = max(self.max_lag, self.last_lag)
+
     def write_to_influxdb(self, json):
         """Write preprocessed events to influxdb, with retry."""
+        if self.retry_buffer is not None and self.retry_buffer.pending:
+            # Queue behind the buffered events to keep them in order
+            self._buffer_events(json)
+            self._drain_retry_buffer()
+            return
+
         for retry in range(self.max_tries + 1):
             try:
+                started = time.monotonic()
                 self.influx.write(json)
+                self._record_write(len(json), started)
 
                 if self.write_errors:
                     _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
@@ -539,13 +666,55 @@ class InfluxThread(threading.Thread):
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
+                elif self.retry_buffer is not None:
+                    _LOGGER.error(BUFFERED_MESSAGE, err)
+                    self._next_drain = time.monotonic() + RETRY_DELAY
+                    self._buffer_events(json)
                 else:
                     if not self.write_errors:
                         _LOGGER.error(err)
                     self.write_errors += len(json)
 
+    def _buffer_events(self, json):
+        """Store events in the retry buffer."""
+        if self.retry_buffer.append(points_to_lines(json, self.precision)):
+            self.events_buffered += len(json)
+        else:
+            self.events_dropped += len(json)
+            _LOGGER.warning(BUFFER_FULL_MESSAGE, len(json))
+
+    def _drain_retry_buffer(self):
+        """Write buffered events in order until the buffer is empty."""
+        if time.monotonic() < self._next_drain:
+            return
+
+        while self.retry_buffer.pending and not self.shutdown:
+            lines, size = self.retry_buffer.peek(BATCH_BUFFER_SIZE)
+            if not lines:
+                self.retry_buffer.clear()
+                break
+
+            try:
+                started = time.monotonic()
+                self.influx.write_lines(lines)
+            except ValueError as err:
+                _LOGGER.error(err)
+            except ConnectionError:
+                self._next_drain = time.monotonic() + RETRY_DELAY
+                return
+            else:
+                self.write_time += time.monotonic() - started
+                self.events_written += len(lines)
+                self.batches_written += 1
+                _LOGGER.debug(DRAINED_MESSAGE, len(lines))
+
+            self.retry_buffer.consume(size)
+
     def run(self):
         """Process incoming events."""
+        if self.retry_buffer is not None:
+            self._drain_retry_buffer()
+
         while not self.shutdown:
             count, json = self.get_events_json()
             if json:
@@ -30,6 +30,8 @@ CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
+CONF_GZIP = "gzip"
+CONF_RETRY_BUFFER_SIZE = "retry_buffer_size"
 
 CONF_LANGUAGE = "language"
 CONF_QUERIES = "queries"
@@ -75,6 +77,7 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+RETRY_BUFFER_FILE = "influxdb.retry_buffer"
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -117,6 +120,9 @@ RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
+BUFFERED_MESSAGE = "%s Buffering events on disk until InfluxDB is reachable."
+BUFFER_FULL_MESSAGE = "Retry buffer is full, dropped %d events."
+DRAINED_MESSAGE = "Wrote %d buffered events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
@@ -0,0 +1,77 @@
+"""Encode points in the InfluxDB line protocol."""
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from .const import (
+    INFLUX_CONF_FIELDS,
+    INFLUX_CONF_MEASUREMENT,
+    INFLUX_CONF_TAGS,
+    INFLUX_CONF_TIME,
+)
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Number of microseconds per timestamp unit for each precision
+PRECISION_DIVISORS = {"s": 1000000, "ms": 1000, "us": 1}
+
+_MEASUREMENT_ESCAPE = str.maketrans({",": "\\,", " ": "\\ ", "\n": "\\n"})
+_KEY_ESCAPE = str.maketrans({",": "\\,", "=": "\\=", " ": "\\ ", "\n": "\\n"})
+_STRING_ESCAPE = str.maketrans({'"': '\\"', "\\": "\\\\", "\n": "\\n"})
+
+
+def _format_timestamp(value: Any, precision: Optional[str]) -> str:
+    """Return a timestamp as an integer in the precision unit."""
+    if isinstance(value, int):
+        return str(value)
+
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - EPOCH
+    micros = (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+    if precision in PRECISION_DIVISORS:
+        return str(micros // PRECISION_DIVISORS[precision])
+    return str(micros * 1000)
+
+
+def _format_field(value: Any) -> str:
+    """Return a field value in line protocol notation."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return f"{value}i"
+    if isinstance(value, float):
+        return repr(value)
+    return f'"{str(value).translate(_STRING_ESCAPE)}"'
+
+
+def point_to_line(point: Dict[str, Any], precision: Optional[str] = None) -> str:
+    """Encode a point as created by event_to_json as a line protocol line."""
+    parts = [str(point[INFLUX_CONF_MEASUREMENT]).translate(_MEASUREMENT_ESCAPE)]
+
+    tags = point[INFLUX_CONF_TAGS]
+    for key in sorted(tags):
+        value = str(tags[key])
+        if value:
+            parts.append(
+                f",{str(key).translate(_KEY_ESCAPE)}={value.translate(_KEY_ESCAPE)}"
+            )
+
+    fields = ",".join(
+        f"{str(key).translate(_KEY_ESCAPE)}={_format_field(value)}"
+        for key, value in sorted(point[INFLUX_CONF_FIELDS].items())
+    )
+    parts.append(f" {fields}")
+
+    timestamp = point.get(INFLUX_CONF_TIME)
+    if timestamp is not None:
+        parts.append(f" {_format_timestamp(timestamp, precision)}")
+
+    return "".join(parts)
+
+
+def points_to_lines(
+    points: Iterable[Dict[str, Any]], precision: Optional[str] = None
+) -> List[str]:
+    """Encode a batch of points as line protocol lines."""
+    return [point_to_line(point, precision) for point in points]
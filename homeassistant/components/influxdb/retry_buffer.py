@@ -0,0 +1,85 @@
+"""Size bounded on-disk buffer for points that could not be written."""
+import logging
+import os
+from typing import List, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RetryBuffer:
+    """Append only file of line protocol lines, drained in order.
+
+    The read offset is not persisted. If Home Assistant stops while the
+    buffer is being drained, the already written lines are sent again on the
+    next start, which InfluxDB treats as an overwrite of the same points.
+    """
+
+    def __init__(self, path: str, max_size: int) -> None:
+        """Initialize the buffer, picking up lines left by a previous run."""
+        self.path = path
+        self.max_size = max_size
+        self._offset = 0
+        try:
+            self._size = os.path.getsize(path)
+        except OSError:
+            self._size = 0
+
+    @property
+    def pending(self) -> bool:
+        """Return if there are lines waiting to be written."""
+        return self._offset < self._size
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes waiting to be written."""
+        return self._size - self._offset
+
+    def append(self, lines: List[str]) -> bool:
+        """Append lines to the buffer, return False if they did not fit."""
+        data = "".join(f"{line}\n" for line in lines).encode("utf-8")
+        if self._size + len(data) > self.max_size:
+            return False
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "ab") as fil:
+                fil.write(data)
+        except OSError as err:
+            _LOGGER.error("Unable to write to InfluxDB retry buffer: %s", err)
+            return False
+
+        self._size += len(data)
+        return True
+
+    def peek(self, max_lines: int) -> Tuple[List[str], int]:
+        """Return the oldest lines and the number of bytes they occupy."""
+        lines: List[str] = []
+        consumed = 0
+        try:
+            with open(self.path, "rb") as fil:
+                fil.seek(self._offset)
+                for raw in fil:
+                    lines.append(raw.decode("utf-8").rstrip("\n"))
+                    consumed += len(raw)
+                    if len(lines) >= max_lines:
+                        break
+        except OSError as err:
+            _LOGGER.error("Unable to read InfluxDB retry buffer: %s", err)
+            self.clear()
+        return lines, consumed
+
+    def consume(self, size: int) -> None:
+        """Mark bytes returned by peek as written."""
+        self._offset += size
+        if self._offset >= self._size:
+            self.clear()
+
+    def clear(self) -> None:
+        """Remove the buffer file."""
+        self._offset = self._size = 0
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            _LOGGER.error("Unable to remove InfluxDB retry buffer: %s", err)
@@ -46,6 +46,7 @@ from homeassistant.helpers.integration_platform import (
 )
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
+from homeassistant.util.executor import EXECUTOR_DB_READ
 
 ENTITY_ID_JSON_TEMPLATE = '"entity_id": "{}"'
 ENTITY_ID_JSON_EXTRACT = re.compile('"entity_id": "([^"]+)"')
@@ -247,7 +248,9 @@ class LogbookView(HomeAssistantView):
                 )
             )
 
-        return await hass.async_add_executor_job(json_events)
+        return await hass.async_add_executor_partition_job(
+            EXECUTOR_DB_READ, json_events
+        )
 
 
 def humanify(hass, events, entity_attr_cache, context_lookup):
@@ -0,0 +1,77 @@
+"""Monitor the health of the Home Assistant event loop."""
+from typing import Dict
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, callback
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType, HomeAssistantType
+
+from .monitor import LoopMonitor
+
+DOMAIN = "loop_monitor"
+
+CONF_INTERVAL = "interval"
+CONF_THRESHOLD = "threshold"
+CONF_MAX_STALLS = "max_stalls"
+
+DEFAULT_INTERVAL = 1.0
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MAX_STALLS = 50
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(CONF_INTERVAL, default=DEFAULT_INTERVAL): vol.All(
+                    vol.Coerce(float), vol.Range(min=0.01)
+                ),
+                vol.Optional(CONF_THRESHOLD, default=DEFAULT_THRESHOLD): vol.All(
+                    vol.Coerce(float), vol.Range(min=0.01)
+                ),
+                vol.Optional(
+                    CONF_MAX_STALLS, default=DEFAULT_MAX_STALLS
+                ): cv.positive_int,
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+async def async_setup(hass: HomeAssistantType, config: ConfigType) -> bool:
+    """Set up the event loop monitor."""
+    conf = config.get(DOMAIN, CONFIG_SCHEMA({DOMAIN: {}})[DOMAIN])
+
+    monitor = hass.data[DOMAIN] = LoopMonitor(
+        hass.loop, conf[CONF_INTERVAL], conf[CONF_THRESHOLD], conf[CONF_MAX_STALLS]
+    )
+    monitor.start()
+
+    @callback
+    def _async_stop_monitor(_: Event) -> None:
+        """Stop the monitor when Home Assistant stops."""
+        monitor.stop()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_monitor)
+
+    hass.components.websocket_api.async_register_command(websocket_stats)
+    return True
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "loop_monitor/stats"})
+@callback
+def websocket_stats(
+    hass: HomeAssistantType, connection: websocket_api.ActiveConnection, msg: Dict
+) -> None:
+    """Return the event loop statistics and the recent stalls."""
+    connection.send_result(
+        msg["id"],
+        {
+            "loop": hass.data[DOMAIN].as_dict(),
+            "executors": hass.executors.as_dict(),
+        },
+    )
@@ -0,0 +1,148 @@
+"""Monitor the latency of the event loop and capture what blocks it."""
+import asyncio
+from collections import deque
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Deque, Dict, List, Optional
+
+from homeassistant.helpers.frame import MissingIntegrationFrame, find_integration_frame
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of stack frames stored with each stall
+STACK_DEPTH = 15
+
+
+class LoopMonitor:
+    """Measure the scheduling lag of an event loop from a watchdog thread."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        interval: float,
+        threshold: float,
+        max_stalls: int,
+    ) -> None:
+        """Initialize the monitor."""
+        self._loop = loop
+        self.interval = interval
+        self.threshold = threshold
+        self._loop_thread_id: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self.samples = 0
+        self.last_lag = 0.0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+        self.stalls: Deque[Dict[str, Any]] = deque(maxlen=max_stalls)
+
+    def start(self) -> None:
+        """Start the watchdog thread.
+
+        Must be called from the event loop thread.
+        """
+        self._loop_thread_id = threading.get_ident()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="LoopMonitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watchdog thread."""
+        self._stop_event.set()
+        self._thread = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the collected statistics."""
+        return {
+            "samples": self.samples,
+            "last_lag": self.last_lag,
+            "average_lag": self.total_lag / self.samples if self.samples else 0.0,
+            "max_lag": self.max_lag,
+            "stalls": list(self.stalls),
+        }
+
+    def _run(self) -> None:
+        """Sample the loop until stopped."""
+        while not self._stop_event.is_set():
+            lag = self._sample()
+            if lag is None:
+                return
+            self.samples += 1
+            self.last_lag = lag
+            self.total_lag += lag
+            self.max_lag = max(self.max_lag, lag)
+            self._stop_event.wait(self.interval)
+
+    def _sample(self) -> Optional[float]:
+        """Measure how long it takes the loop to run a scheduled callback."""
+        responded = threading.Event()
+        ran_at = 0.0
+
+        def mark() -> None:
+            """Record when the loop got to run the callback."""
+            nonlocal ran_at
+            ran_at = time.monotonic()
+            responded.set()
+
+        scheduled = time.monotonic()
+        try:
+            self._loop.call_soon_threadsafe(mark)
+        except RuntimeError:
+            # Loop is closed
+            return None
+
+        if responded.wait(self.threshold):
+            return ran_at - scheduled
+
+        stall = self._capture_stall()
+
+        while not responded.wait(self.interval):
+            if self._stop_event.is_set():
+                return None
+
+        lag = ran_at - scheduled
+        if stall is not None:
+            stall["duration"] = lag
+            self.stalls.append(stall)
+            _LOGGER.warning(
+                "Event loop was blocked for %.3fs by %s at %s",
+                lag,
+                stall["integration"] or "unknown code",
+                stall["stack"][-1] if stall["stack"] else "unknown location",
+            )
+        return lag
+
+    def _capture_stall(self) -> Optional[Dict[str, Any]]:
+        """Capture the stack of the loop thread while it is blocked."""
+        frame = sys._current_frames().get(  # pylint: disable=protected-access
+            self._loop_thread_id  # type: ignore
+        )
+        if frame is None:
+            return None
+
+        stack = traceback.extract_stack(frame)
+        del frame
+
+        return {
+            "time": dt_util.utcnow().isoformat(),
+            "integration": integration_from_stack(stack),
+            "stack": [
+                f"{summary.filename}:{summary.lineno} ({summary.name})"
+                for summary in stack[-STACK_DEPTH:]
+            ],
+        }
+
+
+def integration_from_stack(stack: List[traceback.FrameSummary]) -> Optional[str]:
+    """Return the integration of the most recent integration frame in a stack."""
+    try:
+        _, integration, _ = find_integration_frame(stack)
+    except MissingIntegrationFrame:
+        return None
+    return integration
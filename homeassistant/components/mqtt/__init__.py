@@ -1,6 +1,7 @@
 """Support for MQTT message handling."""
 import asyncio
-from functools import lru_cache, partial, wraps
+from collections import deque
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import json
@@ -9,7 +10,7 @@ from operator import attrgetter
 import os
 import ssl
 import time
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Deque, Optional, Union
 
 import attr
 import certifi
@@ -83,6 +84,7 @@ from .discovery import (
 )
 from .models import Message, MessageCallbackType, PublishPayloadType
 from .subscription import async_subscribe_topics, async_unsubscribe_topics
+from .trie import SubscriptionTrie
 from .util import _VALID_QOS_SCHEMA, valid_publish_topic, valid_subscribe_topic
 
 _LOGGER = logging.getLogger(__name__)
@@ -629,7 +631,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     callback: MessageCallbackType = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str = attr.ib(default="utf-8")
@@ -652,7 +653,7 @@ class MQTT:
         self.hass = hass
         self.config_entry = config_entry
         self.conf = conf
-        self.subscriptions: List[Subscription] = []
+        self.subscriptions = SubscriptionTrie()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -660,6 +661,8 @@ class MQTT:
         self._paho_lock = asyncio.Lock()
 
         self._pending_operations = {}
+        self._pending_messages: Deque = deque()
+        self._handle_messages_scheduled = False
 
         if self.hass.state == CoreState.running:
             self._ha_started.set()
@@ -838,11 +841,8 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), msg_callback, qos, encoding
-        )
-        self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        subscription = Subscription(topic, msg_callback, qos, encoding)
+        self.subscriptions.add(subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -855,9 +855,8 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if self.subscriptions.has_filter(topic):
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
@@ -917,12 +916,8 @@ class MQTT:
             result_code,
         )
 
-        # Group subscriptions to only re-subscribe once for each topic.
-        keyfunc = attrgetter("topic")
-        for topic, subs in groupby(sorted(self.subscriptions, key=keyfunc), keyfunc):
-            # Re-subscribe with the highest requested qos
-            max_qos = max(subscription.qos for subscription in subs)
-            self.hass.add_job(self._async_perform_subscription, topic, max_qos)
+        # The subscriptions are changed by the event loop, walk them there
+        self.hass.loop.call_soon_threadsafe(self._async_restore_subscriptions)
 
         if (
             CONF_BIRTH_MESSAGE in self.conf
@@ -942,17 +937,41 @@ class MQTT:
             birth_message = Message(**self.conf[CONF_BIRTH_MESSAGE])
             self.hass.loop.create_task(publish_birth_message(birth_message))
 
+    @callback
+    def _async_restore_subscriptions(self) -> None:
+        """Re-subscribe to the topics of all subscriptions after connecting."""
+        # Group subscriptions to only re-subscribe once for each topic.
+        keyfunc = attrgetter("topic")
+        for topic, subs in groupby(sorted(self.subscriptions, key=keyfunc), keyfunc):
+            # Re-subscribe with the highest requested qos
+            max_qos = max(subscription.qos for subscription in subs)
+            self.hass.async_create_task(
+                self._async_perform_subscription(topic, max_qos)
+            )
+
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        Messages are queued and handled in batches, waking up the event loop
+        once for all messages received until it gets to them.
+        """
+        self._pending_messages.append(msg)
+        if not self._handle_messages_scheduled:
+            self._handle_messages_scheduled = True
+            self.hass.loop.call_soon_threadsafe(self._mqtt_handle_messages)
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+    @callback
+    def _mqtt_handle_messages(self) -> None:
+        """Handle the messages received since the last batch."""
+        # Reset before draining so a message queued meanwhile schedules a batch
+        self._handle_messages_scheduled = False
+        pending = self._pending_messages
+        while pending:
+            msg = pending.popleft()
+            try:
+                self._mqtt_handle_message(msg)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error handling message on %s", msg.topic)
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
@@ -964,14 +983,21 @@ class MQTT:
         )
         timestamp = dt_util.utcnow()
 
-        subscriptions = self._matching_subscriptions(msg.topic)
+        subscriptions = self.subscriptions.match(msg.topic)
+        # Subscribers share the decoded payload, so templates rendering it
+        # share its parsed JSON too
+        decoded = {}
 
         for subscription in subscriptions:
 
             payload: SubscribePayloadType = msg.payload
             if subscription.encoding is not None:
                 try:
-                    payload = msg.payload.decode(subscription.encoding)
+                    payload = decoded.get(subscription.encoding)
+                    if payload is None:
+                        payload = decoded[subscription.encoding] = msg.payload.decode(
+                            subscription.encoding
+                        )
                 except (AttributeError, UnicodeDecodeError):
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
@@ -1062,16 +1088,6 @@ def _raise_on_error(result_code: int) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 class MqttAttributes(Entity):
     """Mixin used for platforms that support JSON attributes."""
 
@@ -41,7 +41,11 @@ from . import (
     subscription,
 )
 from .debug_info import log_messages
-from .discovery import MQTT_DISCOVERY_NEW, clear_discovery_hash
+from .discovery import (
+    MQTT_DISCOVERY_NEW,
+    async_batch_add_entities,
+    clear_discovery_hash,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -81,6 +85,7 @@ async def async_setup_platform(
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up MQTT binary sensor dynamically through MQTT discovery."""
+    async_add_entities = async_batch_add_entities(hass, async_add_entities)
 
     async def async_discover(discovery_payload):
         """Discover and add a MQTT binary sensor."""
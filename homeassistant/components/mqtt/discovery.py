@@ -8,6 +8,7 @@ import time
 
 from homeassistant.components import mqtt
 from homeassistant.const import CONF_DEVICE, CONF_PLATFORM
+from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import HomeAssistantType
 from homeassistant.loader import async_get_mqtt
@@ -53,6 +54,9 @@ MQTT_DISCOVERY_UPDATED = "mqtt_discovery_updated_{}"
 MQTT_DISCOVERY_NEW = "mqtt_discovery_new_{}_{}"
 LAST_DISCOVERY = "mqtt_last_discovery"
 
+# Seconds discovery messages are buffered before they are processed together
+DISCOVERY_BATCH_WINDOW = 0.05
+
 TOPIC_BASE = "~"
 
 
@@ -70,18 +74,90 @@ class MQTTConfig(dict):
     """Dummy class to allow adding attributes."""
 
 
+def _parse_discovery_payload(topic, object_id, payload):
+    """Parse a discovery payload, expand abbreviations and the topic base."""
+    if payload:
+        try:
+            payload = json.loads(payload)
+        except ValueError:
+            _LOGGER.warning("Unable to parse JSON %s: '%s'", object_id, payload)
+            return None
+
+    payload = MQTTConfig(payload)
+
+    for key in list(payload.keys()):
+        abbreviated_key = key
+        key = ABBREVIATIONS.get(key, key)
+        payload[key] = payload.pop(abbreviated_key)
+
+    if CONF_DEVICE in payload:
+        device = payload[CONF_DEVICE]
+        for key in list(device.keys()):
+            abbreviated_key = key
+            key = DEVICE_ABBREVIATIONS.get(key, key)
+            device[key] = device.pop(abbreviated_key)
+
+    if TOPIC_BASE in payload:
+        base = payload.pop(TOPIC_BASE)
+        for key, value in payload.items():
+            if isinstance(value, str) and value:
+                if value[0] == TOPIC_BASE and key.endswith("topic"):
+                    payload[key] = f"{base}{value[1:]}"
+                if value[-1] == TOPIC_BASE and key.endswith("topic"):
+                    payload[key] = f"{value[:-1]}{base}"
+
+    return payload
+
+
+@callback
+def async_batch_add_entities(hass: HomeAssistantType, async_add_entities):
+    """Return an async_add_entities adding entities in bulk.
+
+    Entities added in the same loop iteration, like those of a discovery
+    batch, are passed to async_add_entities in one call.
+    """
+    pending = []
+
+    @callback
+    def async_add_pending():
+        """Add the entities collected since the last call."""
+        entities = pending.copy()
+        pending.clear()
+        async_add_entities(entities)
+
+    @callback
+    def async_add(new_entities, update_before_add=False):
+        """Collect entities to add."""
+        if update_before_add:
+            async_add_entities(new_entities, update_before_add)
+            return
+        if not pending:
+            hass.loop.call_soon(async_add_pending)
+        pending.extend(new_entities)
+
+    return async_add
+
+
 async def async_start(
     hass: HomeAssistantType, discovery_topic, config_entry=None
 ) -> bool:
-    """Start MQTT Discovery."""
-    mqtt_integrations = {}
+    """Start MQTT Discovery.
 
-    async def async_entity_message_received(msg):
-        """Process the received message."""
+    Discovery messages are buffered for DISCOVERY_BATCH_WINDOW seconds and
+    processed in batches. Only the last message for an entity in a batch is
+    processed, and a payload identical to the one last applied is ignored.
+    """
+    mqtt_integrations = {}
+    pending = {}
+    applied_payloads = {}
+    batch_task = None
+
+    @callback
+    def async_entity_message_received(msg):
+        """Buffer the received message."""
+        nonlocal batch_task
         hass.data[LAST_DISCOVERY] = time.time()
-        payload = msg.payload
-        topic = msg.topic
-        topic_trimmed = topic.replace(f"{discovery_topic}/", "", 1)
+        topic_trimmed = msg.topic.replace(f"{discovery_topic}/", "", 1)
         match = TOPIC_MATCHER.match(topic_trimmed)
 
         if not match:
@@ -93,69 +169,78 @@ async def async_start(
             _LOGGER.warning("Integration %s is not supported", component)
             return
 
-        if payload:
-            try:
-                payload = json.loads(payload)
-            except ValueError:
-                _LOGGER.warning("Unable to parse JSON %s: '%s'", object_id, payload)
-                return
-
-        payload = MQTTConfig(payload)
-
-        for key in list(payload.keys()):
-            abbreviated_key = key
-            key = ABBREVIATIONS.get(key, key)
-            payload[key] = payload.pop(abbreviated_key)
-
-        if CONF_DEVICE in payload:
-            device = payload[CONF_DEVICE]
-            for key in list(device.keys()):
-                abbreviated_key = key
-                key = DEVICE_ABBREVIATIONS.get(key, key)
-                device[key] = device.pop(abbreviated_key)
-
-        if TOPIC_BASE in payload:
-            base = payload.pop(TOPIC_BASE)
-            for key, value in payload.items():
-                if isinstance(value, str) and value:
-                    if value[0] == TOPIC_BASE and key.endswith("topic"):
-                        payload[key] = f"{base}{value[1:]}"
-                    if value[-1] == TOPIC_BASE and key.endswith("topic"):
-                        payload[key] = f"{value[:-1]}{base}"
-
         # If present, the node_id will be included in the discovered object id
         discovery_id = " ".join((node_id, object_id)) if node_id else object_id
         discovery_hash = (component, discovery_id)
 
-        if payload:
-            # Attach MQTT topic to the payload, used for debug prints
-            setattr(payload, "__configuration_source__", f"MQTT (topic: '{topic}')")
-            discovery_data = {
-                ATTR_DISCOVERY_HASH: discovery_hash,
-                ATTR_DISCOVERY_PAYLOAD: payload,
-                ATTR_DISCOVERY_TOPIC: topic,
-            }
-            setattr(payload, "discovery_data", discovery_data)
+        # A newer message replaces the one waiting for the batch
+        pending.pop(discovery_hash, None)
+        pending[discovery_hash] = (msg, object_id)
+        if batch_task is None:
+            batch_task = hass.async_create_task(async_process_batch())
 
-            payload[CONF_PLATFORM] = "mqtt"
+    async def async_process_batch():
+        """Process the messages received during the batch window."""
+        nonlocal batch_task
+        await asyncio.sleep(DISCOVERY_BATCH_WINDOW)
+        batch_task = None
+        batch = list(pending.items())
+        pending.clear()
 
         if ALREADY_DISCOVERED not in hass.data:
             hass.data[ALREADY_DISCOVERED] = {}
-        if discovery_hash in hass.data[ALREADY_DISCOVERED]:
-            # Dispatch update
-            _LOGGER.info(
-                "Component has already been discovered: %s %s, sending update",
-                component,
-                discovery_id,
-            )
-            async_dispatcher_send(
-                hass, MQTT_DISCOVERY_UPDATED.format(discovery_hash), payload
-            )
-        elif payload:
-            # Add component
-            _LOGGER.info("Found new component: %s %s", component, discovery_id)
-            hass.data[ALREADY_DISCOVERED][discovery_hash] = None
+        discovered = {}
+
+        for discovery_hash, (msg, object_id) in batch:
+            component, discovery_id = discovery_hash
+            if (
+                discovery_hash in hass.data[ALREADY_DISCOVERED]
+                and applied_payloads.get(discovery_hash) == msg.payload
+            ):
+                _LOGGER.debug(
+                    "Ignoring unchanged discovery payload: %s %s",
+                    component,
+                    discovery_id,
+                )
+                continue
+
+            topic = msg.topic
+            payload = _parse_discovery_payload(topic, object_id, msg.payload)
+            if payload is None:
+                continue
+
+            if payload:
+                # Attach MQTT topic to the payload, used for debug prints
+                setattr(payload, "__configuration_source__", f"MQTT (topic: '{topic}')")
+                discovery_data = {
+                    ATTR_DISCOVERY_HASH: discovery_hash,
+                    ATTR_DISCOVERY_PAYLOAD: payload,
+                    ATTR_DISCOVERY_TOPIC: topic,
+                }
+                setattr(payload, "discovery_data", discovery_data)
+
+                payload[CONF_PLATFORM] = "mqtt"
+                applied_payloads[discovery_hash] = msg.payload
+            else:
+                applied_payloads.pop(discovery_hash, None)
+
+            if discovery_hash in hass.data[ALREADY_DISCOVERED]:
+                # Dispatch update
+                _LOGGER.info(
+                    "Component has already been discovered: %s %s, sending update",
+                    component,
+                    discovery_id,
+                )
+                async_dispatcher_send(
+                    hass, MQTT_DISCOVERY_UPDATED.format(discovery_hash), payload
+                )
+            elif payload:
+                # Add component
+                _LOGGER.info("Found new component: %s %s", component, discovery_id)
+                hass.data[ALREADY_DISCOVERED][discovery_hash] = None
+                discovered.setdefault(component, []).append(payload)
 
+        for component, payloads in discovered.items():
             config_entries_key = f"{component}.mqtt"
             async with hass.data[DATA_CONFIG_ENTRY_LOCK]:
                 if config_entries_key not in hass.data[CONFIG_ENTRY_IS_SETUP]:
@@ -177,9 +262,10 @@ async def async_start(
                         )
                     hass.data[CONFIG_ENTRY_IS_SETUP].add(config_entries_key)
 
-            async_dispatcher_send(
-                hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), payload
-            )
+            for payload in payloads:
+                async_dispatcher_send(
+                    hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), payload
+                )
 
     hass.data[DATA_CONFIG_ENTRY_LOCK] = asyncio.Lock()
     hass.data[DATA_CONFIG_FLOW_LOCK] = asyncio.Lock()
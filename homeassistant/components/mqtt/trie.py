@@ -0,0 +1,129 @@
+"""Match MQTT topics against subscriptions with a topic filter trie."""
+from itertools import count
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class _TrieNode:
+    """Level of a topic filter with the subscriptions ending at it."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.subscriptions: List[Tuple[int, Any]] = []
+
+
+class SubscriptionTrie:
+    """Subscriptions indexed by the levels of their topic filter.
+
+    Subscriptions are added and removed incrementally. Matching a topic only
+    visits the levels of the topic, its + and # wildcards, and returns the
+    matching subscriptions in the order they were added.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TrieNode()
+        self._filters: Dict[str, _TrieNode] = {}
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        """Return the number of subscriptions."""
+        return sum(len(node.subscriptions) for node in self._filters.values())
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the subscriptions."""
+        for node in self._filters.values():
+            for _, subscription in node.subscriptions:
+                yield subscription
+
+    def __contains__(self, subscription: Any) -> bool:
+        """Return if a subscription was added and not removed."""
+        node = self._filters.get(subscription.topic)
+        return node is not None and any(
+            item is subscription for _, item in node.subscriptions
+        )
+
+    def has_filter(self, topic_filter: str) -> bool:
+        """Return if there are subscriptions to a topic filter."""
+        return topic_filter in self._filters
+
+    def add(self, subscription: Any) -> None:
+        """Add a subscription."""
+        node = self._filters.get(subscription.topic)
+        if node is None:
+            node = self._root
+            for level in subscription.topic.split("/"):
+                child = node.children.get(level)
+                if child is None:
+                    child = node.children[level] = _TrieNode()
+                node = child
+            self._filters[subscription.topic] = node
+        node.subscriptions.append((next(self._sequence), subscription))
+
+    def remove(self, subscription: Any) -> None:
+        """Remove a subscription, raise ValueError if it was not added."""
+        topic_filter = subscription.topic
+        node = self._filters.get(topic_filter)
+        if node is not None:
+            for index, (_, item) in enumerate(node.subscriptions):
+                if item is subscription:
+                    del node.subscriptions[index]
+                    break
+            else:
+                node = None
+        if node is None:
+            raise ValueError(f"Subscription to {topic_filter} not found")
+        if node.subscriptions:
+            return
+
+        # Prune the levels no other topic filter uses
+        del self._filters[topic_filter]
+        path = [self._root]
+        levels = topic_filter.split("/")
+        for level in levels[:-1]:
+            path.append(path[-1].children[level])
+        for parent, level in zip(reversed(path), reversed(levels)):
+            child = parent.children[level]
+            if child.children or child.subscriptions:
+                break
+            del parent.children[level]
+
+    def match(self, topic: str) -> List[Any]:
+        """Return the subscriptions matching a topic."""
+        # Wildcards at the first level don't match topics starting with $
+        first_wildcard = not topic.startswith("$")
+        found: List[Tuple[int, Any]] = []
+        nodes = [self._root]
+        for level in topic.split("/"):
+            next_nodes = []
+            for node in nodes:
+                children = node.children
+                if not children:
+                    continue
+                if first_wildcard or node is not self._root:
+                    multi_level = children.get("#")
+                    if multi_level is not None:
+                        found.extend(multi_level.subscriptions)
+                    single_level = children.get("+")
+                    if single_level is not None:
+                        next_nodes.append(single_level)
+                child = children.get(level)
+                if child is not None:
+                    next_nodes.append(child)
+            nodes = next_nodes
+            if not nodes:
+                break
+        else:
+            for node in nodes:
+                found.extend(node.subscriptions)
+                # A # filter also matches its parent level
+                multi_level = node.children.get("#")
+                if multi_level is not None:
+                    found.extend(multi_level.subscriptions)
+
+        if len(found) > 1:
+            found.sort(key=itemgetter(0))
+        return [subscription for _, subscription in found]
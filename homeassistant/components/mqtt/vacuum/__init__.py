@@ -6,6 +6,7 @@ import voluptuous as vol
 from homeassistant.components.mqtt import ATTR_DISCOVERY_HASH
 from homeassistant.components.mqtt.discovery import (
     MQTT_DISCOVERY_NEW,
+    async_batch_add_entities,
     clear_discovery_hash,
 )
 from homeassistant.components.vacuum import DOMAIN
@@ -39,6 +40,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up MQTT vacuum dynamically through MQTT discovery."""
+    async_add_entities = async_batch_add_entities(hass, async_add_entities)
 
     async def async_discover(discovery_payload):
         """Discover and add a MQTT vacuum."""
@@ -1,8 +1,10 @@
 """Support for Prometheus metrics export."""
+import gzip
 import logging
 import string
+import time
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
 import voluptuous as vol
 
@@ -13,6 +15,7 @@ from homeassistant.components.climate.const import (
     CURRENT_HVAC_ACTIONS,
 )
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http.static import accepted_encodings
 from homeassistant.components.humidifier.const import (
     ATTR_AVAILABLE_MODES,
     ATTR_HUMIDITY,
@@ -35,8 +38,11 @@ from homeassistant.const import (
 from homeassistant.helpers import entityfilter, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
+from homeassistant.util.executor import EXECUTOR_CPU
 from homeassistant.util.temperature import fahrenheit_to_celsius
 
+from .exposition import CachedExposition
+
 _LOGGER = logging.getLogger(__name__)
 
 API_ENDPOINT = "/api/prometheus"
@@ -49,6 +55,7 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_DEFAULT_METRIC = "default_metric"
 CONF_OVERRIDE_METRIC = "override_metric"
+CONF_CACHED_EXPOSITION = "cached_exposition"
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_METRIC): cv.string}
 )
@@ -61,6 +68,7 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_PROM_NAMESPACE): cv.string,
                 vol.Optional(CONF_DEFAULT_METRIC): cv.string,
                 vol.Optional(CONF_OVERRIDE_METRIC): cv.string,
+                vol.Optional(CONF_CACHED_EXPOSITION, default=False): cv.boolean,
                 vol.Optional(CONF_COMPONENT_CONFIG, default={}): vol.Schema(
                     {cv.entity_id: COMPONENT_CONFIG_SCHEMA_ENTRY}
                 ),
@@ -79,9 +87,12 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass, config):
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(prometheus_client))
-
     conf = config[DOMAIN]
+    exposition = CachedExposition() if conf[CONF_CACHED_EXPOSITION] else None
+    hass.http.register_view(
+        PrometheusView(prometheus_client, exposition, conf.get(CONF_PROM_NAMESPACE))
+    )
+
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
     climate_units = hass.config.units.temperature_unit
@@ -94,7 +105,7 @@ def setup(hass, config):
     )
 
     metrics = PrometheusMetrics(
-        prometheus_client,
+        exposition or prometheus_client,
         entity_filter,
         namespace,
         climate_units,
@@ -479,15 +490,53 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli):
+    def __init__(self, prometheus_cli, exposition=None, namespace=None):
         """Initialize Prometheus view."""
         self.prometheus_cli = prometheus_cli
+        self.exposition = exposition
+        self.scrape_metric = "scrape_duration_seconds"
+        if namespace:
+            self.scrape_metric = f"{namespace}_{self.scrape_metric}"
+        self.scrape_duration = 0.0
+        self._cached_version = None
+        self._cached_body = ""
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
-        return web.Response(
-            body=self.prometheus_cli.generate_latest(),
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
+        use_gzip = "gzip" in accepted_encodings(
+            request.headers.get(hdrs.ACCEPT_ENCODING, "")
         )
+        body = await request.app["hass"].async_add_executor_partition_job(
+            EXECUTOR_CPU, self._render, use_gzip
+        )
+
+        response = web.Response(body=body, content_type=CONTENT_TYPE_TEXT_PLAIN)
+        if use_gzip:
+            response.headers[hdrs.CONTENT_ENCODING] = "gzip"
+        return response
+
+    def _render(self, use_gzip):
+        """Render the exposition, runs in the executor."""
+        start = time.perf_counter()
+
+        # The default registry holds the process and platform collectors
+        body = self.prometheus_cli.generate_latest().decode("utf-8")
+        if self.exposition is not None:
+            if self._cached_version != self.exposition.version:
+                self._cached_version, self._cached_body = self.exposition.render()
+            body = self._cached_body + body
+
+        # Expose the cost of the previous scrape, this one is not finished yet
+        body += (
+            f"# HELP {self.scrape_metric} Time spent rendering the previous scrape\n"
+            f"# TYPE {self.scrape_metric} gauge\n"
+            f"{self.scrape_metric} {self.scrape_duration}\n"
+        )
+        data = body.encode("utf-8")
+        if use_gzip:
+            data = gzip.compress(data)
+
+        self.scrape_duration = time.perf_counter() - start
+        return data
@@ -0,0 +1,124 @@
+"""Metrics with a cached text exposition for the Prometheus exporter."""
+import threading
+from typing import Dict, List, Tuple
+
+from prometheus_client.utils import floatToGoString
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+class CachedMetric:
+    """A metric family that keeps the rendered line of each sample."""
+
+    def __init__(
+        self,
+        exposition: "CachedExposition",
+        name: str,
+        documentation: str,
+        metric_type: str,
+    ) -> None:
+        """Initialize the metric."""
+        self.exposition = exposition
+        self.name = name
+        documentation = documentation.replace("\\", r"\\").replace("\n", r"\n")
+        self.header = f"# HELP {name} {documentation}\n# TYPE {name} {metric_type}\n"
+        self.lines: Dict[Tuple, str] = {}
+        self._children: Dict[Tuple, "CachedSample"] = {}
+
+    def labels(self, **labels: str) -> "CachedSample":
+        """Return the sample with the given labels."""
+        key = tuple(sorted((name, str(value)) for name, value in labels.items()))
+        child = self._children.get(key)
+        if child is not None:
+            return child
+
+        label_text = ",".join(
+            f'{name}="{_escape_label_value(value)}"' for name, value in key
+        )
+        with self.exposition.lock:
+            return self._children.setdefault(
+                key, CachedSample(self, key, f"{self.name}{{{label_text}}}")
+            )
+
+
+class CachedSample:
+    """A single labelled sample of a cached metric."""
+
+    def __init__(self, metric: CachedMetric, key: Tuple, prefix: str) -> None:
+        """Initialize the sample."""
+        self._metric = metric
+        self._key = key
+        self._prefix = prefix
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the value and render the sample line."""
+        value = float(value)
+        with self._metric.exposition.lock:
+            if value == self.value and self._key in self._metric.lines:
+                return
+            self.value = value
+            self._render()
+
+    def inc(self, amount: float = 1) -> None:
+        """Increment the value and render the sample line."""
+        with self._metric.exposition.lock:
+            self.value += amount
+            self._render()
+
+    def _render(self) -> None:
+        """Store the rendered line on the metric."""
+        metric = self._metric
+        metric.lines[self._key] = f"{self._prefix} {floatToGoString(self.value)}\n"
+        metric.exposition.version += 1
+
+
+class CachedExposition:
+    """Stand-in for the metric factories of prometheus_client.
+
+    Every sample keeps its rendered line, which is only updated when the
+    value changes. Rendering the exposition is a concatenation of those lines
+    and does not collect the metrics again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the exposition."""
+        self.lock = threading.Lock()
+        self.version = 0
+        self._metrics: List[CachedMetric] = []
+
+    def Gauge(  # pylint: disable=invalid-name
+        self, name: str, documentation: str, labelnames: List[str]
+    ) -> CachedMetric:
+        """Create a gauge."""
+        return self._add_metric(name, documentation, "gauge")
+
+    def Counter(  # pylint: disable=invalid-name
+        self, name: str, documentation: str, labelnames: List[str]
+    ) -> CachedMetric:
+        """Create a counter, exposed with the _total suffix like prometheus_client."""
+        return self._add_metric(f"{name}_total", documentation, "counter")
+
+    def _add_metric(
+        self, name: str, documentation: str, metric_type: str
+    ) -> CachedMetric:
+        """Create and register a metric."""
+        metric = CachedMetric(self, name, documentation, metric_type)
+        with self.lock:
+            self._metrics.append(metric)
+        return metric
+
+    def render(self) -> Tuple[int, str]:
+        """Return the version and the text exposition of all metrics."""
+        with self.lock:
+            return (
+                self.version,
+                "".join(
+                    metric.header + "".join(metric.lines.values())
+                    for metric in self._metrics
+                    if metric.lines
+                ),
+            )
@@ -14,20 +14,45 @@ from homeassistant.loader import bind_hass
 
 from .const import (
     ATTR_ENDPOINTS,
+    ATTR_MAX_SEGMENT_MEMORY,
+    ATTR_PART_DURATION,
     ATTR_STREAMS,
     CONF_DURATION,
+    CONF_LL_HLS,
     CONF_LOOKBACK,
+    CONF_MAX_SEGMENT_MEMORY,
+    CONF_PART_DURATION,
     CONF_STREAM_SOURCE,
+    DEFAULT_MAX_SEGMENT_MEMORY,
+    DEFAULT_PART_DURATION,
     DOMAIN,
     MAX_SEGMENTS,
+    MIN_SEGMENT_DURATION,
     SERVICE_RECORD,
 )
-from .core import PROVIDERS
+from .core import PROVIDERS, SegmentStore
 from .hls import async_setup_hls
 
 _LOGGER = logging.getLogger(__name__)
 
-CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(
+                    CONF_MAX_SEGMENT_MEMORY, default=DEFAULT_MAX_SEGMENT_MEMORY
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Optional(CONF_LL_HLS, default=False): cv.boolean,
+                vol.Optional(
+                    CONF_PART_DURATION, default=DEFAULT_PART_DURATION
+                ): vol.All(
+                    vol.Coerce(float), vol.Range(min=0.2, max=MIN_SEGMENT_DURATION)
+                ),
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
 
 STREAM_SERVICE_SCHEMA = vol.Schema({vol.Required(CONF_STREAM_SOURCE): cv.string})
 
@@ -91,6 +116,15 @@ async def async_setup(hass, config):
     hass.data[DOMAIN] = {}
     hass.data[DOMAIN][ATTR_ENDPOINTS] = {}
     hass.data[DOMAIN][ATTR_STREAMS] = {}
+    conf = config.get(DOMAIN) or {}
+    hass.data[DOMAIN][ATTR_MAX_SEGMENT_MEMORY] = (
+        conf.get(CONF_MAX_SEGMENT_MEMORY, DEFAULT_MAX_SEGMENT_MEMORY) * 1024 * 1024
+    )
+    hass.data[DOMAIN][ATTR_PART_DURATION] = (
+        conf.get(CONF_PART_DURATION, DEFAULT_PART_DURATION)
+        if conf.get(CONF_LL_HLS)
+        else None
+    )
 
     # Setup HLS
     hls_endpoint = async_setup_hls(hass)
@@ -133,6 +167,15 @@ class Stream:
         self._thread = None
         self._thread_quit = None
         self._outputs = {}
+        domain_data = hass.data.get(DOMAIN, {})
+        self.segment_store = SegmentStore(
+            self,
+            domain_data.get(
+                ATTR_MAX_SEGMENT_MEMORY, DEFAULT_MAX_SEGMENT_MEMORY * 1024 * 1024
+            ),
+        )
+        # Duration of LL-HLS partial segments, None when disabled
+        self.part_duration = domain_data.get(ATTR_PART_DURATION)
 
         if self.options is None:
             self.options = {}
@@ -2,7 +2,7 @@
 import asyncio
 from collections import deque
 import io
-from typing import Any, Callable, List
+from typing import Any, Callable, List, Optional
 
 from aiohttp import web
 import attr
@@ -12,7 +12,7 @@ from homeassistant.core import callback
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.decorator import Registry
 
-from .const import ATTR_STREAMS, DOMAIN, MAX_SEGMENTS
+from .const import ATTR_STREAMS, DOMAIN, MAX_SEGMENTS, PART_FRAGMENT_RATIO
 
 PROVIDERS = Registry()
 
@@ -27,13 +27,117 @@ class StreamBuffer:
     astream = attr.ib(default=None)  # type=Optional[av.AudioStream]
 
 
-@attr.s
+@attr.s(eq=False)
+class Part:
+    """Represent a partial segment, one or more fragments of a segment."""
+
+    sequence: int = attr.ib()
+    index: int = attr.ib()
+    duration: float = attr.ib()
+    data: memoryview = attr.ib()
+    # Only the first part of a segment starts with a keyframe
+    independent: bool = attr.ib(default=False)
+
+
+@attr.s(eq=False)
 class Segment:
-    """Represent a segment."""
+    """Represent a segment.
+
+    The segment data is a view of the muxed buffer, shared by all outputs
+    that requested the same container format and options. Outputs must not
+    write to it.
+    """
 
     sequence: int = attr.ib()
-    segment: io.BytesIO = attr.ib()
+    segment: memoryview = attr.ib()
     duration: float = attr.ib()
+    # Number of outputs holding this segment, maintained by the SegmentStore
+    refs: int = attr.ib(default=0, repr=False)
+    # Number of outputs which can't discard this segment to free memory
+    pins: int = attr.ib(default=0, repr=False)
+    # Partial segments, views of the segment buffer when low latency is enabled
+    parts: List[Part] = attr.ib(factory=list, repr=False)
+
+
+def fmp4_container_options(
+    sequence: int, part_duration: Optional[float] = None
+) -> dict:
+    """Return the container options for a fragmented mp4 segment."""
+    options = {
+        # Removed skip_sidx - see https://github.com/home-assistant/core/pull/39970
+        "movflags": "frag_custom+empty_moov+default_base_moof+frag_discont",
+        "avoid_negative_ts": "make_non_negative",
+        "fragment_index": str(sequence),
+    }
+    if part_duration:
+        # A fragment is closed by the first packet past frag_duration, so
+        # aim short to keep parts within the advertised part target
+        options["frag_duration"] = str(
+            int(part_duration * PART_FRAGMENT_RATIO * 1000000)
+        )
+    return options
+
+
+class SegmentStore:
+    """Account for the segment buffers held by the outputs of a stream.
+
+    A segment is added to the store when the first output takes it and
+    removed once the last output lets go of it. When the buffers exceed the
+    memory ceiling, the oldest segments are discarded from every output.
+    Segments pinned by an output which can't discard them, like a recording
+    in progress, don't count toward the ceiling.
+    """
+
+    def __init__(self, stream, max_memory: int) -> None:
+        """Initialize the store."""
+        self._stream = stream
+        self.max_memory = max_memory
+        self.memory = 0
+        self.pinned = 0
+        self._segments: deque = deque()
+
+    def __len__(self) -> int:
+        """Return the number of segments held."""
+        return len(self._segments)
+
+    @callback
+    def acquire(self, segment: Segment, pin: bool = False) -> None:
+        """Take a reference to a segment for an output."""
+        segment.refs += 1
+        if pin:
+            segment.pins += 1
+            if segment.pins == 1:
+                self.pinned += len(segment.segment)
+        if segment.refs > 1:
+            return
+        self._segments.append(segment)
+        self.memory += len(segment.segment)
+        self._enforce_ceiling(segment)
+
+    @callback
+    def release(self, segment: Segment, pin: bool = False) -> None:
+        """Drop the reference of an output to a segment."""
+        if segment.refs <= 0:
+            return
+        if pin and segment.pins > 0:
+            segment.pins -= 1
+            if not segment.pins:
+                self.pinned -= len(segment.segment)
+        segment.refs -= 1
+        if segment.refs:
+            return
+        self._segments.remove(segment)
+        self.memory -= len(segment.segment)
+
+    def _enforce_ceiling(self, newest: Segment) -> None:
+        """Discard the oldest segments until the store fits the ceiling."""
+        for segment in list(self._segments):
+            if self.memory - self.pinned <= self.max_memory:
+                break
+            if segment is newest or segment.pins:
+                continue
+            for output in self._stream.outputs.values():
+                output.discard(segment)
 
 
 class StreamOutput:
@@ -117,8 +221,25 @@ class StreamOutput:
         self._cursor = segment.sequence
         return segment
 
+    def _store_segment(self, segment: Segment) -> None:
+        """Keep a segment, releasing the one that falls out of the window."""
+        if len(self._segments) == self._segments.maxlen:
+            self._stream.segment_store.release(self._segments[0])
+        self._segments.append(segment)
+        self._stream.segment_store.acquire(segment)
+
+    def discard(self, segment: Segment) -> None:
+        """Drop a segment to free memory."""
+        if segment in self._segments:
+            self._segments.remove(segment)
+            self._stream.segment_store.release(segment)
+
     @callback
-    def put(self, segment: Segment) -> None:
+    def put_part(self, part: Part) -> None:
+        """Store a partial segment, ignored unless the output serves them."""
+
+    @callback
+    def put(self, segment: Optional[Segment]) -> None:
         """Store output."""
         # Start idle timeout when we start receiving data
         if self._unsub is None:
@@ -134,7 +255,7 @@ class StreamOutput:
             self.cleanup()
             return
 
-        self._segments.append(segment)
+        self._store_segment(segment)
         self._event.set()
         self._event.clear()
 
@@ -150,6 +271,8 @@ class StreamOutput:
 
     def cleanup(self):
         """Handle cleanup."""
+        for segment in self._segments:
+            self._stream.segment_store.release(segment)
         self._segments = deque(maxlen=MAX_SEGMENTS)
         self._stream.remove_provider(self)
 
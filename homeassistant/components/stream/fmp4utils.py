@@ -1,44 +1,57 @@
 """Utilities to help convert mp4s to fmp4s."""
-import io
+from typing import Iterator, Tuple
 
 
-def find_box(segment: io.BytesIO, target_type: bytes, box_start: int = 0) -> int:
+def find_box(segment: memoryview, target_type: bytes, box_start: int = 0) -> int:
     """Find location of first box (or sub_box if box_start provided) of given type."""
     if box_start == 0:
-        box_end = segment.seek(0, io.SEEK_END)
-        segment.seek(0)
+        box_end = len(segment)
         index = 0
     else:
-        segment.seek(box_start)
-        box_end = box_start + int.from_bytes(segment.read(4), byteorder="big")
+        box_end = box_start + int.from_bytes(
+            segment[box_start : box_start + 4], byteorder="big"
+        )
         index = box_start + 8
     while 1:
         if index > box_end - 8:  # End of box, not found
             break
-        segment.seek(index)
-        box_header = segment.read(8)
+        box_header = segment[index : index + 8]
         if box_header[4:8] == target_type:
             yield index
-            segment.seek(index)
         index += int.from_bytes(box_header[0:4], byteorder="big")
 
 
-def get_init(segment: io.BytesIO) -> bytes:
+def find_fragments(segment: memoryview, start: int = 0) -> Iterator[Tuple[int, int]]:
+    """Find complete moof and mdat pairs in a segment still being written."""
+    index = start
+    moof_location = None
+    while index + 8 <= len(segment):
+        box_size = int.from_bytes(segment[index : index + 4], byteorder="big")
+        if box_size < 8 or index + box_size > len(segment):  # Incomplete box
+            break
+        box_type = segment[index + 4 : index + 8]
+        if box_type == b"moof":
+            moof_location = index
+        elif box_type == b"mdat" and moof_location is not None:
+            yield moof_location, index + box_size
+            moof_location = None
+        index += box_size
+
+
+def get_init(segment: memoryview) -> memoryview:
     """Get init section from fragmented mp4."""
     moof_location = next(find_box(segment, b"moof"))
-    segment.seek(0)
-    return segment.read(moof_location)
+    return segment[:moof_location]
 
 
-def get_m4s(segment: io.BytesIO, sequence: int) -> bytes:
+def get_m4s(segment: memoryview, sequence: int) -> memoryview:
     """Get m4s section from fragmented mp4."""
     moof_location = next(find_box(segment, b"moof"))
     mfra_location = next(find_box(segment, b"mfra"))
-    segment.seek(moof_location)
-    return segment.read(mfra_location - moof_location)
+    return segment[moof_location:mfra_location]
 
 
-def get_codec_string(segment: io.BytesIO) -> str:
+def get_codec_string(segment: memoryview) -> str:
     """Get RFC 6381 codec string."""
     codecs = []
 
@@ -54,10 +67,10 @@ def get_codec_string(segment: io.BytesIO) -> str:
         stsd_location = next(find_box(segment, b"stsd", stbl_location))
 
         # Get stsd box
-        segment.seek(stsd_location)
-        stsd_length = int.from_bytes(segment.read(4), byteorder="big")
-        segment.seek(stsd_location)
-        stsd_box = segment.read(stsd_length)
+        stsd_length = int.from_bytes(
+            segment[stsd_location : stsd_location + 4], byteorder="big"
+        )
+        stsd_box = bytes(segment[stsd_location : stsd_location + stsd_length])
 
         # Base Codec
         codec = stsd_box[20:24].decode("utf-8")
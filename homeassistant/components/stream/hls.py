@@ -1,13 +1,21 @@
 """Provide functionality to stream HLS."""
-import io
-from typing import Callable
+import asyncio
+from functools import partial
+from typing import Callable, List, Optional
 
 from aiohttp import web
 
 from homeassistant.core import callback
 
 from .const import FORMAT_CONTENT_TYPE
-from .core import PROVIDERS, StreamOutput, StreamView
+from .core import (
+    PROVIDERS,
+    Part,
+    Segment,
+    StreamOutput,
+    StreamView,
+    fmp4_container_options,
+)
 from .fmp4utils import get_codec_string, get_init, get_m4s
 
 
@@ -16,6 +24,7 @@ def async_setup_hls(hass):
     """Set up api endpoints."""
     hass.http.register_view(HlsPlaylistView())
     hass.http.register_view(HlsSegmentView())
+    hass.http.register_view(HlsPartView())
     hass.http.register_view(HlsInitView())
     hass.http.register_view(HlsMasterPlaylistView())
     return "/api/hls/{}/master_playlist.m3u8"
@@ -34,9 +43,7 @@ class HlsMasterPlaylistView(StreamView):
         # Need to calculate max bandwidth as input_container.bit_rate doesn't seem to work
         # Calculate file size / duration and use a multiplier to account for variation
         segment = track.get_segment(track.segments[-1])
-        bandwidth = round(
-            segment.segment.seek(0, io.SEEK_END) * 8 / segment.duration * 3
-        )
+        bandwidth = round(len(segment.segment) * 8 / segment.duration * 3)
         codecs = get_codec_string(segment.segment)
         lines = [
             "#EXTM3U",
@@ -66,14 +73,33 @@ class HlsPlaylistView(StreamView):
     @staticmethod
     def render_preamble(track):
         """Render preamble."""
-        return [
+        preamble = [
             "#EXT-X-VERSION:7",
             f"#EXT-X-TARGETDURATION:{track.target_duration}",
-            '#EXT-X-MAP:URI="init.mp4"',
         ]
+        part_target = track.part_target_duration
+        if part_target:
+            preamble.extend(
+                [
+                    "#EXT-X-SERVER-CONTROL:CAN-BLOCK-RELOAD=YES,"
+                    f"PART-HOLD-BACK={3 * part_target:.3f}",
+                    f"#EXT-X-PART-INF:PART-TARGET={part_target:.3f}",
+                ]
+            )
+        preamble.append('#EXT-X-MAP:URI="init.mp4"')
+        return preamble
 
     @staticmethod
-    def render_playlist(track):
+    def render_parts(parts):
+        """Render partial segments."""
+        return [
+            f"#EXT-X-PART:DURATION={part.duration:.3f},"
+            f'URI="./segment/{part.sequence}.{part.index}.m4s"'
+            + (",INDEPENDENT=YES" if part.independent else "")
+            for part in parts
+        ]
+
+    def render_playlist(self, track):
         """Render playlist."""
         segments = track.segments
 
@@ -84,6 +110,8 @@ class HlsPlaylistView(StreamView):
 
         for sequence in segments:
             segment = track.get_segment(sequence)
+            if track.part_target_duration:
+                playlist.extend(self.render_parts(segment.parts))
             playlist.extend(
                 [
                     "#EXTINF:{:.04f},".format(float(segment.duration)),
@@ -91,6 +119,15 @@ class HlsPlaylistView(StreamView):
                 ]
             )
 
+        if track.part_target_duration:
+            parts = track.parts
+            playlist.extend(self.render_parts(parts))
+            if parts:
+                hint = f"{parts[-1].sequence}.{parts[-1].index + 1}"
+            else:
+                hint = f"{segments[-1] + 1}.0"
+            playlist.append(f'#EXT-X-PRELOAD-HINT:TYPE=PART,URI="./segment/{hint}.m4s"')
+
         return playlist
 
     def render(self, track):
@@ -102,12 +139,44 @@ class HlsPlaylistView(StreamView):
         """Return m3u8 playlist."""
         track = stream.add_provider("hls")
         stream.start()
+        if track.part_target_duration and (
+            "_HLS_msn" in request.query or "_HLS_part" in request.query
+        ):
+            error = await self._async_block_reload(request, track)
+            if error is not None:
+                return error
         # Wait for a segment to be ready
         if not track.segments:
             await track.recv()
         headers = {"Content-Type": FORMAT_CONTENT_TYPE["hls"]}
         return web.Response(body=self.render(track).encode("utf-8"), headers=headers)
 
+    @staticmethod
+    async def _async_block_reload(request, track):
+        """Hold a playlist request until the requested part is available."""
+        try:
+            sequence = int(request.query["_HLS_msn"])
+            index = (
+                int(request.query["_HLS_part"])
+                if "_HLS_part" in request.query
+                else None
+            )
+        except (KeyError, ValueError):
+            return web.HTTPBadRequest()
+
+        segments = track.segments
+        if segments and sequence > segments[-1] + 2:
+            return web.HTTPBadRequest()
+
+        try:
+            await asyncio.wait_for(
+                track.async_wait_for_part(sequence, index),
+                3 * track.target_duration,
+            )
+        except asyncio.TimeoutError:
+            return web.HTTPServiceUnavailable()
+        return None
+
 
 class HlsInitView(StreamView):
     """Stream view to serve HLS init.mp4."""
@@ -140,16 +209,55 @@ class HlsSegmentView(StreamView):
         if not segment:
             return web.HTTPNotFound()
         headers = {"Content-Type": "video/iso.segment"}
+        # The m4s section is a view of the shared segment buffer, which is
+        # handed to the transport without copying
         return web.Response(
             body=get_m4s(segment.segment, int(sequence)),
             headers=headers,
         )
 
 
+class HlsPartView(StreamView):
+    """Stream view to serve a LL-HLS partial segment."""
+
+    url = r"/api/hls/{token:[a-f0-9]+}/segment/{sequence:\d+\.\d+}.m4s"
+    name = "api:stream:hls:part"
+    cors_allowed = True
+
+    async def handle(self, request, stream, sequence):
+        """Return a partial fmp4 segment."""
+        track = stream.add_provider("hls")
+        if not track.part_target_duration:
+            return web.HTTPNotFound()
+        sequence, index = (int(value) for value in sequence.split("."))
+        part = track.get_part(sequence, index)
+        segments = track.segments
+        if part is None and (not segments or sequence > segments[-1]):
+            # Hold requests for preload hinted parts until they are written
+            try:
+                await asyncio.wait_for(
+                    track.async_wait_for_part(sequence, index),
+                    3 * track.target_duration,
+                )
+            except asyncio.TimeoutError:
+                pass
+            part = track.get_part(sequence, index)
+        if part is None:
+            return web.HTTPNotFound()
+        headers = {"Content-Type": "video/iso.segment"}
+        return web.Response(body=part.data, headers=headers)
+
+
 @PROVIDERS.register("hls")
 class HlsStreamOutput(StreamOutput):
     """Represents HLS Output formats."""
 
+    def __init__(self, stream, timeout: int = 300) -> None:
+        """Initialize HLS output."""
+        super().__init__(stream, timeout)
+        self._parts: List[Part] = []
+        self._part_event = asyncio.Event()
+
     @property
     def name(self) -> str:
         """Return provider name."""
@@ -173,9 +281,55 @@ class HlsStreamOutput(StreamOutput):
     @property
     def container_options(self) -> Callable[[int], dict]:
         """Return Callable which takes a sequence number and returns container options."""
-        return lambda sequence: {
-            # Removed skip_sidx - see https://github.com/home-assistant/core/pull/39970
-            "movflags": "frag_custom+empty_moov+default_base_moof+frag_discont",
-            "avoid_negative_ts": "make_non_negative",
-            "fragment_index": str(sequence),
-        }
+        return partial(fmp4_container_options, part_duration=self._stream.part_duration)
+
+    @property
+    def part_target_duration(self) -> Optional[float]:
+        """Return the target duration of partial segments, None if disabled."""
+        return self._stream.part_duration
+
+    @property
+    def parts(self) -> List[Part]:
+        """Return the parts of the segment being written."""
+        return self._parts
+
+    def get_part(self, sequence: int, index: int) -> Optional[Part]:
+        """Retrieve a part of the segment being written or of a recent segment."""
+        if self._parts and self._parts[0].sequence == sequence:
+            parts = self._parts
+        else:
+            parts = next(
+                (s.parts for s in self.get_segment() if s.sequence == sequence), []
+            )
+        return parts[index] if index < len(parts) else None
+
+    def has_part(self, sequence: int, index: Optional[int]) -> bool:
+        """Return if a segment, or the given part of it, is available."""
+        segments = self.segments
+        if segments and sequence <= segments[-1]:
+            return True
+        return index is not None and self.get_part(sequence, index) is not None
+
+    async def async_wait_for_part(self, sequence: int, index: Optional[int]) -> None:
+        """Wait until a segment, or the given part of it, is available."""
+        while not self.has_part(sequence, index):
+            await self._part_event.wait()
+
+    @callback
+    def put_part(self, part: Part) -> None:
+        """Store a part of the segment being written."""
+        if self._parts and self._parts[0].sequence != part.sequence:
+            self._parts = []
+        self._parts.append(part)
+        self._part_event.set()
+        self._part_event.clear()
+
+    @callback
+    def put(self, segment: Optional[Segment]) -> None:
+        """Store output, the segment replaces its parts."""
+        super().put(segment)
+        if segment is not None and self._parts:
+            if self._parts[0].sequence <= segment.sequence:
+                self._parts = []
+        self._part_event.set()
+        self._part_event.clear()
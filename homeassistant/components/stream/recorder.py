@@ -1,13 +1,15 @@
 """Provide functionality to record stream."""
+from functools import partial
+import io
 import os
 import threading
-from typing import List
+from typing import Callable, List
 
 import av
 
 from homeassistant.core import callback
 
-from .core import PROVIDERS, Segment, StreamOutput
+from .core import PROVIDERS, Segment, StreamOutput, fmp4_container_options
 
 
 @callback
@@ -26,9 +28,8 @@ def recorder_save_worker(file_out: str, segments: List[Segment], container_forma
     output_a = None
 
     for segment in segments:
-        # Seek to beginning and open segment
-        segment.segment.seek(0)
-        source = av.open(segment.segment, "r", format=container_format)
+        # Open a private copy, the segment buffer is shared with other outputs
+        source = av.open(io.BytesIO(segment.segment), "r", format=container_format)
         source_v = source.streams.video[0]
 
         # Add output streams
@@ -85,12 +86,29 @@ class RecorderOutput(StreamOutput):
         """Return desired video codecs."""
         return {"hevc", "h264"}
 
+    @property
+    def container_options(self) -> Callable[[int], dict]:
+        """Return Callable which takes a sequence number and returns container options."""
+        # Same options as HLS so both outputs share the segment buffers,
+        # the segments are remuxed into a single file when saving anyway
+        return partial(fmp4_container_options, part_duration=self._stream.part_duration)
+
     def prepend(self, segments: List[Segment]) -> None:
         """Prepend segments to existing list."""
         own_segments = self.segments
         segments = [s for s in segments if s.sequence not in own_segments]
+        for segment in segments:
+            self._stream.segment_store.acquire(segment, pin=True)
         self._segments = segments + self._segments
 
+    def _store_segment(self, segment: Segment) -> None:
+        """Keep every segment until the recording is saved."""
+        self._segments.append(segment)
+        self._stream.segment_store.acquire(segment, pin=True)
+
+    def discard(self, segment: Segment) -> None:
+        """Keep segments needed for the recording, they are pinned in the store."""
+
     @callback
     def _timeout(self, _now=None):
         """Handle recorder timeout."""
@@ -106,5 +124,7 @@ class RecorderOutput(StreamOutput):
         )
         thread.start()
 
+        for segment in self._segments:
+            self._stream.segment_store.release(segment, pin=True)
         self._segments = []
         self._stream.remove_provider(self)
@@ -7,20 +7,33 @@ import time
 import av
 
 from .const import MAX_TIMESTAMP_GAP, MIN_SEGMENT_DURATION, PACKETS_TO_WAIT_FOR_AUDIO
-from .core import Segment, StreamBuffer
+from .core import Part, Segment, StreamBuffer
+from .fmp4utils import find_fragments
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def get_container_options(stream_output, sequence):
+    """Return the container options of an output for a segment."""
+    if not stream_output.container_options:
+        return {}
+    return stream_output.container_options(sequence)
+
+
+def get_buffer_key(stream_output, audio_stream, sequence):
+    """Return a key identifying outputs that can share a StreamBuffer."""
+    return (
+        stream_output.format,
+        tuple(sorted(get_container_options(stream_output, sequence).items())),
+        bool(audio_stream and audio_stream.name in stream_output.audio_codecs),
+    )
+
+
 def create_stream_buffer(stream_output, video_stream, audio_stream, sequence):
     """Create a new StreamBuffer."""
 
     segment = io.BytesIO()
-    container_options = (
-        stream_output.container_options(sequence)
-        if stream_output.container_options
-        else {}
-    )
+    container_options = get_container_options(stream_output, sequence)
     output = av.open(
         segment,
         mode="w",
@@ -90,8 +103,12 @@ def _stream_worker_internal(hass, stream, quit_event):
     last_packet_was_without_dts = False
     # Keep track of consecutive packets with a large dts gap to detect an overflow.
     last_packet_had_large_negative_dts_gap = False
-    # Holds the buffers for each stream provider
+    # Holds the buffer key for each stream provider
     outputs = None
+    # Holds the buffers, shared by providers with the same container settings
+    buffers = None
+    # Holds the offsets and durations of the partial segments of each buffer
+    parts = None
     # Keep track of the number of segments we've processed
     sequence = 0
     # The video pts at the beginning of the segment
@@ -175,28 +192,62 @@ def _stream_worker_internal(hass, stream, quit_event):
 
     def initialize_segment(video_pts):
         """Reset some variables and initialize outputs for each segment."""
-        nonlocal outputs, sequence, segment_start_pts
+        nonlocal outputs, buffers, parts, sequence, segment_start_pts
         # Clear outputs and increment sequence
         outputs = {}
+        buffers = {}
+        parts = {}
         sequence += 1
         segment_start_pts = video_pts
         for stream_output in stream.outputs.values():
             if video_stream.name not in stream_output.video_codecs:
                 continue
-            buffer = create_stream_buffer(
-                stream_output, video_stream, audio_stream, sequence
-            )
-            outputs[stream_output.name] = (
-                buffer,
-                {video_stream: buffer.vstream, audio_stream: buffer.astream},
-            )
+            key = get_buffer_key(stream_output, audio_stream, sequence)
+            if key not in buffers:
+                buffer = create_stream_buffer(
+                    stream_output, video_stream, audio_stream, sequence
+                )
+                buffers[key] = (
+                    buffer,
+                    {video_stream: buffer.vstream, audio_stream: buffer.astream},
+                )
+                parts[key] = []
+            outputs[stream_output.name] = key
+
+    def scan_part(key, buffer, elapsed):
+        """Return a part holding the fragments completed since the last part."""
+        offsets = parts[key]
+        start = offsets[-1][1] if offsets else 0
+        view = buffer.segment.getbuffer()
+        try:
+            fragments = list(find_fragments(view, start))
+            if not fragments:
+                return None
+            # Copy, the buffer can't grow while a view of it exists
+            data = bytes(view[fragments[0][0] : fragments[-1][1]])
+        finally:
+            view.release()
+        duration = float(elapsed) - sum(offset[2] for offset in offsets)
+        offsets.append((fragments[0][0], fragments[-1][1], duration))
+        return Part(sequence, len(offsets) - 1, duration, memoryview(data), not start)
+
+    def send_parts(video_pts):
+        """Send the fragments completed in each buffer as partial segments."""
+        elapsed = (video_pts - segment_start_pts) * video_stream.time_base
+        for key, (buffer, _) in buffers.items():
+            part = scan_part(key, buffer, elapsed)
+            if part is None:
+                continue
+            for fmt, output_key in outputs.items():
+                if output_key == key and stream.outputs.get(fmt):
+                    hass.loop.call_soon_threadsafe(stream.outputs[fmt].put_part, part)
 
     def mux_video_packet(packet):
         # adjust pts and dts before muxing
         packet.pts -= first_pts[video_stream]
         packet.dts -= first_pts[video_stream]
         # mux packets to each buffer
-        for buffer, output_streams in outputs.values():
+        for buffer, output_streams in buffers.values():
             # Assign the packet to the new stream & mux
             packet.stream = output_streams[video_stream]
             buffer.output.mux(packet)
@@ -206,7 +257,7 @@ def _stream_worker_internal(hass, stream, quit_event):
         # adjust pts and dts before muxing
         packet.pts -= first_pts[audio_stream]
         packet.dts -= first_pts[audio_stream]
-        for buffer, output_streams in outputs.values():
+        for buffer, output_streams in buffers.values():
             # Assign the packet to the new stream & mux
             if output_streams.get(audio_stream):
                 packet.stream = output_streams[audio_stream]
@@ -265,17 +316,28 @@ def _stream_worker_internal(hass, stream, quit_event):
         if packet.stream == video_stream and packet.is_keyframe:
             segment_duration = (packet.pts - segment_start_pts) * packet.time_base
             if segment_duration >= MIN_SEGMENT_DURATION:
-                # Save segment to outputs
-                for fmt, (buffer, _) in outputs.items():
+                # Save segment to outputs, one shared view per buffer
+                segments = {}
+                for key, (buffer, _) in buffers.items():
                     buffer.output.close()
+                    if stream.part_duration:
+                        # The fragment written on close is the last part
+                        scan_part(key, buffer, segment_duration)
+                    view = buffer.segment.getbuffer()
+                    segments[key] = Segment(
+                        sequence,
+                        view,
+                        segment_duration,
+                        parts=[
+                            # Replace the copies sent earlier with views
+                            Part(sequence, index, duration, view[start:end], not index)
+                            for index, (start, end, duration) in enumerate(parts[key])
+                        ],
+                    )
+                for fmt, key in outputs.items():
                     if stream.outputs.get(fmt):
                         hass.loop.call_soon_threadsafe(
-                            stream.outputs[fmt].put,
-                            Segment(
-                                sequence,
-                                buffer.segment,
-                                segment_duration,
-                            ),
+                            stream.outputs[fmt].put, segments[key]
                         )
 
                 # Reinitialize
@@ -285,11 +347,14 @@ def _stream_worker_internal(hass, stream, quit_event):
         last_dts[packet.stream] = packet.dts
         # mux packets
         if packet.stream == video_stream:
+            video_pts = packet.pts
             mux_video_packet(packet)  # mutates packet timestamps
+            if stream.part_duration:
+                send_parts(video_pts)
         else:
             mux_audio_packet(packet)  # mutates packet timestamps
 
     # Close stream
-    for buffer, _ in outputs.values():
+    for buffer, _ in buffers.values():
         buffer.output.close()
     container.close()
@@ -243,6 +243,15 @@ async def websocket_get_devices(hass, connection, msg):
     connection.send_result(msg[ID], devices)
 
 
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required(TYPE): "zha/scheduler/stats"})
+def websocket_get_scheduler_stats(hass, connection, msg):
+    """Get the queue depth and latency of the requests sent to the network."""
+    zha_gateway = hass.data[DATA_ZHA][DATA_ZHA_GATEWAY]
+    connection.send_result(msg[ID], zha_gateway.request_scheduler.stats)
+
+
 @websocket_api.require_admin
 @websocket_api.async_response
 @websocket_api.websocket_command({vol.Required(TYPE): "zha/devices/groupable"})
@@ -1149,6 +1158,7 @@ def async_load_api(hass):
     websocket_api.async_register_command(hass, websocket_get_bindable_devices)
     websocket_api.async_register_command(hass, websocket_bind_devices)
     websocket_api.async_register_command(hass, websocket_unbind_devices)
+    websocket_api.async_register_command(hass, websocket_get_scheduler_stats)
 
 
 @callback
@@ -1,7 +1,7 @@
 """Channels module for Zigbee Home Automation."""
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, AsyncContextManager, Dict, List, Optional, Tuple, Union
 
 import zigpy.zcl.clusters.closures
 
@@ -221,6 +221,10 @@ class ChannelPool:
         """Return device manufacturer."""
         return self._channels.zha_device.manufacturer_code
 
+    def request_slot(self, priority: int) -> AsyncContextManager[None]:
+        """Wait for the turn of a request to the device and hold it while sent."""
+        return self._channels.zha_device.request_slot(priority)
+
     @property
     def hass(self):
         """Return hass."""
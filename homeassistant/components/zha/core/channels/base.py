@@ -1,10 +1,11 @@
 """Base classes for channels."""
 
 import asyncio
+from contextlib import asynccontextmanager
 from enum import Enum
 from functools import wraps
 import logging
-from typing import Any, Union
+from typing import Any, AsyncContextManager, AsyncIterator, Union
 
 import zigpy.exceptions
 
@@ -20,6 +21,9 @@ from ..const import (
     ATTR_UNIQUE_ID,
     ATTR_VALUE,
     CHANNEL_ZDO,
+    REQUEST_PRIORITY_COMMAND,
+    REQUEST_PRIORITY_CONFIGURE,
+    REQUEST_PRIORITY_READ,
     SIGNAL_ATTR_UPDATED,
 )
 from ..helpers import LogMixin, safe_read
@@ -40,13 +44,20 @@ def parse_and_log_command(channel, tsn, command_id, args):
     return cmd
 
 
+@asynccontextmanager
+async def _no_request_slot() -> AsyncIterator[None]:
+    """Hold no turn for a request answered without sending it."""
+    yield
+
+
 def decorate_command(channel, command):
     """Wrap a cluster command to make it safe."""
 
     @wraps(command)
     async def wrapper(*args, **kwds):
         try:
-            result = await command(*args, **kwds)
+            async with channel.request_slot(REQUEST_PRIORITY_COMMAND):
+                result = await command(*args, **kwds)
             channel.debug(
                 "executed '%s' command with args: '%s' kwargs: '%s' result: %s",
                 command.__name__,
@@ -145,7 +156,8 @@ class ZigbeeChannel(LogMixin):
         devices are unreachable.
         """
         try:
-            res = await self.cluster.bind()
+            async with self.request_slot(REQUEST_PRIORITY_CONFIGURE):
+                res = await self.cluster.bind()
             self.debug("bound '%s' cluster: %s", self.cluster.ep_attribute, res[0])
         except (zigpy.exceptions.ZigbeeException, asyncio.TimeoutError) as ex:
             self.debug(
@@ -167,9 +179,14 @@ class ZigbeeChannel(LogMixin):
             attr_name = self.cluster.attributes.get(attr, [attr])[0]
             min_report_int, max_report_int, reportable_change = report["config"]
             try:
-                res = await self.cluster.configure_reporting(
-                    attr, min_report_int, max_report_int, reportable_change, **kwargs
-                )
+                async with self.request_slot(REQUEST_PRIORITY_CONFIGURE):
+                    res = await self.cluster.configure_reporting(
+                        attr,
+                        min_report_int,
+                        max_report_int,
+                        reportable_change,
+                        **kwargs,
+                    )
                 self.debug(
                     "reporting '%s' attr on '%s' cluster: %d/%d/%d: Result: '%s'",
                     attr_name,
@@ -247,13 +264,15 @@ class ZigbeeChannel(LogMixin):
         manufacturer_code = self._ch_pool.manufacturer_code
         if self.cluster.cluster_id >= 0xFC00 and manufacturer_code:
             manufacturer = manufacturer_code
-        result = await safe_read(
-            self._cluster,
-            [attribute],
-            allow_cache=from_cache,
-            only_cache=from_cache and not self._ch_pool.is_mains_powered,
-            manufacturer=manufacturer,
-        )
+        only_cache = from_cache and not self._ch_pool.is_mains_powered
+        async with self.request_slot(REQUEST_PRIORITY_READ, only_cache):
+            result = await safe_read(
+                self._cluster,
+                [attribute],
+                allow_cache=from_cache,
+                only_cache=only_cache,
+                manufacturer=manufacturer,
+            )
         return result.get(attribute)
 
     async def get_attributes(self, attributes, from_cache=True):
@@ -262,13 +281,15 @@ class ZigbeeChannel(LogMixin):
         manufacturer_code = self._ch_pool.manufacturer_code
         if self.cluster.cluster_id >= 0xFC00 and manufacturer_code:
             manufacturer = manufacturer_code
+        only_cache = from_cache and not self._ch_pool.is_mains_powered
         try:
-            result, _ = await self.cluster.read_attributes(
-                attributes,
-                allow_cache=from_cache,
-                only_cache=from_cache and not self._ch_pool.is_mains_powered,
-                manufacturer=manufacturer,
-            )
+            async with self.request_slot(REQUEST_PRIORITY_READ, only_cache):
+                result, _ = await self.cluster.read_attributes(
+                    attributes,
+                    allow_cache=from_cache,
+                    only_cache=only_cache,
+                    manufacturer=manufacturer,
+                )
             return result
         except (asyncio.TimeoutError, zigpy.exceptions.ZigbeeException) as ex:
             self.debug(
@@ -279,6 +300,17 @@ class ZigbeeChannel(LogMixin):
             )
             return {}
 
+    def request_slot(
+        self, priority: int, only_cache: bool = False
+    ) -> AsyncContextManager[None]:
+        """Wait for the turn of a request sent to the device.
+
+        Requests answered from the attribute cache don't wait for a turn.
+        """
+        if only_cache:
+            return _no_request_slot()
+        return self._ch_pool.request_slot(priority)
+
     def log(self, level, msg, *args):
         """Log a message."""
         msg = f"[%s:%s]: {msg}"
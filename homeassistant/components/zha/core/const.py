@@ -260,6 +260,10 @@ REPORT_CONFIG_OP = (
     REPORT_CONFIG_RPT_CHANGE,
 )
 
+REQUEST_PRIORITY_COMMAND = 0
+REQUEST_PRIORITY_READ = 1
+REQUEST_PRIORITY_CONFIGURE = 2
+
 SENSOR_ACCELERATION = "acceleration"
 SENSOR_BATTERY = "battery"
 SENSOR_ELECTRICAL_MEASUREMENT = CHANNEL_ELECTRICAL_MEASUREMENT
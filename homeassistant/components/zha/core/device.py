@@ -5,7 +5,7 @@ from enum import Enum
 import logging
 import random
 import time
-from typing import Any, Dict
+from typing import Any, AsyncContextManager, Dict
 
 from zigpy import types
 import zigpy.exceptions
@@ -60,6 +60,7 @@ from .const import (
     EFFECT_OKAY,
     POWER_BATTERY_OR_UNKNOWN,
     POWER_MAINS_POWERED,
+    REQUEST_PRIORITY_COMMAND,
     SIGNAL_AVAILABLE,
     SIGNAL_UPDATE_DEVICE,
     UNKNOWN,
@@ -247,6 +248,10 @@ class ZHADevice(LogMixin):
         """Return the gateway for this device."""
         return self._zha_gateway
 
+    def request_slot(self, priority: int) -> AsyncContextManager[None]:
+        """Wait for the turn of a request to the device and hold it while sent."""
+        return self._zha_gateway.request_scheduler.slot(self.ieee, priority)
+
     @property
     def device_automation_triggers(self):
         """Return the device automation triggers for this device."""
@@ -556,9 +561,10 @@ class ZHADevice(LogMixin):
             return None
 
         try:
-            response = await cluster.write_attributes(
-                {attribute: value}, manufacturer=manufacturer
-            )
+            async with self.request_slot(REQUEST_PRIORITY_COMMAND):
+                response = await cluster.write_attributes(
+                    {attribute: value}, manufacturer=manufacturer
+                )
             self.debug(
                 "set: %s for attr: %s to cluster: %s for ept: %s - res: %s",
                 value,
@@ -593,12 +599,13 @@ class ZHADevice(LogMixin):
         cluster = self.async_get_cluster(endpoint_id, cluster_id, cluster_type)
         if cluster is None:
             return None
-        if command_type == CLUSTER_COMMAND_SERVER:
-            response = await cluster.command(
-                command, *args, manufacturer=manufacturer, expect_reply=True
-            )
-        else:
-            response = await cluster.client_command(command, *args)
+        async with self.request_slot(REQUEST_PRIORITY_COMMAND):
+            if command_type == CLUSTER_COMMAND_SERVER:
+                response = await cluster.command(
+                    command, *args, manufacturer=manufacturer, expect_reply=True
+                )
+            else:
+                response = await cluster.client_command(command, *args)
 
         self.debug(
             "Issued cluster command: %s %s %s %s %s %s %s",
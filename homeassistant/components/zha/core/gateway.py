@@ -84,6 +84,7 @@ from .device import (
 from .group import GroupMember, ZHAGroup
 from .patches import apply_application_controller_patch
 from .registries import GROUP_ENTITY_DOMAINS
+from .scheduler import RequestScheduler
 from .store import async_get_registry
 from .typing import ZhaGroupType, ZigpyEndpointType, ZigpyGroupType
 
@@ -119,6 +120,7 @@ class ZHAGateway:
         self._log_relay_handler = LogRelayHandler(hass, self)
         self._config_entry = config_entry
         self._unsubs = []
+        self.request_scheduler = RequestScheduler(hass)
 
     async def async_initialize(self):
         """Initialize controller and connect radio."""
@@ -206,17 +208,14 @@ class ZHAGateway:
             discovery.GROUP_PROBE.discover_group_entities(zha_group)
 
     async def async_initialize_devices_and_entities(self) -> None:
-        """Initialize devices and load entities."""
-        semaphore = asyncio.Semaphore(2)
-
-        async def _throttle(zha_device: zha_typing.ZhaDeviceType, cached: bool):
-            async with semaphore:
-                await zha_device.async_initialize(from_cache=cached)
+        """Initialize devices and load entities.
 
+        The requests sent to the devices are throttled by the request scheduler.
+        """
         _LOGGER.debug("Loading battery powered devices")
         await asyncio.gather(
             *[
-                _throttle(dev, cached=True)
+                dev.async_initialize(from_cache=True)
                 for dev in self.devices.values()
                 if not dev.is_mains_powered
             ]
@@ -225,7 +224,7 @@ class ZHAGateway:
         _LOGGER.debug("Loading mains powered devices")
         await asyncio.gather(
             *[
-                _throttle(dev, cached=False)
+                dev.async_initialize(from_cache=False)
                 for dev in self.devices.values()
                 if dev.is_mains_powered
             ]
@@ -637,6 +636,7 @@ class ZHAGateway:
         _LOGGER.debug("Shutting down ZHA ControllerApplication")
         for unsubscribe in self._unsubs:
             unsubscribe()
+        self.request_scheduler.shutdown()
         await self.application_controller.shutdown()
 
 
@@ -0,0 +1,196 @@
+"""Schedule requests to the Zigbee network by priority within rate limits."""
+import asyncio
+from contextlib import asynccontextmanager
+import heapq
+import itertools
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from homeassistant.core import callback
+from homeassistant.helpers.typing import HomeAssistantType
+
+from .const import (
+    REQUEST_PRIORITY_COMMAND,
+    REQUEST_PRIORITY_CONFIGURE,
+    REQUEST_PRIORITY_READ,
+)
+
+# Requests sent to the radio at the same time
+RADIO_MAX_CONCURRENT = 8
+# Requests sent to the radio per second, and the burst allowed after idling
+RADIO_REQUESTS_PER_SECOND = 20
+RADIO_BURST = 10
+# Requests sent to one device at the same time
+DEVICE_MAX_CONCURRENT = 2
+
+PRIORITY_NAMES = {
+    REQUEST_PRIORITY_COMMAND: "command",
+    REQUEST_PRIORITY_READ: "read",
+    REQUEST_PRIORITY_CONFIGURE: "configure",
+}
+
+
+class RequestScheduler:
+    """Run Zigbee requests by priority within device and radio limits.
+
+    Requests run in order of priority, then of submission, so user commands
+    overtake the reads and configuration of devices being initialized. A
+    request for a device already running as many requests as allowed waits
+    without holding up the requests for other devices. The requests sent to
+    the radio are limited by a token bucket and a concurrency limit.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistantType,
+        max_concurrent: int = RADIO_MAX_CONCURRENT,
+        max_device_concurrent: int = DEVICE_MAX_CONCURRENT,
+        rate: float = RADIO_REQUESTS_PER_SECOND,
+        burst: int = RADIO_BURST,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.max_concurrent = max_concurrent
+        self.max_device_concurrent = max_device_concurrent
+        self.rate = rate
+        self.burst = burst
+        self._queue: List[Tuple[int, int, Any, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._device_in_flight: Dict[Any, int] = {}
+        self._tokens = float(burst)
+        self._refilled = time.monotonic()
+        self._refill_handle: Optional[asyncio.TimerHandle] = None
+        self._max_queue_depth = 0
+        self._rate_limited = 0
+        self._stats: Dict[int, Dict[str, Any]] = {
+            priority: {
+                "requests": 0,
+                "latency": 0.0,
+                "max_latency": 0.0,
+                "total_latency": 0.0,
+            }
+            for priority in PRIORITY_NAMES
+        }
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return the queue depth and wait latency of each priority."""
+        queued = dict.fromkeys(PRIORITY_NAMES, 0)
+        for priority, _, _, waiter in self._queue:
+            if not waiter.done():
+                queued[priority] += 1
+        return {
+            "in_flight": self._in_flight,
+            "max_queue_depth": self._max_queue_depth,
+            "rate_limited": self._rate_limited,
+            "priorities": {
+                name: {
+                    "queued": queued[priority],
+                    "requests": self._stats[priority]["requests"],
+                    "latency": self._stats[priority]["latency"],
+                    "max_latency": self._stats[priority]["max_latency"],
+                    "average_latency": (
+                        self._stats[priority]["total_latency"]
+                        / self._stats[priority]["requests"]
+                        if self._stats[priority]["requests"]
+                        else 0.0
+                    ),
+                }
+                for priority, name in PRIORITY_NAMES.items()
+            },
+        }
+
+    @asynccontextmanager
+    async def slot(self, device: Any, priority: int) -> AsyncIterator[None]:
+        """Wait for the turn of a request to a device and hold it while sent."""
+        queued = time.monotonic()
+        waiter = self.hass.loop.create_future()
+        heapq.heappush(self._queue, (priority, next(self._sequence), device, waiter))
+        self._max_queue_depth = max(self._max_queue_depth, len(self._queue))
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The turn may have been given after the task was cancelled
+            if waiter.done() and not waiter.cancelled():
+                self._release(device)
+            raise
+
+        latency = time.monotonic() - queued
+        stats = self._stats[priority]
+        stats["requests"] += 1
+        stats["latency"] = latency
+        stats["total_latency"] += latency
+        stats["max_latency"] = max(stats["max_latency"], latency)
+        try:
+            yield
+        finally:
+            self._release(device)
+
+    @callback
+    def shutdown(self) -> None:
+        """Cancel the requests still waiting for their turn."""
+        if self._refill_handle is not None:
+            self._refill_handle.cancel()
+            self._refill_handle = None
+        for _, _, _, waiter in self._queue:
+            if not waiter.done():
+                waiter.cancel()
+        self._queue.clear()
+
+    def _take_token(self) -> bool:
+        """Take a token from the bucket, return False if it is empty."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._refilled) * self.rate
+        )
+        self._refilled = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    @callback
+    def _refill(self) -> None:
+        """Give the turn to the requests waiting for a token."""
+        self._refill_handle = None
+        self._dispatch()
+
+    @callback
+    def _dispatch(self) -> None:
+        """Give the turn to the next requests the limits allow."""
+        device_busy = []
+        while self._queue and self._in_flight < self.max_concurrent:
+            _, _, device, waiter = self._queue[0]
+            if waiter.done():
+                heapq.heappop(self._queue)
+                continue
+            if self._device_in_flight.get(device, 0) >= self.max_device_concurrent:
+                device_busy.append(heapq.heappop(self._queue))
+                continue
+            if not self._take_token():
+                if self._refill_handle is None:
+                    self._rate_limited += 1
+                    self._refill_handle = self.hass.loop.call_later(
+                        (1 - self._tokens) / self.rate, self._refill
+                    )
+                break
+            heapq.heappop(self._queue)
+            self._in_flight += 1
+            self._device_in_flight[device] = self._device_in_flight.get(device, 0) + 1
+            waiter.set_result(None)
+
+        for item in device_busy:
+            heapq.heappush(self._queue, item)
+
+    @callback
+    def _release(self, device: Any) -> None:
+        """Release the turn of a finished request."""
+        self._in_flight -= 1
+        remaining = self._device_in_flight[device] - 1
+        if remaining:
+            self._device_in_flight[device] = remaining
+        else:
+            del self._device_in_flight[device]
+        self._dispatch()
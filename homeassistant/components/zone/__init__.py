@@ -1,6 +1,6 @@
 """Support for the definition of zones."""
 import logging
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
 
 import voluptuous as vol
 
@@ -33,12 +33,15 @@ from homeassistant.loader import bind_hass
 from homeassistant.util.location import distance
 
 from .const import ATTR_PASSIVE, ATTR_RADIUS, CONF_PASSIVE, DOMAIN, HOME_ZONE
+from .index import ZoneIndex
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_PASSIVE = False
 DEFAULT_RADIUS = 100
 
+DATA_ZONE_INDEX = "zone_index"
+
 ENTITY_ID_FORMAT = "zone.{}"
 ENTITY_ID_HOME = ENTITY_ID_FORMAT.format(HOME_ZONE)
 
@@ -96,42 +99,34 @@ def async_active_zone(
 
     This method must be run in the event loop.
     """
-    # Sort entity IDs so that we are deterministic if equal distance to 2 zones
-    zones = (
-        cast(State, hass.states.get(entity_id))
-        for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
-    )
+    return _async_get_index(hass).active_zone(latitude, longitude, radius)
 
-    min_dist = None
-    closest = None
 
-    for zone in zones:
-        if zone.state == STATE_UNAVAILABLE or zone.attributes.get(ATTR_PASSIVE):
-            continue
+@bind_hass
+def async_active_zones(
+    hass: HomeAssistant, locations: Iterable[Tuple[float, float, float]]
+) -> List[Optional[State]]:
+    """Find the active zone for each latitude, longitude and radius.
 
-        zone_dist = distance(
-            latitude,
-            longitude,
-            zone.attributes[ATTR_LATITUDE],
-            zone.attributes[ATTR_LONGITUDE],
-        )
+    This method must be run in the event loop.
+    """
+    index = _async_get_index(hass)
+    return [
+        index.active_zone(latitude, longitude, radius)
+        for latitude, longitude, radius in locations
+    ]
 
-        if zone_dist is None:
-            continue
 
-        within_zone = zone_dist - radius < zone.attributes[ATTR_RADIUS]
-        closer_zone = closest is None or zone_dist < min_dist  # type: ignore
-        smaller_zone = (
-            zone_dist == min_dist
-            and zone.attributes[ATTR_RADIUS]
-            < cast(State, closest).attributes[ATTR_RADIUS]
+@callback
+def _async_get_index(hass: HomeAssistant) -> ZoneIndex:
+    """Return the index of the zones, rebuild it if a zone changed."""
+    index: Optional[ZoneIndex] = hass.data.get(DATA_ZONE_INDEX)
+    change_count = hass.states.async_domain_change_count(DOMAIN)
+    if index is None or index.change_count != change_count:
+        index = hass.data[DATA_ZONE_INDEX] = ZoneIndex(
+            hass.states.async_all(DOMAIN), change_count
         )
-
-        if within_zone and (closer_zone or smaller_zone):
-            min_dist = zone_dist
-            closest = zone
-
-    return closest
+    return index
 
 
 def in_zone(zone: State, latitude: float, longitude: float, radius: float = 0) -> bool:
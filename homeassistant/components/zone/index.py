@@ -0,0 +1,165 @@
+"""Grid index of the zones to find the zones near a location."""
+import math
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE, STATE_UNAVAILABLE
+from homeassistant.core import State
+from homeassistant.util.location import distance
+
+from .const import ATTR_PASSIVE, ATTR_RADIUS
+
+# Size in degrees of the cells of the finest grid, the cells of each coarser
+# grid are twice as large. 360 is a multiple of the cells of every grid.
+CELL_SIZE = 360 / 2 ** 16
+MAX_LEVEL = 12
+# Lower bound of the meters in a degree of latitude, or of longitude at the
+# equator, so extents in degrees are never underestimated
+METERS_PER_DEGREE = 110000
+# Grid cells are too distorted closer to the poles
+MAX_LATITUDE = 85
+
+
+class IndexedZone(NamedTuple):
+    """A zone with the values used to find the zones near a location."""
+
+    entity_id: str
+    state: State
+    latitude: float
+    longitude: float
+    radius: float
+
+
+def _extent(latitude: float, radius: float) -> Optional[Tuple[float, float]]:
+    """Return the degrees of latitude and longitude a circle spans.
+
+    Return None for a circle too close to a pole for the grid.
+    """
+    lat_extent = radius / METERS_PER_DEGREE
+    max_latitude = abs(latitude) + lat_extent
+    if max_latitude > MAX_LATITUDE:
+        return None
+    return (
+        lat_extent,
+        radius / (METERS_PER_DEGREE * math.cos(math.radians(max_latitude))),
+    )
+
+
+class ZoneIndex:
+    """Zones bucketed in grids of cells as large as their radius.
+
+    A zone is added to the cell containing its center in the finest grid
+    with cells larger than the zone. The zones containing a location can
+    only be in the cells around it, so only these zones are measured. Zones
+    larger than the coarsest cells or close to the poles are always measured.
+    """
+
+    def __init__(self, zones: Iterable[State], change_count: int) -> None:
+        """Index the active zones."""
+        self.change_count = change_count
+        self._zones: List[IndexedZone] = []
+        self._unbucketed: List[IndexedZone] = []
+        self._grids: Dict[int, Dict[Tuple[int, int], List[IndexedZone]]] = {}
+        self._grid_sizes: Dict[int, int] = {}
+
+        for state in zones:
+            if state.state == STATE_UNAVAILABLE or state.attributes.get(ATTR_PASSIVE):
+                continue
+            try:
+                zone = IndexedZone(
+                    state.entity_id,
+                    state,
+                    float(state.attributes[ATTR_LATITUDE]),
+                    float(state.attributes[ATTR_LONGITUDE]),
+                    float(state.attributes[ATTR_RADIUS]),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+            self._zones.append(zone)
+
+            extent = _extent(zone.latitude, zone.radius)
+            if extent is None:
+                self._unbucketed.append(zone)
+                continue
+            level = 0
+            size = CELL_SIZE
+            while size < max(extent) and level < MAX_LEVEL:
+                level += 1
+                size *= 2
+            if size < max(extent):
+                self._unbucketed.append(zone)
+                continue
+            self._grids.setdefault(level, {}).setdefault(
+                self._cell(level, zone.latitude, zone.longitude), []
+            ).append(zone)
+            self._grid_sizes[level] = self._grid_sizes.get(level, 0) + 1
+
+    @staticmethod
+    def _cell(level: int, latitude: float, longitude: float) -> Tuple[int, int]:
+        """Return the cell of a grid containing a location."""
+        size = CELL_SIZE * 2 ** level
+        return (
+            math.floor(latitude / size),
+            math.floor(longitude / size) % round(360 / size),
+        )
+
+    def candidates(
+        self, latitude: float, longitude: float, radius: float = 0
+    ) -> List[IndexedZone]:
+        """Return the zones which may contain a location, sorted by entity id."""
+        extent = _extent(latitude, radius)
+        if extent is None:
+            return sorted(self._zones)
+
+        found = list(self._unbucketed)
+        for level, grid in self._grids.items():
+            size = CELL_SIZE * 2 ** level
+            columns = round(360 / size)
+            # A zone at most a cell wide containing the location has its
+            # center at most a cell away from the area of the location
+            first_row = math.floor((latitude - extent[0]) / size) - 1
+            last_row = math.floor((latitude + extent[0]) / size) + 1
+            first_column = math.floor((longitude - extent[1]) / size) - 1
+            last_column = math.floor((longitude + extent[1]) / size) + 1
+            column_count = min(last_column - first_column + 1, columns)
+            if (last_row - first_row + 1) * column_count >= self._grid_sizes[level]:
+                for zones in grid.values():
+                    found.extend(zones)
+                continue
+            for row in range(first_row, last_row + 1):
+                for column in range(first_column, first_column + column_count):
+                    cell_zones = grid.get((row, column % columns))
+                    if cell_zones is not None:
+                        found.extend(cell_zones)
+        found.sort()
+        return found
+
+    def active_zone(
+        self,
+        latitude: Optional[float],
+        longitude: Optional[float],
+        radius: float = 0,
+    ) -> Optional[State]:
+        """Return the closest zone containing a location, the smallest if tied."""
+        if latitude is None or longitude is None:
+            return None
+
+        min_dist = None
+        closest = None
+
+        for zone in self.candidates(latitude, longitude, radius):
+            zone_dist = distance(latitude, longitude, zone.latitude, zone.longitude)
+
+            if zone_dist is None:
+                continue
+
+            within_zone = zone_dist - radius < zone.radius
+            closer_zone = closest is None or zone_dist < min_dist  # type: ignore
+            smaller_zone = (
+                zone_dist == min_dist and zone.radius < closest.radius  # type: ignore
+            )
+
+            if within_zone and (closer_zone or smaller_zone):
+                min_dist = zone_dist
+                closest = zone
+
+        return None if closest is None else closest.state
@@ -73,6 +73,7 @@ from homeassistant.exceptions import (
 from homeassistant.util import location, network
 from homeassistant.util.async_ import fire_coroutine_threadsafe, run_callback_threadsafe
 import homeassistant.util.dt as dt_util
+from homeassistant.util.executor import ExecutorPartitions
 from homeassistant.util.thread import fix_threading_exception_logging
 from homeassistant.util.timeout import TimeoutManager
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM, UnitSystem
@@ -236,6 +237,8 @@ class HomeAssistant:
         self._stopped: Optional[asyncio.Event] = None
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
+        # Thread pools to run jobs apart from the default executor
+        self.executors = ExecutorPartitions()
 
     @property
     def is_running(self) -> bool:
@@ -410,6 +413,23 @@ class HomeAssistant:
 
         return task
 
+    @callback
+    def async_add_executor_partition_job(
+        self, partition: str, target: Callable[..., T], *args: Any
+    ) -> Awaitable[T]:
+        """Add a job to a named executor partition from within the event loop.
+
+        Jobs in a partition do not compete for workers with jobs in the default
+        executor or in other partitions.
+        """
+        task = self.executors.get(partition).run_in_executor(self.loop, target, *args)
+
+        # If a task is scheduled
+        if self._track_task:
+            self._pending_tasks.append(task)
+
+        return task
+
     @callback
     def async_track_tasks(self) -> None:
         """Track tasks so you can wait for all tasks to be done."""
@@ -554,6 +574,9 @@ class HomeAssistant:
                 "Timed out waiting for shutdown stage 3 to complete, the shutdown will continue"
             )
 
+        # A forced stop may run after the default executor was shut down
+        if not self.executors.is_shutdown:
+            await self.loop.run_in_executor(None, self.executors.shutdown)
         # Python 3.9+ and backported in runner.py
         await self.loop.shutdown_default_executor()  # type: ignore
 
@@ -970,6 +993,21 @@ class StateMachine:
         self._states: Dict[str, State] = {}
         self._bus = bus
         self._loop = loop
+        self._change_count = 0
+        self._domain_change_count: Dict[str, int] = {}
+
+    @property
+    def change_count(self) -> int:
+        """Return the number of times a state was set or removed."""
+        return self._change_count
+
+    @callback
+    def async_domain_change_count(self, domain: str) -> int:
+        """Return the number of times a state of a domain was set or removed.
+
+        This method must be run in the event loop.
+        """
+        return self._domain_change_count.get(domain, 0)
 
     def entity_ids(self, domain_filter: Optional[str] = None) -> List[str]:
         """List of entity ids that are being tracked."""
@@ -1078,6 +1116,9 @@ class StateMachine:
         if old_state is None:
             return False
 
+        self._change_count += 1
+        domain = old_state.domain
+        self._domain_change_count[domain] = self._domain_change_count.get(domain, 0) + 1
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
@@ -1150,6 +1191,9 @@ class StateMachine:
 
         state = State(entity_id, new_state, attributes, last_changed, None, context)
         self._states[entity_id] = state
+        self._change_count += 1
+        domain = state.domain
+        self._domain_change_count[domain] = self._domain_change_count.get(domain, 0) + 1
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -6,7 +6,18 @@ import functools as ft
 import logging
 import re
 import sys
-from typing import Any, Callable, Container, List, Optional, Set, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Container,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 from homeassistant.components import zone as zone_cmp
 from homeassistant.components.device_automation import (
@@ -194,6 +205,11 @@ def numeric_state(
     ).result()
 
 
+NumericStateCheckerType = Callable[
+    [HomeAssistant, Union[None, str, State], TemplateVarsType], bool
+]
+
+
 def async_numeric_state(
     hass: HomeAssistant,
     entity: Union[None, str, State],
@@ -204,65 +220,121 @@ def async_numeric_state(
     attribute: Optional[str] = None,
 ) -> bool:
     """Test a numeric state condition."""
-    if isinstance(entity, str):
-        entity = hass.states.get(entity)
+    return async_numeric_state_checker(below, above, value_template, attribute)(
+        hass, entity, variables
+    )
 
-    if entity is None or (attribute is not None and attribute not in entity.attributes):
-        return False
 
-    value: Any = None
-    if value_template is None:
+def async_numeric_state_checker(
+    below: Optional[Union[float, str]] = None,
+    above: Optional[Union[float, str]] = None,
+    value_template: Optional[Template] = None,
+    attribute: Optional[str] = None,
+) -> NumericStateCheckerType:
+    """Compile a numeric state condition to test states repeatedly.
+
+    The numbers parsed from the states of the tested entities and of the
+    entities holding the limits are kept until these states change.
+    """
+    # Entity id -> the last state parsed and its number
+    values: Dict[str, Tuple[State, Optional[float]]] = {}
+    limits: Dict[str, Tuple[State, float]] = {}
+
+    def value_of(entity: State) -> Optional[float]:
+        """Return the number of the watched value of a state."""
+        cached = values.get(entity.entity_id)
+        if cached is not None and cached[0] is entity:
+            return cached[1]
+
+        value: Any
         if attribute is None:
             value = entity.state
         else:
             value = entity.attributes.get(attribute)
-    else:
-        variables = dict(variables or {})
-        variables["state"] = entity
-        try:
-            value = value_template.async_render(variables)
-        except TemplateError as ex:
-            _LOGGER.error("Template error: %s", ex)
+        fvalue = _async_parse_numeric_value(entity, value)
+        values[entity.entity_id] = (entity, fvalue)
+        return fvalue
+
+    def limit_of(hass: HomeAssistant, entity_id: str) -> Optional[float]:
+        """Return the number of the state of an entity holding a limit."""
+        limit_entity = hass.states.get(entity_id)
+        if limit_entity is None or limit_entity.state in (
+            STATE_UNAVAILABLE,
+            STATE_UNKNOWN,
+        ):
+            return None
+        cached = limits.get(entity_id)
+        if cached is not None and cached[0] is limit_entity:
+            return cached[1]
+        flimit = float(limit_entity.state)
+        limits[entity_id] = (limit_entity, flimit)
+        return flimit
+
+    def if_numeric_state(
+        hass: HomeAssistant,
+        entity: Union[None, str, State],
+        variables: TemplateVarsType = None,
+    ) -> bool:
+        """Test a numeric state condition."""
+        if isinstance(entity, str):
+            entity = hass.states.get(entity)
+
+        if entity is None or (
+            attribute is not None and attribute not in entity.attributes
+        ):
             return False
 
+        fvalue: Optional[float]
+        if value_template is None:
+            fvalue = value_of(entity)
+        else:
+            variables = dict(variables or {})
+            variables["state"] = entity
+            try:
+                value = value_template.async_render(variables)
+            except TemplateError as ex:
+                _LOGGER.error("Template error: %s", ex)
+                return False
+            fvalue = _async_parse_numeric_value(entity, value)
+
+        if fvalue is None:
+            return False
+
+        if below is not None:
+            if isinstance(below, str):
+                flimit = limit_of(hass, below)
+                if flimit is None or fvalue >= flimit:
+                    return False
+            elif fvalue >= below:
+                return False
+
+        if above is not None:
+            if isinstance(above, str):
+                flimit = limit_of(hass, above)
+                if flimit is None or fvalue <= flimit:
+                    return False
+            elif fvalue <= above:
+                return False
+
+        return True
+
+    return if_numeric_state
+
+
+def _async_parse_numeric_value(entity: State, value: Any) -> Optional[float]:
+    """Return the number of a value, None if it isn't a number."""
     if value in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-        return False
+        return None
 
     try:
-        fvalue = float(value)
+        return float(value)
     except ValueError:
         _LOGGER.warning(
             "Value cannot be processed as a number: %s (Offending entity: %s)",
             entity,
             value,
         )
-        return False
-
-    if below is not None:
-        if isinstance(below, str):
-            below_entity = hass.states.get(below)
-            if (
-                not below_entity
-                or below_entity.state in (STATE_UNAVAILABLE, STATE_UNKNOWN)
-                or fvalue >= float(below_entity.state)
-            ):
-                return False
-        elif fvalue >= below:
-            return False
-
-    if above is not None:
-        if isinstance(above, str):
-            above_entity = hass.states.get(above)
-            if (
-                not above_entity
-                or above_entity.state in (STATE_UNAVAILABLE, STATE_UNKNOWN)
-                or fvalue <= float(above_entity.state)
-            ):
-                return False
-        elif fvalue <= above:
-            return False
-
-    return True
+        return None
 
 
 def async_numeric_state_from_config(
@@ -277,6 +349,8 @@ def async_numeric_state_from_config(
     above = config.get(CONF_ABOVE)
     value_template = config.get(CONF_VALUE_TEMPLATE)
 
+    checker = async_numeric_state_checker(below, above, value_template, attribute)
+
     def if_numeric_state(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
@@ -284,12 +358,7 @@ def async_numeric_state_from_config(
         if value_template is not None:
             value_template.hass = hass
 
-        return all(
-            async_numeric_state(
-                hass, entity_id, below, above, value_template, variables, attribute
-            )
-            for entity_id in entity_ids
-        )
+        return all(checker(hass, entity_id, variables) for entity_id in entity_ids)
 
     return if_numeric_state
 
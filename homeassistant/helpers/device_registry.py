@@ -316,6 +316,81 @@ class DeviceRegistry:
         name_by_user=_UNDEF,
     ):
         """Update device attributes."""
+        new, data = self._async_apply_device_update(
+            device_id,
+            add_config_entry_id=add_config_entry_id,
+            remove_config_entry_id=remove_config_entry_id,
+            merge_connections=merge_connections,
+            merge_identifiers=merge_identifiers,
+            new_identifiers=new_identifiers,
+            manufacturer=manufacturer,
+            model=model,
+            name=name,
+            sw_version=sw_version,
+            entry_type=entry_type,
+            via_device_id=via_device_id,
+            area_id=area_id,
+            name_by_user=name_by_user,
+        )
+
+        if data is not None:
+            self.async_schedule_save()
+            self.hass.bus.async_fire(EVENT_DEVICE_REGISTRY_UPDATED, data)
+
+        return new
+
+    @callback
+    def async_update_devices(
+        self, updates: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Optional[DeviceEntry]]:
+        """Update properties of multiple devices at once.
+
+        Takes a mapping of device ID to the keyword arguments accepted by
+        async_update_device. The registry is saved once and the update events
+        are fired after all changes have been applied.
+        """
+        result: Dict[str, Optional[DeviceEntry]] = {}
+        events: List[Dict[str, Any]] = []
+
+        try:
+            for device_id, changes in updates.items():
+                new, data = self._async_apply_device_update(device_id, **changes)
+                result[device_id] = new
+                if data is not None:
+                    events.append(data)
+        finally:
+            if events:
+                self.async_schedule_save()
+            for data in events:
+                self.hass.bus.async_fire(EVENT_DEVICE_REGISTRY_UPDATED, data)
+
+        return result
+
+    @callback
+    def _async_apply_device_update(
+        self,
+        device_id,
+        *,
+        add_config_entry_id=_UNDEF,
+        remove_config_entry_id=_UNDEF,
+        merge_connections=_UNDEF,
+        merge_identifiers=_UNDEF,
+        new_identifiers=_UNDEF,
+        manufacturer=_UNDEF,
+        model=_UNDEF,
+        name=_UNDEF,
+        sw_version=_UNDEF,
+        entry_type=_UNDEF,
+        via_device_id=_UNDEF,
+        area_id=_UNDEF,
+        name_by_user=_UNDEF,
+    ):
+        """Apply changes to a device without saving or firing an event.
+
+        Returns the new device and the event data to fire, or None as event
+        data if nothing changed. Removing the last config entry removes the
+        device right away and returns None for both.
+        """
         old = self.devices[device_id]
 
         changes = {}
@@ -334,7 +409,7 @@ class DeviceRegistry:
         ):
             if config_entries == {remove_config_entry_id}:
                 self.async_remove_device(device_id)
-                return
+                return None, None
 
             config_entries = config_entries - {remove_config_entry_id}
 
@@ -374,21 +449,15 @@ class DeviceRegistry:
             changes["is_new"] = False
 
         if not changes:
-            return old
+            return old, None
 
         new = attr.evolve(old, **changes)
         self._update_device(old, new)
-        self.async_schedule_save()
-
-        self.hass.bus.async_fire(
-            EVENT_DEVICE_REGISTRY_UPDATED,
-            {
-                "action": "create" if "is_new" in changes else "update",
-                "device_id": new.id,
-            },
-        )
 
-        return new
+        return new, {
+            "action": "create" if "is_new" in changes else "update",
+            "device_id": new.id,
+        }
 
     @callback
     def async_remove_device(self, device_id: str) -> None:
@@ -515,9 +584,13 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        self.async_update_devices(
+            {
+                dev_id: {"area_id": None}
+                for dev_id, device in self.devices.items()
+                if area_id == device.area_id
+            }
+        )
 
 
 @singleton(DATA_REGISTRY)
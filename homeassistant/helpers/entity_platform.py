@@ -5,6 +5,9 @@ from datetime import datetime, timedelta
 from logging import Logger
 from types import ModuleType
 from typing import TYPE_CHECKING, Callable, Coroutine, Dict, Iterable, List, Optional
+import zlib
+
+import attr
 
 from homeassistant import config_entries
 from homeassistant.const import DEVICE_DEFAULT_NAME
@@ -37,6 +40,37 @@ PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+# Part of the scan interval over which the polling of platforms is spread
+POLLING_JITTER = 0.25
+
+
+@attr.s(slots=True)
+class PollStatistics:
+    """Statistics of the polls of a single entity."""
+
+    count: int = attr.ib(default=0)
+    total_time: float = attr.ib(default=0.0)
+    last_time: float = attr.ib(default=0.0)
+    max_time: float = attr.ib(default=0.0)
+    overruns: int = attr.ib(default=0)
+
+    @property
+    def average_time(self) -> float:
+        """Return the average duration of a poll."""
+        if not self.count:
+            return 0.0
+        return self.total_time / self.count
+
+    def as_dict(self) -> dict:
+        """Return a dictionary representation of the statistics."""
+        return {
+            "count": self.count,
+            "average_time": self.average_time,
+            "last_time": self.last_time,
+            "max_time": self.max_time,
+            "overruns": self.overruns,
+        }
+
 
 class EntityPlatform:
     """Manage the entities for a single platform."""
@@ -68,6 +102,9 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: Optional[CALLBACK_TYPE] = None
         self._process_updates: Optional[asyncio.Lock] = None
+        # Number of polling intervals skipped because previous was running
+        self.polling_overruns = 0
+        self.polling_stats: Dict[str, PollStatistics] = {}
 
         self.parallel_updates: Optional[asyncio.Semaphore] = None
 
@@ -332,8 +369,23 @@ class EntityPlatform:
             self.hass,
             self._update_entity_states,
             self.scan_interval,
+            self.scan_interval - self._polling_offset(),
         )
 
+    @callback
+    def _polling_offset(self) -> timedelta:
+        """Return the deterministic offset of the polling of this platform.
+
+        Platforms set up at the same time would otherwise all poll at the same
+        moment. The offset is derived from the platform identity so it does not
+        change between restarts.
+        """
+        key = f"{self.domain}.{self.platform_name}"
+        if self.config_entry is not None:
+            key = f"{key}.{self.config_entry.entry_id}"
+        fraction = (zlib.crc32(key.encode()) & 0xFFFF) / 0x10000
+        return self.scan_interval * (fraction * POLLING_JITTER)
+
     async def _async_add_entity(
         self, entity, update_before_add, entity_registry, device_registry
     ):
@@ -518,6 +570,7 @@ class EntityPlatform:
     async def async_remove_entity(self, entity_id: str) -> None:
         """Remove entity id from platform."""
         await self.entities[entity_id].async_remove()
+        self.polling_stats.pop(entity_id, None)
 
         # Clean up polling job if no longer needed
         if self._async_unsub_polling is not None and not any(
@@ -580,6 +633,7 @@ class EntityPlatform:
         if self._process_updates is None:
             self._process_updates = asyncio.Lock()
         if self._process_updates.locked():
+            self.polling_overruns += 1
             self.logger.warning(
                 "Updating %s %s took longer than the scheduled update interval %s",
                 self.platform_name,
@@ -593,11 +647,29 @@ class EntityPlatform:
             for entity in self.entities.values():
                 if not entity.should_poll:
                     continue
-                tasks.append(entity.async_update_ha_state(True))
+                tasks.append(self._async_poll_entity(entity))
 
             if tasks:
                 await asyncio.gather(*tasks)
 
+    async def _async_poll_entity(self, entity: "Entity") -> None:
+        """Poll a single entity and keep track of the poll duration."""
+        loop = self.hass.loop
+        start = loop.time()
+        try:
+            await entity.async_update_ha_state(True)
+        finally:
+            duration = loop.time() - start
+            stats = self.polling_stats.get(entity.entity_id)
+            if stats is None:
+                stats = self.polling_stats[entity.entity_id] = PollStatistics()
+            stats.count += 1
+            stats.total_time += duration
+            stats.last_time = duration
+            stats.max_time = max(stats.max_time, duration)
+            if duration > self.scan_interval.total_seconds():
+                stats.overruns += 1
+
 
 current_platform: ContextVar[Optional[EntityPlatform]] = ContextVar(
     "current_platform", default=None
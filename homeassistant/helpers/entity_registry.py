@@ -105,15 +105,16 @@ class RegistryEntry:
     original_name: Optional[str] = attr.ib(default=None)
     original_icon: Optional[str] = attr.ib(default=None)
     domain: str = attr.ib(init=False, repr=False)
+    disabled: bool = attr.ib(init=False, repr=False)
 
     @domain.default
     def _domain_default(self) -> str:
         """Compute domain value."""
         return split_entity_id(self.entity_id)[0]
 
-    @property
-    def disabled(self) -> bool:
-        """Return if entry is disabled."""
+    @disabled.default
+    def _disabled_default(self) -> bool:
+        """Compute if entry is disabled."""
         return self.disabled_by is not None
 
 
@@ -340,9 +341,83 @@ class EntityRegistry:
         original_icon=_UNDEF,
     ):
         """Private facing update properties method."""
+        new, data = self._async_apply_update(
+            entity_id,
+            name=name,
+            icon=icon,
+            config_entry_id=config_entry_id,
+            new_entity_id=new_entity_id,
+            device_id=device_id,
+            new_unique_id=new_unique_id,
+            disabled_by=disabled_by,
+            capabilities=capabilities,
+            supported_features=supported_features,
+            device_class=device_class,
+            unit_of_measurement=unit_of_measurement,
+            original_name=original_name,
+            original_icon=original_icon,
+        )
+
+        if data is not None:
+            self.async_schedule_save()
+            self.hass.bus.async_fire(EVENT_ENTITY_REGISTRY_UPDATED, data)
+
+        return new
+
+    @callback
+    def async_update_entities(
+        self, updates: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, RegistryEntry]:
+        """Update properties of multiple entities at once.
+
+        Takes a mapping of entity ID to the keyword arguments accepted by
+        async_update_entity. The registry is saved once and the update events
+        are fired after all changes have been applied.
+        """
+        result: Dict[str, RegistryEntry] = {}
+        events: List[Dict[str, Any]] = []
+
+        try:
+            for entity_id, changes in updates.items():
+                new, data = self._async_apply_update(entity_id, **changes)
+                result[entity_id] = new
+                if data is not None:
+                    events.append(data)
+        finally:
+            if events:
+                self.async_schedule_save()
+            for data in events:
+                self.hass.bus.async_fire(EVENT_ENTITY_REGISTRY_UPDATED, data)
+
+        return result
+
+    @callback
+    def _async_apply_update(
+        self,
+        entity_id: str,
+        *,
+        name: Any = _UNDEF,
+        icon: Any = _UNDEF,
+        config_entry_id: Any = _UNDEF,
+        new_entity_id: Any = _UNDEF,
+        device_id: Any = _UNDEF,
+        new_unique_id: Any = _UNDEF,
+        disabled_by: Any = _UNDEF,
+        capabilities: Any = _UNDEF,
+        supported_features: Any = _UNDEF,
+        device_class: Any = _UNDEF,
+        unit_of_measurement: Any = _UNDEF,
+        original_name: Any = _UNDEF,
+        original_icon: Any = _UNDEF,
+    ) -> Tuple[RegistryEntry, Optional[Dict[str, Any]]]:
+        """Apply changes to an entry without saving or firing an event.
+
+        Returns the new entry and the event data to fire, or None as event data
+        if nothing changed.
+        """
         old = self.entities[entity_id]
 
-        changes = {}
+        changes: Dict[str, Any] = {}
 
         for attr_name, value in (
             ("name", name),
@@ -385,22 +460,22 @@ class EntityRegistry:
             changes["unique_id"] = new_unique_id
 
         if not changes:
-            return old
+            return old, None
 
         self._remove_index(old)
         new = attr.evolve(old, **changes)
         self._register_entry(new)
 
-        self.async_schedule_save()
-
-        data = {"action": "update", "entity_id": entity_id, "changes": list(changes)}
+        data: Dict[str, Any] = {
+            "action": "update",
+            "entity_id": entity_id,
+            "changes": list(changes),
+        }
 
         if old.entity_id != entity_id:
             data["old_entity_id"] = old.entity_id
 
-        self.hass.bus.async_fire(EVENT_ENTITY_REGISTRY_UPDATED, data)
-
-        return new
+        return new, data
 
     async def async_load(self) -> None:
         """Load the entity registry."""
@@ -611,12 +686,15 @@ async def async_migrate_entries(
 ) -> None:
     """Migrator of unique IDs."""
     ent_reg = await async_get_registry(hass)
+    updates: Dict[str, Dict[str, Any]] = {}
 
     for entry in ent_reg.entities.values():
         if entry.config_entry_id != config_entry_id:
             continue
 
-        updates = entry_callback(entry)
+        entry_updates = entry_callback(entry)
+
+        if entry_updates is not None:
+            updates[entry.entity_id] = entry_updates
 
-        if updates is not None:
-            ent_reg.async_update_entity(entry.entity_id, **updates)
+    ent_reg.async_update_entities(updates)
@@ -1092,8 +1092,13 @@ def async_track_time_interval(
     hass: HomeAssistant,
     action: Callable[..., Union[None, Awaitable]],
     interval: timedelta,
+    first_interval: Optional[timedelta] = None,
 ) -> CALLBACK_TYPE:
-    """Add a listener that fires repetitively at every timedelta interval."""
+    """Add a listener that fires repetitively at every timedelta interval.
+
+    The first_interval allows to fire the first time after a different delay,
+    which shifts all following intervals as well.
+    """
     remove = None
     interval_listener_job = None
 
@@ -1115,7 +1120,13 @@ def async_track_time_interval(
         hass.async_run_hass_job(job, now)
 
     interval_listener_job = HassJob(interval_listener)
-    remove = async_track_point_in_utc_time(hass, interval_listener_job, next_interval())
+
+    if first_interval is None:
+        first_point = next_interval()
+    else:
+        first_point = dt_util.utcnow() + first_interval
+
+    remove = async_track_point_in_utc_time(hass, interval_listener_job, first_point)
 
     def remove_listener() -> None:
         """Remove interval listener."""
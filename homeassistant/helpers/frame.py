@@ -3,7 +3,7 @@ import asyncio
 import functools
 import logging
 from traceback import FrameSummary, extract_stack
-from typing import Any, Callable, Optional, Tuple, TypeVar, cast
+from typing import Any, Callable, List, Optional, Tuple, TypeVar, cast
 
 from homeassistant.exceptions import HomeAssistantError
 
@@ -16,11 +16,18 @@ def get_integration_frame(
     exclude_integrations: Optional[set] = None,
 ) -> Tuple[FrameSummary, str, str]:
     """Return the frame, integration and integration path of the current stack frame."""
+    return find_integration_frame(extract_stack(), exclude_integrations)
+
+
+def find_integration_frame(
+    stack: List[FrameSummary], exclude_integrations: Optional[set] = None
+) -> Tuple[FrameSummary, str, str]:
+    """Return the frame, integration and integration path of the last frame in a stack."""
     found_frame = None
     if not exclude_integrations:
         exclude_integrations = set()
 
-    for frame in reversed(extract_stack()):
+    for frame in reversed(stack):
         for path in ("custom_components/", "homeassistant/components/"):
             try:
                 index = frame.filename.index(path)
@@ -4,14 +4,14 @@ import asyncio
 import base64
 import collections.abc
 from datetime import datetime, timedelta
-from functools import wraps
+from functools import lru_cache, wraps
 import json
 import logging
 import math
 from operator import attrgetter
 import random
 import re
-from typing import Any, Generator, Iterable, List, Optional, Union
+from typing import Any, Generator, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urlencode as urllib_urlencode
 import weakref
 
@@ -58,6 +58,14 @@ _RE_GET_ENTITIES = re.compile(
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 
+# Templates only looking up a path in value_json, like {{ value_json.a[0] }}
+_RE_JSON_PATH_TEMPLATE = re.compile(
+    r"^\s*\{\{\s*value_json((?:\s*(?:\.[a-zA-Z_]\w*|\[\s*(?:\d+|'[^'\\]*'|\"[^\"\\]*\")\s*\]))+)\s*\}\}\s*$"
+)
+_RE_JSON_PATH_STEP = re.compile(
+    r"\.(?P<attr>[a-zA-Z_]\w*)|\[\s*(?:(?P<index>\d+)|'(?P<key>[^']*)'|\"(?P<dkey>[^\"]*)\")\s*\]"
+)
+
 _RESERVED_NAMES = {"contextfunction", "evalcontextfunction", "environmentfunction"}
 
 _GROUP_DOMAIN_PREFIX = "group."
@@ -274,6 +282,10 @@ class Template:
         self._compiled = None
         self.hass = hass
         self.is_static = not is_template_string(template)
+        self._json_path = _SENTINEL
+        # Number of renders with a value, and of those using the JSON path
+        self.value_render_count = 0
+        self.json_path_render_count = 0
 
     @property
     def _env(self):
@@ -453,16 +465,27 @@ class Template:
         if self.is_static:
             return self.template
 
+        self.value_render_count += 1
+        if isinstance(value, str):
+            value_json = _parse_json_cached(value)
+        else:
+            value_json = _parse_json(value)
+
+        if self._json_path is _SENTINEL:
+            self._json_path = _compile_json_path(self.template)
+        if self._json_path is not None and value_json is not _SENTINEL:
+            result = _lookup_json_path(value_json, self._json_path)
+            if result is not _SENTINEL:
+                self.json_path_render_count += 1
+                return str(result).strip()
+
         if self._compiled is None:
             self._ensure_compiled()
 
         variables = dict(variables or {})
         variables["value"] = value
-
-        try:
-            variables["value_json"] = json.loads(value)
-        except (ValueError, TypeError):
-            pass
+        if value_json is not _SENTINEL:
+            variables["value_json"] = value_json
 
         try:
             return self._compiled.render(variables).strip()
@@ -1223,6 +1246,55 @@ def urlencode(value):
     return urllib_urlencode(value).encode("utf-8")
 
 
+def _parse_json(value: Any) -> Any:
+    """Parse a JSON value, return _SENTINEL if it is not valid JSON."""
+    try:
+        return json.loads(value)
+    except (ValueError, TypeError):
+        return _SENTINEL
+
+
+# A payload is often rendered by several templates, parse it only once. The
+# result is shared, templates can't modify it in the immutable sandbox.
+_parse_json_cached = lru_cache(maxsize=16)(_parse_json)
+
+
+def _compile_json_path(template: str) -> Optional[List[Tuple[bool, Any]]]:
+    """Return the steps of a template only looking up a path in value_json."""
+    match = _RE_JSON_PATH_TEMPLATE.match(template)
+    if match is None:
+        return None
+
+    steps: List[Tuple[bool, Any]] = []
+    for step in _RE_JSON_PATH_STEP.finditer(match.group(1)):
+        if step.group("attr") is not None:
+            steps.append((True, step.group("attr")))
+        elif step.group("index") is not None:
+            steps.append((False, int(step.group("index"))))
+        elif step.group("key") is not None:
+            steps.append((False, step.group("key")))
+        else:
+            steps.append((False, step.group("dkey")))
+    return steps
+
+
+def _lookup_json_path(value_json: Any, steps: List[Tuple[bool, Any]]) -> Any:
+    """Look up a path like Jinja, return _SENTINEL if Jinja has to decide."""
+    result = value_json
+    for is_attr, key in steps:
+        # Jinja prefers attributes for dot lookups, like dict.items
+        if is_attr and (not isinstance(result, dict) or hasattr(result, key)):
+            return _SENTINEL
+        if isinstance(result, (dict, list)):
+            try:
+                result = result[key]
+                continue
+            except (KeyError, IndexError, TypeError):
+                pass
+        return _SENTINEL
+    return result
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
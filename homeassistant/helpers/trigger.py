@@ -61,6 +61,7 @@ async def async_initialize_triggers(
     log_cb: Callable,
     home_assistant_start: bool = False,
     variables: Optional[Union[Dict[str, Any], MappingProxyType]] = None,
+    entity_id: Optional[str] = None,
 ) -> Optional[CALLBACK_TYPE]:
     """Initialize triggers."""
     info = {
@@ -68,6 +69,7 @@ async def async_initialize_triggers(
         "name": name,
         "home_assistant_start": home_assistant_start,
         "variables": variables,
+        "entity_id": entity_id,
     }
 
     triggers = []
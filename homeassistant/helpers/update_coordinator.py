@@ -3,7 +3,19 @@ import asyncio
 from datetime import datetime, timedelta
 import logging
 from time import monotonic
-from typing import Awaitable, Callable, Generic, List, Optional, TypeVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
 import urllib.error
 
 import aiohttp
@@ -18,6 +30,9 @@ from .debounce import Debouncer
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
 
+DATA_SHARED_FETCHES = "update_coordinator_shared_fetches"
+DATA_SHARED_RESULTS = "update_coordinator_shared_results"
+
 T = TypeVar("T")
 
 
@@ -37,13 +52,32 @@ class DataUpdateCoordinator(Generic[T]):
         update_interval: Optional[timedelta] = None,
         update_method: Optional[Callable[[], Awaitable[T]]] = None,
         request_refresh_debouncer: Optional[Debouncer] = None,
+        fetch_key: Optional[Hashable] = None,
+        max_update_interval: Optional[timedelta] = None,
     ):
-        """Initialize global data updater."""
+        """Initialize global data updater.
+
+        Coordinators with the same fetch_key share a fetch that is in progress
+        instead of starting their own. Their scheduled refreshes also reuse the
+        last data fetched by another of them if it is more recent than their
+        update interval. When max_update_interval is set, the
+        update interval doubles every time the fetched data did not change,
+        up to max_update_interval.
+        """
         self.hass = hass
         self.logger = logger
         self.name = name
         self.update_method = update_method
         self.update_interval = update_interval
+        self.fetch_key = fetch_key
+        self.max_update_interval = max_update_interval
+        self._interval_backoff = 1
+
+        self.fetch_count = 0
+        self.shared_fetch_count = 0
+        self.unchanged_fetch_count = 0
+        self.last_fetch_duration = 0.0
+        self.total_fetch_duration = 0.0
 
         self.data: Optional[T] = None
 
@@ -89,14 +123,25 @@ class DataUpdateCoordinator(Generic[T]):
         """Remove data update."""
         self._listeners.remove(update_callback)
 
-        if not self._listeners and self._unsub_refresh:
+        if self._listeners:
+            return
+
+        if self._unsub_refresh:
             self._unsub_refresh()
             self._unsub_refresh = None
 
+        # Don't keep the data of a coordinator nobody listens to anymore
+        results = self.hass.data.get(DATA_SHARED_RESULTS)
+        if results:
+            result = results.get(self.fetch_key)
+            if result is not None and result[1] == id(self):
+                del results[self.fetch_key]
+
     @callback
     def _schedule_refresh(self) -> None:
         """Schedule a refresh."""
-        if self.update_interval is None:
+        update_interval = self.current_update_interval
+        if update_interval is None:
             return
 
         if self._unsub_refresh:
@@ -110,13 +155,37 @@ class DataUpdateCoordinator(Generic[T]):
         self._unsub_refresh = event.async_track_point_in_utc_time(
             self.hass,
             self._job,
-            utcnow().replace(microsecond=0) + self.update_interval,
+            utcnow().replace(microsecond=0) + update_interval,
         )
 
+    @property
+    def current_update_interval(self) -> Optional[timedelta]:
+        """Return the update interval including the backoff for unchanged data."""
+        if self.update_interval is None or self.max_update_interval is None:
+            return self.update_interval
+        return min(
+            self.update_interval * self._interval_backoff, self.max_update_interval
+        )
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return the fetch statistics of the coordinator."""
+        return {
+            "fetch_count": self.fetch_count,
+            "shared_fetch_count": self.shared_fetch_count,
+            "unchanged_fetch_count": self.unchanged_fetch_count,
+            "last_fetch_duration": self.last_fetch_duration,
+            "average_fetch_duration": (
+                self.total_fetch_duration / self.fetch_count
+                if self.fetch_count
+                else 0.0
+            ),
+        }
+
     async def _handle_refresh_interval(self, _now: datetime) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
-        await self.async_refresh()
+        await self._async_refresh(reuse_shared=True)
 
     async def async_request_refresh(self) -> None:
         """Request a refresh.
@@ -131,8 +200,79 @@ class DataUpdateCoordinator(Generic[T]):
             raise NotImplementedError("Update method not implemented")
         return await self.update_method()
 
+    async def _async_fetch_data(self, reuse_shared: bool = False) -> Optional[T]:
+        """Fetch data, sharing a fetch in progress for the same fetch key.
+
+        With reuse_shared, the last data fetched by another coordinator with
+        the same fetch key within the update interval is returned instead.
+        """
+        if self.fetch_key is None:
+            return await self._async_timed_update_data()
+
+        # Fetch key -> when the data was fetched, the id of its coordinator, data
+        results: Dict[Hashable, Tuple[float, int, Any]] = self.hass.data.setdefault(
+            DATA_SHARED_RESULTS, {}
+        )
+        result = results.get(self.fetch_key)
+        if (
+            reuse_shared
+            and result is not None
+            and result[1] != id(self)
+            and self.update_interval is not None
+            and monotonic() - result[0] < self.update_interval.total_seconds()
+        ):
+            self.shared_fetch_count += 1
+            return cast(Optional[T], result[2])
+
+        fetches: Dict[Hashable, asyncio.Future] = self.hass.data.setdefault(
+            DATA_SHARED_FETCHES, {}
+        )
+        fetch = fetches.get(self.fetch_key)
+
+        if fetch is not None:
+            self.shared_fetch_count += 1
+            try:
+                return await asyncio.shield(fetch)
+            except asyncio.CancelledError:
+                if not fetch.cancelled():
+                    raise
+            # The coordinator that started the fetch got cancelled
+            return await self._async_fetch_data()
+
+        fetch = fetches[self.fetch_key] = self.hass.loop.create_future()
+        try:
+            data = await self._async_timed_update_data()
+        except asyncio.CancelledError:
+            fetch.cancel()
+            raise
+        except Exception as err:
+            fetch.set_exception(err)
+            # Mark as retrieved, it is raised to the caller below
+            fetch.exception()
+            raise
+        else:
+            fetch.set_result(data)
+            results[self.fetch_key] = (monotonic(), id(self), data)
+            return data
+        finally:
+            del fetches[self.fetch_key]
+
+    async def _async_timed_update_data(self) -> Optional[T]:
+        """Fetch the latest data and keep track of the fetch duration."""
+        start = monotonic()
+        try:
+            return await self._async_update_data()
+        finally:
+            self.last_fetch_duration = monotonic() - start
+            self.total_fetch_duration += self.last_fetch_duration
+            self.fetch_count += 1
+
     async def async_refresh(self) -> None:
         """Refresh data."""
+        await self._async_refresh()
+
+    async def _async_refresh(self, reuse_shared: bool = False) -> None:
+        """Refresh data, reusing recent shared data if allowed."""
         if self._unsub_refresh:
             self._unsub_refresh()
             self._unsub_refresh = None
@@ -141,7 +281,7 @@ class DataUpdateCoordinator(Generic[T]):
 
         try:
             start = monotonic()
-            self.data = await self._async_update_data()
+            data = await self._async_fetch_data(reuse_shared)
 
         except (asyncio.TimeoutError, requests.exceptions.Timeout):
             if self.last_update_success:
@@ -176,6 +316,20 @@ class DataUpdateCoordinator(Generic[T]):
             )
 
         else:
+            if self.max_update_interval is not None:
+                if self.last_update_success and data == self.data:
+                    self.unchanged_fetch_count += 1
+                    current_interval = self.current_update_interval
+                    if (
+                        current_interval is not None
+                        and current_interval < self.max_update_interval
+                    ):
+                        self._interval_backoff *= 2
+                else:
+                    self._interval_backoff = 1
+
+            self.data = data
+
             if not self.last_update_success:
                 self.last_update_success = True
                 self.logger.info("Fetching %s data recovered", self.name)
@@ -323,6 +323,273 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def entity_registry_bulk_update(hass):
+    """Rename 10k registry entries ten times with bulk updates."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import entity_registry
+
+    registry = entity_registry.EntityRegistry(hass)
+    registry.entities = collections.OrderedDict()
+    # pylint: disable=protected-access
+    registry._rebuild_index()
+
+    entity_ids = [
+        registry.async_get_or_create("light", "bench", str(idx)).entity_id
+        for idx in range(10 ** 4)
+    ]
+
+    start = timer()
+
+    for count in range(10):
+        registry.async_update_entities(
+            {entity_id: {"name": f"Light {count}"} for entity_id in entity_ids}
+        )
+
+    await hass.async_block_till_done()
+
+    runtime = timer() - start
+
+    # Do not write the benchmark registry to disk
+    registry._store._async_cleanup_delay_listener()
+    registry._store._async_cleanup_final_write_listener()
+
+    return runtime
+
+
+@benchmark
+async def influxdb_write(hass):
+    """Write 10k state changes to a local InfluxDB stand-in with gzip."""
+    # pylint: disable=import-outside-toplevel
+    from aiohttp import web
+
+    from homeassistant.components import influxdb
+
+    received = 0
+
+    async def write(request):
+        """Count the points of a write request, aiohttp decompresses the body."""
+        nonlocal received
+        received += (await request.read()).count(b"\n")
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.router.add_post("/write", write)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    # pylint: disable=protected-access
+    port = site._server.sockets[0].getsockname()[1]
+
+    conf = influxdb.INFLUX_SCHEMA({"host": "127.0.0.1", "port": port, "gzip": True})
+    influx = await hass.async_add_executor_job(
+        influxdb.get_influx_connection, conf, True
+    )
+    instance = await hass.async_add_executor_job(
+        influxdb.InfluxThread,
+        hass,
+        influx,
+        influxdb._generate_event_to_json(conf),
+        0,
+    )
+    instance.start()
+
+    attributes = {"unit_of_measurement": "W", "friendly_name": "Power"}
+    states = [
+        core.State(f"sensor.power_{idx}", str(idx), attributes) for idx in range(100)
+    ]
+
+    start = timer()
+
+    for idx in range(10 ** 4):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, {"new_state": states[idx % 100]})
+
+    await hass.async_block_till_done()
+    instance.queue.put(None)
+    await hass.async_add_executor_job(instance.join)
+
+    runtime = timer() - start
+
+    influx.close()
+    await runner.cleanup()
+    assert received == 10 ** 4, received
+    return runtime
+
+
+@benchmark
+async def api_states_auth(hass):
+    """Fetch the states 5k times from the REST API with a bearer token."""
+    # pylint: disable=import-outside-toplevel
+    import tempfile
+
+    from aiohttp import ClientSession, web
+
+    from homeassistant.auth import auth_manager_from_config
+    from homeassistant.components.api import APIStatesView
+    from homeassistant.components.http.auth import setup_auth
+
+    hass.config.config_dir = tempfile.mkdtemp()
+    hass.auth = await auth_manager_from_config(hass, [{"type": "homeassistant"}], [])
+    user = await hass.auth.async_create_user("Benchmark", ["system-admin"])
+    refresh_token = await hass.auth.async_create_refresh_token(
+        user, "http://localhost/"
+    )
+    token = hass.auth.async_create_access_token(refresh_token)
+    hass.states.async_set("sensor.benchmark", "on")
+
+    app = web.Application()
+    app["hass"] = hass
+    setup_auth(hass, app)
+    APIStatesView().register(app, app.router)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    # pylint: disable=protected-access
+    port = site._server.sockets[0].getsockname()[1]
+
+    url = f"http://127.0.0.1:{port}/api/states"
+    headers = {"Authorization": f"Bearer {token}"}
+    count = 5 * 10 ** 3
+
+    async with ClientSession() as session:
+        start = timer()
+        for _ in range(count):
+            async with session.get(url, headers=headers) as resp:
+                assert resp.status == 200
+                await resp.read()
+        runtime = timer() - start
+
+    await runner.cleanup()
+    print(f"{count / runtime:.0f} requests/s")
+    return runtime
+
+
+@benchmark
+async def mqtt_dispatch(hass):
+    """Dispatch 100k MQTT messages from a thread to 5k subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import config_entries
+    from homeassistant.components import mqtt
+
+    entry = config_entries.ConfigEntry(
+        1,
+        mqtt.DOMAIN,
+        "Benchmark",
+        {},
+        config_entries.SOURCE_USER,
+        config_entries.CONN_CLASS_LOCAL_PUSH,
+        {},
+    )
+    conf = mqtt.CONFIG_SCHEMA({mqtt.DOMAIN: {mqtt.CONF_BROKER: "localhost"}})
+    instance = mqtt.MQTT(hass, entry, conf[mqtt.DOMAIN])
+
+    count = 10 ** 5
+    devices = 5 * 10 ** 3
+    received = 0
+    done = asyncio.Event()
+
+    @core.callback
+    def listener(_):
+        nonlocal received
+        received += 1
+        if received == count:
+            done.set()
+
+    @core.callback
+    def wildcard_listener(_):
+        pass
+
+    for index in range(devices - 2):
+        await instance.async_subscribe(f"zigbee2mqtt/device_{index}", listener, 0)
+    await instance.async_subscribe("zigbee2mqtt/+/availability", wildcard_listener, 0)
+    await instance.async_subscribe("homeassistant/#", wildcard_listener, 0)
+
+    messages = [
+        mqtt.Message(f"zigbee2mqtt/device_{index % (devices - 2)}", b"{}", 0, False)
+        for index in range(count)
+    ]
+
+    def receive():
+        for msg in messages:
+            instance._mqtt_on_message(  # pylint: disable=protected-access
+                None, None, msg
+            )
+
+    start = timer()
+    await hass.async_add_executor_job(receive)
+    await done.wait()
+    runtime = timer() - start
+
+    print(f"{count / runtime:.0f} messages/s")
+    return runtime
+
+
+@benchmark
+async def numeric_state_triggers(hass):
+    """Run 10 minutes of 1 Hz updates of 500 sensors with numeric triggers."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.homeassistant.triggers import numeric_state
+
+    sensors = 500
+    seconds = 600
+    fired = 0
+
+    @core.callback
+    def action(_variables, _context=None):
+        nonlocal fired
+        fired += 1
+
+    for idx in range(sensors):
+        hass.states.async_set(f"sensor.temperature_{idx}", 20)
+        await numeric_state.async_attach_trigger(
+            hass,
+            numeric_state.TRIGGER_SCHEMA(
+                {
+                    "platform": "numeric_state",
+                    "entity_id": f"sensor.temperature_{idx}",
+                    "above": 25,
+                }
+            ),
+            action,
+            {"name": f"Temperature {idx}"},
+        )
+
+    # Sensors report every second, mostly with only their signal strength
+    # changed, and cross the limit every minute
+    states = [
+        [
+            core.State(
+                f"sensor.temperature_{idx}",
+                str(20 + (second // 30) % 2 * 10),
+                {"rssi": -60 - second % 5},
+            )
+            for idx in range(sensors)
+        ]
+        for second in range(seconds)
+    ]
+
+    start = timer()
+
+    for second in range(1, seconds):
+        for old_state, new_state in zip(states[second - 1], states[second]):
+            hass.bus.async_fire(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": new_state.entity_id,
+                    "old_state": old_state,
+                    "new_state": new_state,
+                },
+            )
+        await hass.async_block_till_done()
+
+    runtime = timer() - start
+
+    print(f"{fired} triggers fired, {sensors * seconds / runtime:.0f} updates/s")
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -0,0 +1,124 @@
+"""Executor partitions to keep latency critical jobs apart from bulk work."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+EXECUTOR_IO = "io"
+EXECUTOR_DB_READ = "db_read"
+EXECUTOR_CPU = "cpu"
+EXECUTOR_POLLING = "polling"
+
+DEFAULT_PARTITION_SIZES = {
+    EXECUTOR_IO: 8,
+    EXECUTOR_DB_READ: 4,
+    EXECUTOR_CPU: os.cpu_count() or 1,
+    EXECUTOR_POLLING: 16,
+}
+
+
+class ExecutorPartition:
+    """A named thread pool that keeps track of how long jobs are queued."""
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        """Initialize the partition."""
+        self.name = name
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.started = 0
+        self.completed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool, create it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                thread_name_prefix=f"SyncWorker_{self.name}",
+                max_workers=self.max_workers,
+            )
+        return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of jobs waiting for a worker."""
+        return self.submitted - self.started
+
+    def run_in_executor(
+        self, loop: asyncio.AbstractEventLoop, target: Callable[..., T], *args: Any
+    ) -> Awaitable[T]:
+        """Run a job in this partition."""
+        queued = time.monotonic()
+        self.submitted += 1
+
+        def run_job() -> T:
+            """Run the job and record how long it waited."""
+            wait = time.monotonic() - queued
+            with self._lock:
+                self.started += 1
+                self.total_wait += wait
+                if wait > self.max_wait:
+                    self.max_wait = wait
+            try:
+                return target(*args)
+            finally:
+                with self._lock:
+                    self.completed += 1
+
+        return loop.run_in_executor(self.executor, run_job)
+
+    def shutdown(self) -> None:
+        """Shut down the thread pool and wait for running jobs."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics of the partition."""
+        with self._lock:
+            started = self.started
+            return {
+                "max_workers": self.max_workers,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "queue_depth": self.submitted - started,
+                "average_wait": self.total_wait / started if started else 0.0,
+                "max_wait": self.max_wait,
+            }
+
+
+class ExecutorPartitions:
+    """Hold the executor partitions of a Home Assistant instance."""
+
+    def __init__(self, sizes: Optional[Dict[str, int]] = None) -> None:
+        """Initialize the partitions."""
+        sizes = {**DEFAULT_PARTITION_SIZES, **(sizes or {})}
+        self.partitions = {
+            name: ExecutorPartition(name, max_workers)
+            for name, max_workers in sizes.items()
+        }
+        self.is_shutdown = False
+
+    def get(self, name: str) -> ExecutorPartition:
+        """Return a partition by name."""
+        partition = self.partitions.get(name)
+        if partition is None:
+            raise ValueError(f"Unknown executor partition {name}")
+        return partition
+
+    def shutdown(self) -> None:
+        """Shut down all partitions."""
+        self.is_shutdown = True
+        for partition in self.partitions.values():
+            partition.shutdown()
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Return the statistics of all partitions."""
+        return {name: part.as_dict() for name, part in self.partitions.items()}
@@ -5,6 +5,7 @@ detect_location_info and elevation are mocked by default during tests.
 """
 import asyncio
 import collections
+from functools import lru_cache
 import math
 from typing import Any, Dict, Optional, Tuple
 
@@ -23,6 +24,10 @@ FLATTENING = 1 / 298.257223563
 # Axis b of the ellipsoid in meters.
 AXIS_B = 6356752.314245
 
+# Distances recently calculated, shared by the zone lookups of device trackers
+# and the proximity calculations that measure the same points again
+DISTANCE_CACHE_SIZE = 1024
+
 MILES_PER_KILOMETER = 0.621371
 MAX_ITERATIONS = 200
 CONVERGENCE_THRESHOLD = 1e-12
@@ -71,6 +76,14 @@ def distance(
     """
     if lat1 is None or lon1 is None:
         return None
+    return _cached_distance(lat1, lon1, lat2, lon2)
+
+
+@lru_cache(maxsize=DISTANCE_CACHE_SIZE)
+def _cached_distance(
+    lat1: float, lon1: float, lat2: float, lon2: float
+) -> Optional[float]:
+    """Calculate the distance in meters between two points, cached."""
     result = vincenty((lat1, lon1), (lat2, lon2))
     if result is None:
         return None
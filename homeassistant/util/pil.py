@@ -2,9 +2,10 @@
 
 Can only be used by integrations that have pillow in their requirements.
 """
-from typing import Tuple
+import io
+from typing import Optional, Tuple
 
-from PIL import ImageDraw
+from PIL import Image, ImageDraw
 
 
 def draw_box(
@@ -45,3 +46,27 @@ def draw_box(
         draw.text(
             (left + line_width, abs(top - line_width - font_height)), text, fill=color
         )
+
+
+def scale_jpeg_image(
+    image: bytes, width: Optional[int], height: Optional[int], quality: int = 75
+) -> bytes:
+    """
+    Scale down a JPEG image to fit within a width and height.
+
+    The aspect ratio is kept and images are never scaled up. If the image
+    already fits, the original bytes are returned.
+    """
+    img = Image.open(io.BytesIO(image))
+    size = (width or img.width, height or img.height)
+    if img.width <= size[0] and img.height <= size[1]:
+        return image
+
+    img.draft("RGB", size)
+    img.thumbnail(size)
+    if img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+
+    output = io.BytesIO()
+    img.save(output, format="JPEG", quality=quality)
+    return output.getvalue()
@@ -1,8 +1,13 @@
 """Test report state."""
+from datetime import timedelta
+
 from homeassistant.components.alexa import state_report
+from homeassistant.util.dt import utcnow
 
 from . import DEFAULT_CONFIG, TEST_URL
 
+from tests.common import async_fire_time_changed
+
 
 async def test_report_state(hass, aioclient_mock):
     """Test proactive state reports."""
@@ -24,6 +29,10 @@ async def test_report_state(hass, aioclient_mock):
 
     # To trigger event listener
     await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=state_report.REPORT_STATE_WINDOW)
+    )
+    await hass.async_block_till_done()
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
@@ -70,6 +79,10 @@ async def test_report_state_instance(hass, aioclient_mock):
 
     # To trigger event listener
     await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=state_report.REPORT_STATE_WINDOW)
+    )
+    await hass.async_block_till_done()
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
@@ -88,6 +101,45 @@ async def test_report_state_instance(hass, aioclient_mock):
     assert call_json["event"]["endpoint"]["endpointId"] == "fan#test_fan"
 
 
+async def test_report_state_batched(hass, aioclient_mock):
+    """Test changes are collected, unchanged reports skipped and failures retried."""
+    aioclient_mock.post(TEST_URL, text="", status=500)
+    attributes = {"friendly_name": "Test Contact Sensor", "device_class": "door"}
+    hass.states.async_set("binary_sensor.test_contact", "on", attributes)
+
+    await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    hass.states.async_set("binary_sensor.test_contact", "off", attributes)
+    hass.states.async_set("binary_sensor.test_contact", "on", attributes)
+    await hass.async_block_till_done()
+    now = utcnow() + timedelta(seconds=state_report.REPORT_STATE_WINDOW)
+    async_fire_time_changed(hass, now)
+    await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 1
+    call_json = aioclient_mock.mock_calls[0][2]
+    assert call_json["event"]["payload"]["change"]["properties"][0]["value"] == (
+        "DETECTED"
+    )
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.post(TEST_URL, text="", status=202)
+    now += timedelta(seconds=state_report.RETRY_DELAY)
+    async_fire_time_changed(hass, now)
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 1
+
+    # Changes of attributes Alexa doesn't report are skipped
+    hass.states.async_set(
+        "binary_sensor.test_contact", "on", {**attributes, "other": "value"}
+    )
+    await hass.async_block_till_done()
+    now += timedelta(seconds=state_report.REPORT_STATE_WINDOW)
+    async_fire_time_changed(hass, now)
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 1
+
+
 async def test_send_add_or_update_message(hass, aioclient_mock):
     """Test sending an AddOrUpdateReport message."""
     aioclient_mock.post(TEST_URL, text="")
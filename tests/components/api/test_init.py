@@ -2,7 +2,7 @@
 # pylint: disable=protected-access
 import json
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import pytest
 import voluptuous as vol
 
@@ -480,6 +480,74 @@ async def test_states_view_filters(hass, mock_api_client, hass_admin_user):
     assert json[0]["entity_id"] == "test.entity"
 
 
+async def test_states_view_query(hass, mock_api_client):
+    """Test filtering states by entity_id and domain and projecting fields."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100, "other": 1})
+    hass.states.async_set("light.hall", "off")
+    hass.states.async_set("switch.fan", "on")
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES,
+        params=[("entity_id", "switch.fan,light.kitchen"), ("entity_id", "x.y")],
+    )
+    assert [state["entity_id"] for state in await resp.json()] == [
+        "switch.fan",
+        "light.kitchen",
+    ]
+
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"domain": "light"})
+    assert {state["entity_id"] for state in await resp.json()} == {
+        "light.kitchen",
+        "light.hall",
+    }
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES,
+        params={"entity_id": "light.kitchen", "fields": "state,attributes.brightness"},
+    )
+    assert await resp.json() == [
+        {"entity_id": "light.kitchen", "state": "on", "attributes": {"brightness": 100}}
+    ]
+
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"fields": "bla"})
+    assert resp.status == 400
+
+
+async def test_states_view_etag(hass, mock_api_client):
+    """Test unchanged states are answered with 304."""
+    hass.states.async_set("light.kitchen", "on")
+    resp = await mock_api_client.get(const.URL_API_STATES)
+    etag = resp.headers[hdrs.ETAG]
+
+    with patch.object(ha.State, "as_dict") as mock_as_dict:
+        resp = await mock_api_client.get(
+            const.URL_API_STATES, headers={hdrs.IF_NONE_MATCH: etag}
+        )
+    assert resp.status == 304
+    assert not mock_as_dict.called
+
+    # Setting an unchanged state keeps the ETag
+    hass.states.async_set("light.kitchen", "on")
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={hdrs.IF_NONE_MATCH: etag}
+    )
+    assert resp.status == 304
+
+    hass.states.async_set("light.kitchen", "off")
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={hdrs.IF_NONE_MATCH: etag}
+    )
+    assert resp.status == 200
+    assert resp.headers[hdrs.ETAG] != etag
+
+    hass.states.async_remove("light.kitchen")
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={hdrs.IF_NONE_MATCH: resp.headers[hdrs.ETAG]}
+    )
+    assert resp.status == 200
+    assert await resp.json() == []
+
+
 async def test_get_entity_state_read_perm(hass, mock_api_client, hass_admin_user):
     """Test getting a state requires read permission."""
     hass_admin_user.mock_policy({})
@@ -1232,3 +1232,39 @@ async def test_automation_variables(hass, caplog):
     hass.bus.async_fire("test_event_3", {"break": 0})
     await hass.async_block_till_done()
     assert len(calls) == 3
+
+
+async def test_websocket_trigger_evaluations(hass, hass_ws_client):
+    """Test the state trigger evaluations of each automation are reported."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "alias": "hello",
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "to": "on",
+                    },
+                    "action": {"event": "test_event"},
+                },
+                {
+                    "alias": "hello",
+                    "trigger": {"platform": "state", "entity_id": "test.entity"},
+                    "action": {"event": "test_event"},
+                },
+            ]
+        },
+    )
+    assert await async_setup_component(hass, "websocket_api", {})
+    hass.states.async_set("test.entity", "on")
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "automation/trigger_evaluations"})
+    msg = await client.receive_json()
+    assert msg["success"]
+    # Automations with the same alias are counted apart
+    assert msg["result"] == {"automation.hello": 1, "automation.hello_2": 1}
@@ -3,10 +3,13 @@ import asyncio
 import base64
 import io
 
+import PIL.Image
 import pytest
 
 from homeassistant.components import camera
 from homeassistant.components.camera.const import DOMAIN, PREF_PRELOAD_STREAM
+from homeassistant.components.camera.frame_broker import FrameBroker, frame_image
+from homeassistant.components.camera.image_cache import CameraImageCache
 from homeassistant.components.camera.prefs import CameraEntityPreferences
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.config import async_process_ha_core_config
@@ -362,3 +365,147 @@ async def test_record_service(hass, mock_camera, mock_stream):
         # So long as we call stream.record, the rest should be covered
         # by those tests.
         assert mock_record_service.called
+
+
+async def test_frame_broker_shares_images(hass):
+    """Test viewers of a camera share the fetched images."""
+    images = [b"1", b"1", b"2", b"3", None]
+    broker = FrameBroker(Mock(side_effect=lambda: _async_pop(images)), "image/jpeg")
+    written = {"fast": [], "slow": []}
+
+    async def write(name, frame):
+        written[name].append(frame)
+
+    await asyncio.gather(
+        broker.async_view(lambda frame: write("fast", frame), 0),
+        broker.async_view(lambda frame: write("slow", frame), 0.1),
+    )
+
+    frames = [frame_image("image/jpeg", img) for img in (b"1", b"2", b"3")]
+    # The first frame is written twice
+    assert written["fast"] == [frames[0], *frames]
+    # The slow viewer skipped the frames produced while it slept
+    assert written["slow"] == [frames[0], frames[0], frames[2]]
+    assert broker.fetches == 5
+    assert broker.viewers == 0
+
+
+async def test_frame_broker_viewer_reconnects(hass, caplog):
+    """Test a viewer leaving stops the producer without errors."""
+
+    async def image():
+        await asyncio.sleep(0)
+        return b"1"
+
+    broker = FrameBroker(image, "image/jpeg")
+    written = asyncio.Event()
+
+    async def write(frame):
+        written.set()
+
+    viewer = hass.async_create_task(broker.async_view(write, 0.01))
+    await written.wait()
+    viewer.cancel()
+    await asyncio.gather(viewer, return_exceptions=True)
+    assert broker.viewers == 0
+
+    written.clear()
+    viewer = hass.async_create_task(broker.async_view(write, 0.01))
+    # The cancelled producer finishes without clearing the new one
+    await asyncio.sleep(0)
+    await written.wait()
+    assert broker._producer is not None
+    viewer.cancel()
+    await asyncio.gather(viewer, return_exceptions=True)
+    assert "Error fetching camera image" not in caplog.text
+
+
+async def _async_pop(images):
+    """Return the next image."""
+    return images.pop(0)
+
+
+async def test_mjpeg_stream_uses_frame_broker(hass, hass_client, mock_camera):
+    """Test the MJPEG stream is served by the frame broker of the camera."""
+    client = await hass_client()
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=[b"Test", None],
+    ):
+        resp = await client.get(
+            "/api/camera_proxy_stream/camera.demo_camera?interval=0.5"
+        )
+        body = await resp.read()
+
+    assert resp.status == 200
+    assert body == frame_image("image/jpeg", b"Test") * 2
+
+
+def _jpeg(width, height):
+    """Return a JPEG image of the given size."""
+    output = io.BytesIO()
+    PIL.Image.new("RGB", (width, height), (255, 0, 0)).save(output, format="JPEG")
+    return output.getvalue()
+
+
+async def test_camera_image_view_cache(hass, hass_client, mock_camera):
+    """Test the image view serves cached and scaled down snapshots."""
+    client = await hass_client()
+    image = _jpeg(640, 480)
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=image,
+    ) as mock_image:
+        resp = await client.get("/api/camera_proxy/camera.demo_camera")
+        assert resp.status == 200
+        assert await resp.read() == image
+
+        resp = await client.get("/api/camera_proxy/camera.demo_camera?width=200")
+        assert resp.status == 200
+        scaled = PIL.Image.open(io.BytesIO(await resp.read()))
+        assert scaled.size == (200, 150)
+
+        resp = await client.get("/api/camera_proxy/camera.demo_camera?width=0")
+        assert resp.status == 400
+
+    assert mock_image.call_count == 1
+
+
+async def test_camera_image_view_unscalable(hass, hass_client, mock_camera):
+    """Test images that can't be decoded are served unscaled."""
+    client = await hass_client()
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"not an image",
+    ):
+        resp = await client.get("/api/camera_proxy/camera.demo_camera?width=200")
+        assert resp.status == 200
+        assert await resp.read() == b"not an image"
+
+
+async def test_camera_image_cache_coalesces(hass):
+    """Test concurrent snapshot requests share one fetch until the TTL passes."""
+    fetch = asyncio.Event()
+
+    async def image_cb():
+        await fetch.wait()
+        return b"image"
+
+    mock_image = Mock(side_effect=image_cb)
+    cache = CameraImageCache(hass, mock_image, 10)
+
+    tasks = [hass.async_create_task(cache.async_get_image()) for _ in range(3)]
+    await asyncio.sleep(0)
+    fetch.set()
+    assert await asyncio.gather(*tasks) == [b"image"] * 3
+    assert mock_image.call_count == 1
+
+    assert await cache.async_get_image() == b"image"
+    assert mock_image.call_count == 1
+
+    cache.ttl = 0
+    assert await cache.async_get_image() == b"image"
+    assert mock_image.call_count == 2
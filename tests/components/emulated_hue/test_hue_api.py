@@ -39,6 +39,7 @@ from homeassistant.components.emulated_hue.hue_api import (
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     CONTENT_TYPE_JSON,
+    EVENT_STATE_CHANGED,
     HTTP_NOT_FOUND,
     HTTP_OK,
     HTTP_UNAUTHORIZED,
@@ -321,6 +322,90 @@ async def test_lights_all_dimmable(hass, aiohttp_client):
     )
 
 
+async def test_lights_state_cache(hass, aiohttp_client):
+    """Test the lights are cached until an exposed entity changes."""
+    hass.states.async_set(
+        "light.ceiling_lights",
+        STATE_ON,
+        {light.ATTR_BRIGHTNESS: 255, const.ATTR_SUPPORTED_FEATURES: 1},
+    )
+    hass.states.async_set("light.bed_light", STATE_ON)
+    await setup.async_setup_component(
+        hass, http.DOMAIN, {http.DOMAIN: {http.CONF_SERVER_PORT: HTTP_SERVER_PORT}}
+    )
+    await hass.async_block_till_done()
+    config = Config(
+        None,
+        {
+            emulated_hue.CONF_EXPOSE_BY_DEFAULT: True,
+            emulated_hue.CONF_ENTITIES: {
+                "light.bed_light": {emulated_hue.CONF_ENTITY_HIDDEN: True}
+            },
+        },
+    )
+    config.numbers = ENTITY_IDS_BY_NUMBER
+    web_app = hass.http.app
+    HueAllLightsStateView(config).register(web_app, web_app.router)
+    HueFullStateView(config).register(web_app, web_app.router)
+    client = await aiohttp_client(web_app)
+
+    result = await client.get("/api/username/lights")
+    assert list(await result.json()) == ["1"]
+    result = await client.get(f"/api/{HUE_API_USERNAME}")
+    lights = (await result.json())["lights"]
+    assert lights["1"]["state"][HUE_API_STATE_BRI] == HUE_API_STATE_BRI_MAX
+    assert config.state_cache.misses == 1
+    assert config.state_cache.hits == 1
+
+    # Changes of entities that are not exposed keep the cache
+    hass.states.async_set("light.bed_light", STATE_OFF)
+    await hass.async_block_till_done()
+    await client.get("/api/username/lights")
+    assert config.state_cache.misses == 1
+
+    hass.states.async_set(
+        "light.ceiling_lights",
+        STATE_ON,
+        {light.ATTR_BRIGHTNESS: 127, const.ATTR_SUPPORTED_FEATURES: 1},
+    )
+    await hass.async_block_till_done()
+    result = await client.get("/api/username/lights")
+    assert (await result.json())["1"]["state"][HUE_API_STATE_BRI] == 127
+    assert config.state_cache.misses == 2
+
+    # States cached after a command are reported until they expire
+    config.cached_states["light.ceiling_lights"] = [
+        {
+            STATE_ON: True,
+            hue_api.STATE_BRIGHTNESS: 10,
+            hue_api.STATE_HUE: None,
+            hue_api.STATE_SATURATION: None,
+            hue_api.STATE_COLOR_TEMP: None,
+        },
+        dt_util.utcnow().timestamp(),
+    ]
+    result = await client.get("/api/username/lights")
+    assert (await result.json())["1"]["state"][HUE_API_STATE_BRI] == 10
+
+    config.cached_states["light.ceiling_lights"][1] -= hue_api.STATE_CACHED_TIMEOUT
+    result = await client.get("/api/username/lights")
+    assert (await result.json())["1"]["state"][HUE_API_STATE_BRI] == 127
+    assert not config.cached_states
+    assert config.state_cache.misses == 2
+
+    stats = config.state_cache.stats
+    assert stats["requests"][HueAllLightsStateView.name]["count"] == 5
+    assert stats["requests"][HueFullStateView.name] == {
+        "count": 1,
+        "rate": 1 / hue_api.REQUEST_RATE_WINDOW,
+    }
+
+    # A stopped cache no longer follows state changes
+    listeners = hass.bus.async_listeners()[EVENT_STATE_CHANGED]
+    config.state_cache.async_stop()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners - 1
+
+
 async def test_light_without_brightness_can_be_turned_off(hass_hue, hue_client):
     """Test that light without brightness can be turned off."""
     hass_hue.states.async_set("light.no_brightness", "on", {})
@@ -3,6 +3,7 @@ import asyncio
 from os import path
 
 from homeassistant import config as hass_config
+from homeassistant.components import camera
 from homeassistant.components.generic import DOMAIN
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.const import (
@@ -43,6 +44,12 @@ async def test_fetching_url(aioclient_mock, hass, hass_client):
     body = await resp.text()
     assert body == "hello world"
 
+    # The snapshot is served from the camera image cache until it expires
+    resp = await client.get("/api/camera_proxy/camera.config_test")
+    assert aioclient_mock.call_count == 1
+
+    entity = hass.data[camera.DOMAIN].get_entity("camera.config_test")
+    entity._image_cache.ttl = 0
     resp = await client.get("/api/camera_proxy/camera.config_test")
     assert aioclient_mock.call_count == 2
 
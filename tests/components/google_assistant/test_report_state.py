@@ -1,5 +1,8 @@
 """Test Google report state."""
+from datetime import timedelta
+
 from homeassistant.components.google_assistant import error, report_state
+from homeassistant.const import HTTP_INTERNAL_SERVER_ERROR
 from homeassistant.util.dt import utcnow
 
 from . import BASIC_CONFIG
@@ -14,7 +17,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     hass.states.async_set("switch.ac", "on")
 
     with patch.object(
-        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+        BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=[])
     ) as mock_report, patch.object(report_state, "INITIAL_REPORT_DELAY", 0):
         unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
 
@@ -33,10 +36,16 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     }
 
     with patch.object(
-        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+        BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=[])
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        assert len(mock_report.mock_calls) == 0
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 1
     assert mock_report.mock_calls[0][1][0] == {
@@ -46,24 +55,32 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     # Test that state changes that change something that Google doesn't care about
     # do not trigger a state report.
     with patch.object(
-        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+        BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=[])
     ) as mock_report:
         hass.states.async_set(
             "light.kitchen", "on", {"irrelevant": "should_be_ignored"}
         )
         await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
 
     # Test that entities that we can't query don't report a state
     with patch.object(
-        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+        BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=[])
     ) as mock_report, patch(
         "homeassistant.components.google_assistant.report_state.GoogleEntity.query_serialize",
         side_effect=error.SmartHomeError("mock-error", "mock-msg"),
     ):
         hass.states.async_set("light.kitchen", "off")
         await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert "Not reporting state for light.kitchen: mock-error"
     assert len(mock_report.mock_calls) == 0
@@ -71,9 +88,64 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     unsub()
 
     with patch.object(
-        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+        BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=[])
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
+
+
+async def test_report_state_batched(hass, legacy_patchable_time):
+    """Test state changes are reported together and retried on errors."""
+    hass.states.async_set("light.ceiling", "off")
+    hass.states.async_set("light.kitchen", "off")
+
+    with patch.object(
+        BASIC_CONFIG,
+        "async_report_state_all",
+        AsyncMock(return_value=[HTTP_INTERNAL_SERVER_ERROR]),
+    ) as mock_report:
+        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+        hass.states.async_set("light.ceiling", "on")
+        hass.states.async_set("light.kitchen", "on")
+        hass.states.async_set("light.kitchen", "off")
+        await hass.async_block_till_done()
+
+        now = utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        async_fire_time_changed(hass, now)
+        await hass.async_block_till_done()
+
+        assert len(mock_report.mock_calls) == 1
+        assert mock_report.mock_calls[0][1][0] == {
+            "devices": {
+                "states": {
+                    "light.ceiling": {"on": True, "online": True},
+                    "light.kitchen": {"on": False, "online": True},
+                }
+            }
+        }
+
+        # The failed report is retried with the changes received since
+        mock_report.return_value = [200]
+        hass.states.async_set("light.kitchen", "on")
+        await hass.async_block_till_done()
+        now += timedelta(seconds=report_state.RETRY_DELAY)
+        async_fire_time_changed(hass, now)
+        await hass.async_block_till_done()
+
+        assert len(mock_report.mock_calls) == 2
+        assert mock_report.mock_calls[1][1][0] == {
+            "devices": {
+                "states": {
+                    "light.ceiling": {"on": True, "online": True},
+                    "light.kitchen": {"on": True, "online": True},
+                }
+            }
+        }
+
+    unsub()
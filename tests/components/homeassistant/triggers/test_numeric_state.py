@@ -1305,3 +1305,42 @@ async def test_attribute_if_not_fires_on_entities_change_with_for_after_stop(
     async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
     await hass.async_block_till_done()
     assert len(calls) == 1
+
+
+async def test_if_not_fires_on_unchanged_value(hass, calls):
+    """Test changes leaving the watched value unchanged don't fire again."""
+    hass.states.async_set("test.entity", 11, {"unit_of_measurement": "°C"})
+    await hass.async_block_till_done()
+
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "numeric_state",
+                    "entity_id": "test.entity",
+                    "below": 10,
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+
+    hass.states.async_set("test.entity", 9, {"unit_of_measurement": "°C"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    # Only the attributes change
+    hass.states.async_set("test.entity", 9, {"unit_of_measurement": "°F"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    hass.states.async_set("test.entity", 8, {"unit_of_measurement": "°F"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    hass.states.async_set("test.entity", 12, {"unit_of_measurement": "°F"})
+    hass.states.async_set("test.entity", 9, {"unit_of_measurement": "°F"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
@@ -1269,3 +1269,184 @@ async def test_attribute_if_fires_on_entity_change_with_both_filters_boolean(
     hass.states.async_set("test.entity", "bla", {"happening": True})
     await hass.async_block_till_done()
     assert len(calls) == 1
+
+
+async def test_triggers_only_evaluated_for_matching_values(hass, calls):
+    """Test the triggers of an entity are only evaluated for matching values."""
+    hass.states.async_set("test.entity", "off")
+
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "alias": f"to_{to_state}",
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "to": to_state,
+                    },
+                    "action": {"service": "test.automation"},
+                }
+                for to_state in ("on", "away", "home")
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("test.entity", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert state_trigger.async_get_trigger_evaluations(hass) == {"automation.to_on": 1}
+
+    # Attribute changes don't change the watched state
+    hass.states.async_set("test.entity", "on", {"brightness": 100})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert state_trigger.async_get_trigger_evaluations(hass) == {"automation.to_on": 1}
+
+    hass.states.async_set("test.entity", "home")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert state_trigger.async_get_trigger_evaluations(hass) == {
+        "automation.to_on": 1,
+        "automation.to_home": 1,
+    }
+
+
+async def test_for_timers_share_due_time(hass, calls):
+    """Test the triggers waiting for the same time share one timer."""
+    hass.states.async_set("test.entity_1", "off")
+    hass.states.async_set("test.entity_2", "off")
+
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "state",
+                    "entity_id": ["test.entity_1", "test.entity_2"],
+                    "to": "on",
+                    "for": 5,
+                },
+                "action": {"service": "test.automation"},
+                "mode": "parallel",
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    now = dt_util.utcnow()
+    with patch("homeassistant.core.dt_util.utcnow", return_value=now):
+        hass.states.async_set("test.entity_1", "on")
+        hass.states.async_set("test.entity_2", "on")
+        await hass.async_block_till_done()
+
+    index = hass.data[state_trigger.DATA_STATE_TRIGGER_INDEX]
+    assert len(index.timers._slots) == 1
+
+    async_fire_time_changed(hass, now + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert not index.timers._slots
+
+
+async def test_for_timers_share_tick(hass, calls):
+    """Test the timers due in the same tick share one scheduled callback."""
+    hass.states.async_set("test.entity_1", "off")
+    hass.states.async_set("test.entity_2", "off")
+    hass.states.async_set("test.entity_3", "off")
+
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "state",
+                    "entity_id": ["test.entity_1", "test.entity_2", "test.entity_3"],
+                    "to": "on",
+                    "for": 5,
+                },
+                "action": {"service": "test.automation"},
+                "mode": "parallel",
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    now = dt_util.utcnow().replace(microsecond=100000)
+    with patch("homeassistant.core.dt_util.utcnow", return_value=now):
+        hass.states.async_set("test.entity_1", "on")
+        await hass.async_block_till_done()
+    with patch(
+        "homeassistant.core.dt_util.utcnow",
+        return_value=now + timedelta(milliseconds=500),
+    ):
+        hass.states.async_set("test.entity_2", "on")
+        await hass.async_block_till_done()
+    with patch(
+        "homeassistant.core.dt_util.utcnow", return_value=now + timedelta(seconds=2)
+    ):
+        hass.states.async_set("test.entity_3", "on")
+        await hass.async_block_till_done()
+
+    timers = hass.data[state_trigger.DATA_STATE_TRIGGER_INDEX].timers
+    assert len(timers._slots) == 2
+    assert timers._next == now.replace(microsecond=0) + timedelta(seconds=6)
+
+    # Timers never fire before they are due
+    async_fire_time_changed(hass, now + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    async_fire_time_changed(hass, now + timedelta(seconds=6))
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert timers._next == now.replace(microsecond=0) + timedelta(seconds=8)
+
+    async_fire_time_changed(hass, now + timedelta(seconds=8))
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+    assert not timers._slots
+    assert timers._next is None
+
+
+async def test_for_timer_restarts_on_new_match(hass, calls):
+    """Test a trigger waiting for a duration restarts when matched again."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "state",
+                    "entity_id": "test.entity",
+                    "for": 5,
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    now = dt_util.utcnow()
+    with patch("homeassistant.core.dt_util.utcnow", return_value=now):
+        hass.states.async_set("test.entity", "world")
+        await hass.async_block_till_done()
+
+    later = now + timedelta(seconds=3)
+    with patch("homeassistant.core.dt_util.utcnow", return_value=later):
+        async_fire_time_changed(hass, later)
+        hass.states.async_set("test.entity", "again")
+        await hass.async_block_till_done()
+
+    async_fire_time_changed(hass, now + timedelta(seconds=6))
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    async_fire_time_changed(hass, now + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert len(calls) == 1
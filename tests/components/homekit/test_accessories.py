@@ -2,7 +2,11 @@
 
 This includes tests for all mock object types.
 """
+import asyncio
 from datetime import timedelta
+import json
+import queue
+import threading
 
 import pytest
 
@@ -663,3 +667,60 @@ def test_home_driver():
 
     mock_unpair.assert_called_with("client_uuid")
     mock_show_msg.assert_called_with("hass", "entry_id", "name", pin, "X-HM://0")
+
+
+async def test_home_driver_batches_events(hass):
+    """Test characteristic changes are sent in batches of changed values."""
+    with patch("pyhap.accessory_driver.AccessoryDriver.__init__"):
+        driver = HomeDriver(hass, "entry_id", "name")
+    driver.topic_lock = threading.Lock()
+    driver.event_queue = queue.Queue()
+    driver.topics = {
+        "1.9": {"client_1", "client_2"},
+        "1.10": {"client_1", "client_2"},
+        "2.9": {"client_1"},
+    }
+
+    def get_events():
+        events = []
+        while not driver.event_queue.empty():
+            topic, bytedata, sender_client_addr = driver.event_queue.get()
+            events.append((topic, json.loads(bytedata), sender_client_addr))
+        return events
+
+    driver.publish({"aid": 1, "iid": 9, "value": 0})
+    driver.publish({"aid": 1, "iid": 9, "value": 1})
+    driver.publish({"aid": 1, "iid": 10, "value": 50})
+    driver.publish({"aid": 2, "iid": 9, "value": 1})
+    driver.publish({"aid": 3, "iid": 9, "value": 1})
+    assert driver.event_queue.empty()
+
+    await asyncio.sleep(0)
+    assert get_events() == [
+        (
+            "1.9",
+            {
+                "characteristics": [
+                    {"aid": 1, "iid": 9, "value": 1},
+                    {"aid": 1, "iid": 10, "value": 50},
+                ]
+            },
+            None,
+        ),
+        ("2.9", {"characteristics": [{"aid": 2, "iid": 9, "value": 1}]}, None),
+    ]
+
+    # Unchanged values are not sent again, except to new subscribers
+    driver.publish({"aid": 1, "iid": 9, "value": 1})
+    driver.publish({"aid": 1, "iid": 10, "value": 50})
+    driver.publish({"aid": 2, "iid": 9, "value": 1}, "client_1")
+    await asyncio.sleep(0)
+    assert get_events() == []
+
+    driver.subscribe_client_topic("client_3", "1.10")
+    driver.publish({"aid": 1, "iid": 9, "value": 1})
+    driver.publish({"aid": 1, "iid": 10, "value": 50}, "client_1")
+    await asyncio.sleep(0)
+    assert get_events() == [
+        ("1.10", {"characteristics": [{"aid": 1, "iid": 10, "value": 50}]}, "client_1")
+    ]
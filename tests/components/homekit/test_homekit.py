@@ -12,6 +12,8 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.components.homekit import (
     MAX_DEVICES,
+    MAX_SHARDS,
+    SHARD_PORT_OFFSET,
     STATUS_READY,
     STATUS_RUNNING,
     STATUS_STOPPED,
@@ -708,6 +710,7 @@ async def test_homekit_too_many_accessories(hass, hk_driver):
     # The bridge itself counts as an accessory
     homekit.bridge.accessories = range(MAX_DEVICES)
     homekit.driver = hk_driver
+    homekit.shards = [(hk_driver, homekit.bridge)] * (MAX_SHARDS - 1)
 
     hass.states.async_set("light.demo", "on")
 
@@ -721,6 +724,60 @@ async def test_homekit_too_many_accessories(hass, hk_driver):
         assert mock_warn.called is True
 
 
+async def test_homekit_adds_bridges_when_full(hass):
+    """Test entities are added to additional bridges when a bridge is full."""
+    entry = await async_init_integration(hass)
+
+    homekit = HomeKit(
+        hass,
+        "mock_name",
+        12345,
+        None,
+        lambda entity_id: True,
+        {},
+        DEFAULT_SAFE_MODE,
+        advertise_ip=None,
+        entry_id=entry.entry_id,
+    )
+    homekit.driver = "driver"
+    homekit.bridge = Mock()
+    # The bridge itself counts as an accessory
+    homekit.bridge.accessories = range(MAX_DEVICES - 1)
+    aid_storage = hass.data[DOMAIN][entry.entry_id][AID_STORAGE]
+    shard_entry_id = f"{entry.entry_id}_1"
+
+    with patch(f"{PATH_HOMEKIT}.get_accessory", return_value="acc"), patch(
+        f"{PATH_HOMEKIT}.accessories.HomeDriver"
+    ) as mock_driver, patch(
+        f"{PATH_HOMEKIT}.accessories.HomeBridge"
+    ) as mock_bridge, patch(
+        f"{PATH_HOMEKIT}.find_next_available_port", return_value=12445
+    ) as mock_find_port:
+        mock_bridge.return_value.accessories = {}
+        homekit.add_bridge_accessory(State("light.demo", "on"))
+
+        mock_find_port.assert_called_with(12345 + SHARD_PORT_OFFSET)
+        assert mock_driver.call_args[0] == (hass, shard_entry_id, "mock_name 2")
+        assert mock_driver.call_args[1]["port"] == 12445
+        mock_bridge.assert_called_with(hass, mock_driver.return_value, "mock_name 2")
+        mock_bridge.return_value.add_accessory.assert_called_with("acc")
+        assert not homekit.bridge.add_accessory.called
+        assert homekit.shards == [(mock_driver.return_value, mock_bridge.return_value)]
+        assert aid_storage.get_shard_for_entity_id("light.demo") == 1
+        assert hass.data[DOMAIN][shard_entry_id] == {}
+
+        # Entities stay on their bridge, new entities fill the first bridge
+        homekit.bridge.accessories = {}
+        mock_bridge.return_value.add_accessory.reset_mock()
+        homekit.add_bridge_accessory(State("light.demo", "on"))
+        homekit.add_bridge_accessory(State("demo.test", "on"))
+
+        mock_bridge.return_value.add_accessory.assert_called_once_with("acc")
+        homekit.bridge.add_accessory.assert_called_once_with("acc")
+        assert aid_storage.get_shard_for_entity_id("demo.test") == 0
+        assert len(homekit.shards) == 1
+
+
 async def test_homekit_finds_linked_batteries(
     hass, hk_driver, debounce_patcher, device_reg, entity_reg
 ):
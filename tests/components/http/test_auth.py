@@ -7,7 +7,11 @@ from aiohttp.web_exceptions import HTTPUnauthorized
 import pytest
 
 from homeassistant.auth.providers import trusted_networks
-from homeassistant.components.http.auth import async_sign_path, setup_auth
+from homeassistant.components.http.auth import (
+    DATA_TOKEN_CACHE,
+    async_sign_path,
+    setup_auth,
+)
 from homeassistant.components.http.const import KEY_AUTHENTICATED
 from homeassistant.components.http.forwarded import async_setup_forwarded
 from homeassistant.setup import async_setup_component
@@ -262,3 +266,75 @@ async def test_auth_access_signed_path(hass, app, aiohttp_client, hass_access_to
     await hass.auth.async_remove_refresh_token(refresh_token)
     req = await client.get(signed_path)
     assert req.status == 401
+
+
+async def test_auth_token_cache(hass, app, aiohttp_client, hass_access_token):
+    """Test validated access tokens are cached until invalidated."""
+    setup_auth(hass, app)
+    client = await aiohttp_client(app)
+    token_cache = hass.data[DATA_TOKEN_CACHE]
+    headers = {"Authorization": f"Bearer {hass_access_token}"}
+    refresh_token = await hass.auth.async_validate_access_token(hass_access_token)
+
+    with patch.object(
+        hass.auth,
+        "async_validate_access_token",
+        wraps=hass.auth.async_validate_access_token,
+    ) as mock_validate:
+        for _ in range(3):
+            req = await client.get("/", headers=headers)
+            assert req.status == 200
+        assert mock_validate.call_count == 1
+        assert len(token_cache) == 1
+        assert token_cache.hits == 2
+
+        # Expired entries are validated again
+        token_cache.ttl = 0
+        token_cache.async_clear()
+        req = await client.get("/", headers=headers)
+        assert req.status == 200
+        req = await client.get("/", headers=headers)
+        assert req.status == 200
+        assert mock_validate.call_count == 3
+        token_cache.ttl = 60
+
+        req = await client.get("/", headers=headers)
+        assert req.status == 200
+        assert len(token_cache) == 1
+
+        # Removed users are dropped from the cache
+        hass.bus.async_fire("user_removed", {"user_id": refresh_token.user.id})
+        await hass.async_block_till_done()
+        assert len(token_cache) == 0
+
+        req = await client.get("/", headers=headers)
+        assert req.status == 200
+
+        # Removing the refresh token invalidates the cached token
+        await hass.auth.async_remove_refresh_token(refresh_token)
+        req = await client.get("/", headers=headers)
+        assert req.status == 401
+
+
+async def test_auth_signed_path_cache(hass, app, aiohttp_client, hass_access_token):
+    """Test validated signatures are cached for their path."""
+    app.router.add_get("/another_path", mock_handler)
+    setup_auth(hass, app)
+    client = await aiohttp_client(app)
+    token_cache = hass.data[DATA_TOKEN_CACHE]
+
+    refresh_token = await hass.auth.async_validate_access_token(hass_access_token)
+    signed_path = async_sign_path(hass, refresh_token.id, "/", timedelta(seconds=5))
+
+    for _ in range(2):
+        req = await client.get(signed_path)
+        assert req.status == 200
+    assert token_cache.hits == 1
+
+    # A cached signature is still bound to its path
+    req = await client.get("/another_path?{}".format(signed_path.split("?")[1]))
+    assert req.status == 401
+
+    refresh_token.user.is_active = False
+    req = await client.get(signed_path)
+    assert req.status == 401
@@ -0,0 +1,107 @@
+"""The tests for static file serving of the HTTP component."""
+import gzip
+
+from aiohttp import hdrs
+import pytest
+
+from homeassistant.components.http import static
+from homeassistant.setup import async_setup_component
+
+
+@pytest.fixture
+async def static_client(hass, aiohttp_client, tmp_path):
+    """Serve a directory with precompressed files."""
+    (tmp_path / "app.js").write_text("console.log(1);")
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(b"console.log(1);"))
+    (tmp_path / "app.js.br").write_bytes(b"brotli")
+    (tmp_path / "plain.txt").write_text("plain")
+    (tmp_path / "sub").mkdir()
+
+    assert await async_setup_component(hass, "http", {})
+    hass.http.register_static_path("/static_test", str(tmp_path))
+    return await aiohttp_client(hass.http.app, auto_decompress=False)
+
+
+async def test_serve_precompressed(static_client):
+    """Test precompressed siblings are served to clients accepting them."""
+    resp = await static_client.get(
+        "/static_test/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip, br"}
+    )
+    assert resp.status == 200
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "br"
+    assert resp.headers[hdrs.CONTENT_TYPE] == "application/javascript"
+    assert resp.headers[hdrs.VARY] == hdrs.ACCEPT_ENCODING
+    assert resp.headers[hdrs.CACHE_CONTROL] == static.CACHE_HEADERS[hdrs.CACHE_CONTROL]
+    assert await resp.read() == b"brotli"
+
+    resp = await static_client.get(
+        "/static_test/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip, br;q=0"}
+    )
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "gzip"
+    assert gzip.decompress(await resp.read()) == b"console.log(1);"
+
+    resp = await static_client.get(
+        "/static_test/app.js", headers={hdrs.ACCEPT_ENCODING: "identity"}
+    )
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+    assert await resp.text() == "console.log(1);"
+
+    resp = await static_client.get("/static_test/plain.txt")
+    assert resp.status == 200
+    assert hdrs.VARY not in resp.headers
+    assert await resp.text() == "plain"
+
+    resp = await static_client.get("/static_test/missing.txt")
+    assert resp.status == 404
+
+
+async def test_conditional_requests(static_client):
+    """Test conditional requests are answered with 304."""
+    resp = await static_client.get(
+        "/static_test/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip"}
+    )
+    etag = resp.headers[hdrs.ETAG]
+    last_modified = resp.headers[hdrs.LAST_MODIFIED]
+
+    resp = await static_client.get(
+        "/static_test/app.js",
+        headers={hdrs.ACCEPT_ENCODING: "gzip", hdrs.IF_NONE_MATCH: f'"x", {etag}'},
+    )
+    assert resp.status == 304
+    assert resp.headers[hdrs.ETAG] == etag
+    assert await resp.read() == b""
+
+    # The ETag is specific to the content coding
+    resp = await static_client.get(
+        "/static_test/app.js",
+        headers={hdrs.ACCEPT_ENCODING: "identity", hdrs.IF_NONE_MATCH: etag},
+    )
+    assert resp.status == 200
+
+    resp = await static_client.get(
+        "/static_test/plain.txt", headers={hdrs.IF_MODIFIED_SINCE: last_modified}
+    )
+    assert resp.status == 304
+
+
+async def test_stat_cache(hass, static_client, tmp_path):
+    """Test resolved paths are cached for a short time."""
+    resp = await static_client.get("/static_test/plain.txt")
+    assert resp.status == 200
+
+    (tmp_path / "plain.txt").unlink()
+    (tmp_path / "new.txt").write_text("new")
+
+    resource = next(
+        resource
+        for resource in hass.http.app.router.resources()
+        if isinstance(resource, static.CachingStaticResource)
+    )
+    assert "plain.txt" in resource._file_cache
+
+    # New paths are resolved, removed files are dropped from the cache
+    resp = await static_client.get("/static_test/new.txt")
+    assert resp.status == 200
+    resp = await static_client.get("/static_test/plain.txt")
+    assert resp.status == 404
+    assert "plain.txt" not in resource._file_cache
@@ -1,4 +1,7 @@
 """The tests for the image_processing component."""
+import asyncio
+
+from homeassistant.components import camera
 import homeassistant.components.http as http
 import homeassistant.components.image_processing as ip
 from homeassistant.const import ATTR_ENTITY_PICTURE
@@ -287,3 +290,58 @@ class TestImageProcessingFace:
         assert event_data[0]["confidence"] == 98.34
         assert event_data[0]["gender"] == "male"
         assert event_data[0]["entity_id"] == "image_processing.demo_face"
+
+
+async def test_scheduler_shares_frames_and_drops_stale(hass):
+    """Test processors share frame fetches and skip frames while busy."""
+    scheduler = ip.scheduler.ImageProcessingScheduler(hass, 2)
+    release = asyncio.Event()
+    processed = []
+    fetches = []
+
+    class Processor(ip.ImageProcessingEntity):
+        """Image processing entity recording processed images."""
+
+        camera_entity = "camera.demo_camera"
+
+        def __init__(self, entity_id):
+            """Initialize the processor."""
+            self.entity_id = entity_id
+
+        async def async_process_image(self, image):
+            """Wait for the test to release the processor."""
+            await release.wait()
+            processed.append((self.entity_id, image))
+
+    async def get_image(entity_id, timeout=10):
+        """Return a new frame for each fetch."""
+        fetches.append(entity_id)
+        return camera.Image("image/jpeg", f"frame{len(fetches)}".encode())
+
+    first = Processor("image_processing.first")
+    second = Processor("image_processing.second")
+
+    with patch("homeassistant.components.camera.async_get_image", get_image):
+        tasks = [
+            hass.async_create_task(scheduler.async_process(first)),
+            hass.async_create_task(scheduler.async_process(second)),
+        ]
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        # Updates while busy, only the latest one is processed
+        tasks.append(hass.async_create_task(scheduler.async_process(first)))
+        tasks.append(hass.async_create_task(scheduler.async_process(first)))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*tasks)
+
+    assert fetches == ["camera.demo_camera", "camera.demo_camera"]
+    assert processed == [
+        ("image_processing.first", b"frame1"),
+        ("image_processing.second", b"frame1"),
+        ("image_processing.first", b"frame2"),
+    ]
+    stats = scheduler.stats
+    assert stats["image_processing.first"]["processed"] == 2
+    assert stats["image_processing.first"]["dropped_frames"] == 1
+    assert stats["image_processing.second"]["dropped_frames"] == 0
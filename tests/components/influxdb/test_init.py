@@ -1,11 +1,14 @@
 """The tests for the InfluxDB component."""
 from dataclasses import dataclass
 import datetime
+import gzip
 
 import pytest
 
 import homeassistant.components.influxdb as influxdb
 from homeassistant.components.influxdb.const import DEFAULT_BUCKET
+from homeassistant.components.influxdb.line_protocol import point_to_line
+from homeassistant.components.influxdb.retry_buffer import RetryBuffer
 from homeassistant.const import (
     EVENT_STATE_CHANGED,
     PERCENTAGE,
@@ -1577,3 +1580,130 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+def test_point_to_line():
+    """Test encoding points in the line protocol."""
+    point = {
+        "measurement": "temp, inside",
+        "tags": {"entity_id": "living room", "domain": "sensor", "empty": ""},
+        "time": datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+        "fields": {"value": 21.5, "state_str": 'a "quoted" \\ value', "count": 3},
+    }
+
+    assert point_to_line(point) == (
+        "temp\\,\\ inside,domain=sensor,entity_id=living\\ room "
+        'count=3i,state_str="a \\"quoted\\" \\\\ value",value=21.5 '
+        "1577836800000000000"
+    )
+    assert point_to_line(point, "s").endswith(" 1577836800")
+    assert point_to_line(point, "ms").endswith(" 1577836800000")
+    assert point_to_line({**point, "time": 12345}, "s").endswith(" 12345")
+
+
+@pytest.mark.parametrize(
+    "mock_client", [influxdb.DEFAULT_API_VERSION], indirect=["mock_client"]
+)
+async def test_gzip_write(hass, mock_client):
+    """Test writing compressed line protocol with the V1 API."""
+    handler_method = await _setup(
+        hass, mock_client, {"gzip": True, "precision": "s"}, _get_write_api_mock_v1
+    )
+    request = mock_client.return_value.request
+    request.reset_mock()
+
+    state = MagicMock(
+        state="1.5",
+        domain="fake",
+        entity_id="fake.entity_id",
+        object_id="entity_id",
+        attributes={},
+    )
+    handler_method(MagicMock(data={"new_state": state}, time_fired=12345))
+    hass.data[influxdb.DOMAIN].block_till_done()
+
+    assert not mock_client.return_value.write_points.called
+    assert request.call_count == 1
+    kwargs = request.call_args[1]
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert kwargs["params"] == {"db": "home_assistant", "precision": "s"}
+    assert gzip.decompress(kwargs["data"]) == (
+        b"fake.entity_id,domain=fake,entity_id=entity_id value=1.5 12345\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "mock_client", [influxdb.DEFAULT_API_VERSION], indirect=["mock_client"]
+)
+async def test_retry_buffer(hass, caplog, mock_client, tmp_path):
+    """Test events are buffered on disk during an outage and written in order."""
+    hass.config.config_dir = str(tmp_path)
+    handler_method = await _setup(
+        hass, mock_client, {"retry_buffer_size": 1}, _get_write_api_mock_v1
+    )
+    instance = hass.data[influxdb.DOMAIN]
+    write_points = mock_client.return_value.write_points
+    request = mock_client.return_value.request
+    write_points.side_effect = influxdb.exceptions.InfluxDBServerError("fail")
+
+    def fire(value):
+        state = MagicMock(
+            state=value,
+            domain="fake",
+            entity_id="fake.entity_id",
+            object_id="entity_id",
+            attributes={},
+        )
+        handler_method(MagicMock(data={"new_state": state}, time_fired=12345))
+        instance.block_till_done()
+
+    fire("1")
+    assert instance.events_buffered == 1
+    assert instance.retry_buffer.pending
+    assert "Buffering events on disk" in caplog.text
+
+    # Still in the retry delay, the event is queued behind the buffer
+    write_points.reset_mock(side_effect=True)
+    fire("2")
+    assert instance.events_buffered == 2
+    assert not write_points.called
+    assert not request.called
+
+    instance._next_drain = 0
+    fire("3")
+    assert not write_points.called
+    assert request.call_count == 1
+    assert request.call_args[1]["data"] == (
+        b"fake.entity_id,domain=fake,entity_id=entity_id value=1.0 12345\n"
+        b"fake.entity_id,domain=fake,entity_id=entity_id value=2.0 12345\n"
+        b"fake.entity_id,domain=fake,entity_id=entity_id value=3.0 12345\n"
+    )
+    assert not instance.retry_buffer.pending
+    assert not (tmp_path / ".storage" / "influxdb.retry_buffer").exists()
+    assert instance.stats["events_written"] == 3
+
+    fire("4")
+    assert write_points.call_count == 1
+    assert instance.stats["events_written"] == 4
+
+
+def test_retry_buffer_size(tmp_path):
+    """Test the retry buffer does not grow beyond its size."""
+    buffer = RetryBuffer(str(tmp_path / "buffer"), 20)
+
+    assert buffer.append(["line 1", "line 2"])
+    assert not buffer.append(["line 3", "line 4"])
+    assert buffer.size == 14
+
+    lines, size = buffer.peek(1)
+    assert lines == ["line 1"]
+    buffer.consume(size)
+
+    # Lines left behind are picked up by a new buffer
+    buffer = RetryBuffer(str(tmp_path / "buffer"), 20)
+    assert buffer.pending
+    lines, size = buffer.peek(10)
+    assert lines == ["line 1", "line 2"]
+    buffer.consume(size)
+    assert not buffer.pending
+    assert not (tmp_path / "buffer").exists()
@@ -0,0 +1,79 @@
+"""Tests for the event loop monitor integration."""
+import asyncio
+import time
+from traceback import FrameSummary
+
+from homeassistant.components.loop_monitor import DOMAIN
+from homeassistant.components.loop_monitor.monitor import integration_from_stack
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.setup import async_setup_component
+
+
+async def _wait_for(predicate):
+    """Wait for the monitor thread to record something."""
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("Timed out waiting for the loop monitor")
+
+
+async def test_records_lag_and_stalls(hass, hass_ws_client):
+    """Test that samples are taken and a blocked loop is captured."""
+    assert await async_setup_component(
+        hass, DOMAIN, {DOMAIN: {"interval": 0.01, "threshold": 0.05}}
+    )
+    monitor = hass.data[DOMAIN]
+
+    await _wait_for(lambda: monitor.samples > 0)
+
+    # Block the event loop
+    time.sleep(0.2)
+
+    await _wait_for(lambda: monitor.stalls)
+
+    stall = monitor.stalls[0]
+    assert stall["duration"] >= 0.05
+    assert stall["integration"] is None
+    assert any("test_init.py" in line for line in stall["stack"])
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "loop_monitor/stats"})
+    msg = await client.receive_json()
+
+    assert msg["success"]
+    assert msg["result"]["loop"]["samples"] > 0
+    assert msg["result"]["loop"]["max_lag"] >= 0.05
+    assert len(msg["result"]["loop"]["stalls"]) >= 1
+    assert "db_read" in msg["result"]["executors"]
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+
+async def test_stats_require_admin(hass, hass_ws_client, hass_admin_user):
+    """Test that the statistics are only available to admins."""
+    hass_admin_user.groups = []
+    assert await async_setup_component(hass, DOMAIN, {})
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "loop_monitor/stats"})
+    msg = await client.receive_json()
+
+    assert not msg["success"]
+    assert msg["error"]["code"] == "unauthorized"
+
+    hass.data[DOMAIN].stop()
+
+
+def test_integration_from_stack():
+    """Test attributing a stack to an integration."""
+    stack = [
+        FrameSummary("/home/paulus/homeassistant/core.py", 23, "do_something"),
+        FrameSummary(
+            "/home/paulus/homeassistant/components/hue/light.py", 23, "async_update"
+        ),
+        FrameSummary("/home/paulus/aiohue/lights.py", 2, "get"),
+    ]
+    assert integration_from_stack(stack) == "hue"
+    assert integration_from_stack(stack[:1]) is None
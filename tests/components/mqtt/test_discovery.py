@@ -12,6 +12,7 @@ from homeassistant.components.mqtt.abbreviations import (
 )
 from homeassistant.components.mqtt.discovery import ALREADY_DISCOVERED, async_start
 from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.helpers.entity_platform import EntityPlatform
 
 from tests.async_mock import AsyncMock, patch
 from tests.common import (
@@ -206,7 +207,52 @@ async def test_non_duplicate_discovery(hass, mqtt_mock, caplog):
     assert state is not None
     assert state.name == "Beer"
     assert state_duplicate is None
+    # Messages received in the same batch are collapsed
+    assert "Found new component: binary_sensor bla" in caplog.text
+    assert "Component has already been discovered: binary_sensor bla" not in caplog.text
+
+    # A payload identical to the applied one is ignored
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Beer", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    assert "Component has already been discovered: binary_sensor bla" not in caplog.text
+
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Milk", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
     assert "Component has already been discovered: binary_sensor bla" in caplog.text
+    assert hass.states.get("binary_sensor.beer").name == "Milk"
+
+
+async def test_discovery_batch_adds_entities_in_bulk(hass, mqtt_mock):
+    """Test entities discovered in one batch are added in one call."""
+    with patch.object(
+        EntityPlatform,
+        "async_add_entities",
+        autospec=True,
+        side_effect=EntityPlatform.async_add_entities,
+    ) as mock_add_entities:
+        for name in ("one", "two", "three"):
+            async_fire_mqtt_message(
+                hass,
+                f"homeassistant/sensor/{name}/config",
+                f'{{ "name": "{name}", "state_topic": "test-topic" }}',
+            )
+        await hass.async_block_till_done()
+
+    assert len(hass.states.async_entity_ids("sensor")) == 3
+    added = [
+        call_args[0][1]
+        for call_args in mock_add_entities.call_args_list
+        if call_args[0][0].domain == "sensor"
+    ]
+    assert [len(entities) for entities in added] == [3]
 
 
 async def test_removal(hass, mqtt_mock, caplog):
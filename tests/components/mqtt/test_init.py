@@ -3,12 +3,14 @@ import asyncio
 from datetime import datetime, timedelta
 import json
 import ssl
+import threading
 
 import pytest
 import voluptuous as vol
 
 from homeassistant.components import mqtt, websocket_api
 from homeassistant.components.mqtt import debug_info
+from homeassistant.components.mqtt.trie import SubscriptionTrie
 from homeassistant.const import (
     ATTR_DOMAIN,
     ATTR_SERVICE,
@@ -574,6 +576,86 @@ async def test_subscribe_special_characters(hass, mqtt_mock, calls, record_calls
     assert calls[0][0].payload == payload
 
 
+def test_subscription_trie():
+    """Test subscriptions are matched in order and removed incrementally."""
+    trie = SubscriptionTrie()
+    subscriptions = [
+        mqtt.Subscription(topic, None)
+        for topic in ("home/#", "home/+/state", "home/kitchen/state", "$SYS/#", "#")
+    ]
+    for subscription in subscriptions:
+        trie.add(subscription)
+    duplicate = mqtt.Subscription("home/+/state", None)
+    trie.add(duplicate)
+
+    assert trie.match("home/kitchen/state") == subscriptions[:3] + [
+        subscriptions[4],
+        duplicate,
+    ]
+    assert trie.match("home") == [subscriptions[0], subscriptions[4]]
+    assert trie.match("$SYS/broker") == [subscriptions[3]]
+    assert trie.match("other/kitchen/state") == [subscriptions[4]]
+
+    trie.remove(subscriptions[1])
+    assert trie.has_filter("home/+/state")
+    trie.remove(duplicate)
+    assert not trie.has_filter("home/+/state")
+    assert subscriptions[1] not in trie
+    with pytest.raises(ValueError):
+        trie.remove(duplicate)
+
+    for subscription in subscriptions[2:]:
+        trie.remove(subscription)
+    assert list(trie) == [subscriptions[0]]
+    assert trie.match("home/kitchen/state") == [subscriptions[0]]
+    trie.remove(subscriptions[0])
+    assert len(trie) == 0
+    # pylint: disable=protected-access
+    assert trie._root.children == {}
+
+
+async def test_messages_handled_in_batches(hass, mqtt_mock, calls, record_calls):
+    """Test messages received before the loop wakes up are handled in one batch."""
+    await mqtt.async_subscribe(hass, "test-topic/+", record_calls)
+    instance = mqtt_mock()
+
+    with patch.object(
+        hass.loop, "call_soon_threadsafe", wraps=hass.loop.call_soon_threadsafe
+    ) as mock_call_soon:
+        for index in range(3):
+            instance._mqtt_on_message(
+                None, None, mqtt.Message(f"test-topic/{index}", b"test", 0, False)
+            )
+        assert not calls
+        await hass.async_block_till_done()
+
+    assert mock_call_soon.mock_calls == [call(instance._mqtt_handle_messages)]
+    assert [msg.topic for msg, in calls] == [
+        "test-topic/0",
+        "test-topic/1",
+        "test-topic/2",
+    ]
+
+    # A message received after the batch wakes up the loop again
+    instance._mqtt_on_message(None, None, mqtt.Message("test-topic/3", b"", 0, False))
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+
+
+async def test_subscribers_share_decoded_payload(hass, mqtt_mock, calls, record_calls):
+    """Test subscribers of a message share the decoded payload."""
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls, encoding=None)
+
+    async_fire_mqtt_message(hass, "test-topic", '{"temperature": 21}')
+    await hass.async_block_till_done()
+
+    assert len(calls) == 3
+    assert calls[0][0].payload is calls[1][0].payload
+    assert calls[2][0].payload == b'{"temperature": 21}'
+
+
 async def test_subscribe_same_topic(hass, mqtt_client_mock, mqtt_mock):
     """
     Test subscring to same topic twice and simulate retained messages.
@@ -678,6 +760,55 @@ async def test_restore_all_active_subscriptions_on_reconnect(
     assert mqtt_client_mock.subscribe.mock_calls == expected
 
 
+@pytest.mark.parametrize(
+    "mqtt_config",
+    [{mqtt.CONF_BROKER: "mock-broker", mqtt.CONF_DISCOVERY: False}],
+)
+async def test_restore_subscriptions_while_subscribing(
+    hass, mqtt_client_mock, mqtt_mock
+):
+    """Test subscribing while reconnecting from the paho thread."""
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+
+    await mqtt.async_subscribe(hass, "test/state", None)
+    await mqtt.async_subscribe(hass, "test/other", None)
+    await hass.async_block_till_done()
+    mqtt_client_mock.subscribe.reset_mock()
+
+    loop_thread = threading.get_ident()
+    walking = threading.Event()
+    resume = threading.Event()
+    trie_iter = SubscriptionTrie.__iter__
+
+    def walk_subscriptions(trie):
+        """Pause walking the subscriptions outside of the event loop."""
+        for subscription in trie_iter(trie):
+            if threading.get_ident() != loop_thread and not walking.is_set():
+                walking.set()
+                resume.wait(5)
+            yield subscription
+
+    with patch.object(SubscriptionTrie, "__iter__", walk_subscriptions):
+        mqtt_mock._mqtt_on_disconnect(None, None, 0)
+        # Connect from a thread as paho does
+        connect = hass.async_add_executor_job(
+            mqtt_mock()._mqtt_on_connect, None, None, None, 0
+        )
+        await hass.async_add_executor_job(walking.wait, 0.1)
+        await mqtt.async_subscribe(hass, "test/new", None)
+        resume.set()
+        await connect
+        await hass.async_block_till_done()
+
+    assert not walking.is_set()
+    assert sorted(mqtt_client_mock.subscribe.mock_calls) == [
+        call("test/new", 0),
+        call("test/other", 0),
+        call("test/state", 0),
+    ]
+
+
 async def test_setup_logs_error_if_no_connect_broker(hass, caplog):
     """Test for setup failure if connection to broker is missing."""
     entry = MockConfigEntry(domain=mqtt.DOMAIN, data={mqtt.CONF_BROKER: "test-broker"})
@@ -861,8 +992,9 @@ async def test_mqtt_subscribes_topics_on_connect(hass, mqtt_client_mock, mqtt_mo
     await mqtt.async_subscribe(hass, "home/sensor", None, 2)
     await mqtt.async_subscribe(hass, "still/pending", None)
     await mqtt.async_subscribe(hass, "still/pending", None, 1)
+    await hass.async_block_till_done()
 
-    hass.add_job = MagicMock()
+    mqtt_client_mock.subscribe.reset_mock()
     mqtt_mock._mqtt_on_connect(None, None, 0, 0)
 
     await hass.async_block_till_done()
@@ -870,8 +1002,9 @@ async def test_mqtt_subscribes_topics_on_connect(hass, mqtt_client_mock, mqtt_mo
     assert mqtt_client_mock.disconnect.call_count == 0
 
     expected = {"topic/test": 0, "home/sensor": 2, "still/pending": 1}
-    calls = {call[1][1]: call[1][2] for call in hass.add_job.mock_calls}
+    calls = {call[1][0]: call[1][1] for call in mqtt_client_mock.subscribe.mock_calls}
     assert calls == expected
+    assert mqtt_client_mock.subscribe.call_count == len(expected)
 
 
 async def test_setup_fails_without_config(hass):
@@ -7,6 +7,7 @@ import pytest
 from homeassistant.components import climate, humidifier, sensor
 from homeassistant.components.demo.sensor import DemoSensor
 import homeassistant.components.prometheus as prometheus
+from homeassistant.components.prometheus.exposition import CachedExposition
 from homeassistant.const import (
     CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
     CONTENT_TYPE_TEXT_PLAIN,
@@ -32,9 +33,11 @@ class FilterTest:
     should_pass: bool
 
 
-async def prometheus_client(hass, hass_client):
+async def prometheus_client(hass, hass_client, config=None):
     """Initialize an hass_client with Prometheus component."""
-    await async_setup_component(hass, prometheus.DOMAIN, {prometheus.DOMAIN: {}})
+    await async_setup_component(
+        hass, prometheus.DOMAIN, {prometheus.DOMAIN: config or {}}
+    )
 
     await async_setup_component(hass, sensor.DOMAIN, {"sensor": [{"platform": "demo"}]})
 
@@ -202,6 +205,65 @@ async def test_view(hass, hass_client):
     )
 
 
+async def test_view_cached_exposition(hass, hass_client):
+    """Test prometheus metrics view with the cached exposition."""
+    client = await prometheus_client(hass, hass_client, {"cached_exposition": True})
+    resp = await client.get(prometheus.API_ENDPOINT)
+
+    assert resp.status == 200
+    assert resp.headers["content-type"] == CONTENT_TYPE_TEXT_PLAIN
+    assert resp.headers["content-encoding"] == "gzip"
+    body = (await resp.text()).split("\n")
+
+    assert "# HELP python_info Python platform information" in body
+    assert "# TYPE temperature_c gauge" in body
+    assert (
+        'temperature_c{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 15.6' in body
+    )
+    assert "# TYPE state_change_total counter" in body
+    assert (
+        'state_change_total{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 1.0' in body
+    )
+    assert (
+        'last_updated_time_seconds{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 86400.0' in body
+    )
+    assert "scrape_duration_seconds 0.0" in body
+
+    resp = await client.get(prometheus.API_ENDPOINT)
+    body = (await resp.text()).split("\n")
+    assert "scrape_duration_seconds 0.0" not in body
+
+
+def test_cached_exposition():
+    """Test the cached exposition only renders changed samples."""
+    exposition = CachedExposition()
+    gauge = exposition.Gauge("temp_c", "Temperature", ["entity"])
+    counter = exposition.Counter("changes", "Changes", ["entity"])
+    assert exposition.render() == (0, "")
+
+    gauge.labels(entity='say "hi"\\').set(1)
+    counter.labels(entity="sensor.a").inc()
+    counter.labels(entity="sensor.a").inc()
+    version, text = exposition.render()
+    assert text == (
+        "# HELP temp_c Temperature\n"
+        "# TYPE temp_c gauge\n"
+        'temp_c{entity="say \\"hi\\"\\\\"} 1.0\n'
+        "# HELP changes_total Changes\n"
+        "# TYPE changes_total counter\n"
+        'changes_total{entity="sensor.a"} 2.0\n'
+    )
+
+    gauge.labels(entity='say "hi"\\').set(1.0)
+    assert exposition.render()[0] == version
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture():
     """Mock the prometheus client."""
@@ -365,3 +427,15 @@ async def test_filtered_denylist(hass, mock_client):
         was_called = mock_client.labels.call_count == 1
         assert test.should_pass == was_called
         mock_client.labels.reset_mock()
+
+
+async def test_view_gzip_refused(hass, hass_client):
+    """Test the metrics are not compressed when gzip is refused."""
+    client = await prometheus_client(hass, hass_client, {"cached_exposition": True})
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "gzip;q=0, identity"}
+    )
+
+    assert resp.status == 200
+    assert "content-encoding" not in resp.headers
+    assert "# TYPE temperature_c gauge" in (await resp.text()).split("\n")
@@ -0,0 +1,170 @@
+"""The tests for the stream segment store and partial segments."""
+import asyncio
+
+from homeassistant.components.stream import Stream
+from homeassistant.components.stream.const import ATTR_STREAMS, DOMAIN
+from homeassistant.components.stream.core import Part, Segment, StreamOutput
+from homeassistant.components.stream.fmp4utils import (
+    find_fragments,
+    get_init,
+    get_m4s,
+)
+from homeassistant.setup import async_setup_component
+
+from tests.async_mock import patch
+
+
+def _box(box_type, payload=b""):
+    """Return an mp4 box."""
+    return (len(payload) + 8).to_bytes(4, byteorder="big") + box_type + payload
+
+
+def _segment(sequence, size=10):
+    """Return a segment with a read only buffer of the given size."""
+    return Segment(sequence, memoryview(bytes(size)), 1)
+
+
+async def test_segments_shared_between_outputs(hass):
+    """Test outputs holding the same segment share one buffer."""
+    stream = Stream(hass, "source")
+    hls = stream.add_provider("hls")
+    other = StreamOutput(stream)
+    store = stream.segment_store
+
+    segment = _segment(1)
+    hls.put(segment)
+    other.put(segment)
+    assert len(store) == 1
+    assert store.memory == 10
+    assert segment.refs == 2
+
+    other.cleanup()
+    assert segment.refs == 1
+    assert store.memory == 10
+
+    # Segments falling out of the window are released
+    for sequence in range(2, 6):
+        hls.put(_segment(sequence))
+    assert hls.segments == [3, 4, 5]
+    assert segment.refs == 0
+    assert len(store) == 3
+    assert store.memory == 30
+
+    hls.cleanup()
+    assert len(store) == 0
+    assert store.memory == 0
+
+
+async def test_segment_memory_ceiling(hass):
+    """Test the oldest segments are discarded above the memory ceiling."""
+    stream = Stream(hass, "source")
+    hls = stream.add_provider("hls")
+    stream.segment_store.max_memory = 25
+
+    hls.put(_segment(1))
+    hls.put(_segment(2))
+    hls.put(_segment(3))
+    assert hls.segments == [2, 3]
+    assert stream.segment_store.memory == 20
+
+    # The latest segment is always kept
+    hls.put(_segment(4, size=40))
+    assert hls.segments == [4]
+    assert stream.segment_store.memory == 40
+
+
+def test_fmp4_sections_are_views():
+    """Test init and m4s sections are views of the segment buffer."""
+    data = (
+        _box(b"ftyp", b"isom")
+        + _box(b"moov")
+        + _box(b"moof", b"fragment")
+        + _box(b"mdat", b"data")
+        + _box(b"mfra")
+    )
+    segment = memoryview(data)
+
+    init = get_init(segment)
+    m4s = get_m4s(segment, 1)
+    assert isinstance(m4s, memoryview)
+    assert m4s.obj is data
+    assert bytes(init) == _box(b"ftyp", b"isom") + _box(b"moov")
+    assert bytes(m4s) == _box(b"moof", b"fragment") + _box(b"mdat", b"data")
+
+
+def test_find_fragments():
+    """Test only complete fragments are found in a segment being written."""
+    init = _box(b"ftyp", b"isom") + _box(b"moov")
+    fragment = _box(b"moof", b"fragment") + _box(b"mdat", b"data")
+    data = init + fragment + fragment[:-2]
+
+    assert list(find_fragments(memoryview(data))) == [
+        (len(init), len(init) + len(fragment))
+    ]
+    assert list(find_fragments(memoryview(data), len(init) + len(fragment))) == []
+
+
+async def test_ll_hls(hass, hass_client):
+    """Test partial segments in the playlist and blocking playlist reload."""
+    await async_setup_component(hass, DOMAIN, {DOMAIN: {"ll_hls": True}})
+    stream = Stream(hass, "source")
+    stream.access_token = "abc0"
+    hass.data[DOMAIN][ATTR_STREAMS]["source"] = stream
+    track = stream.add_provider("hls")
+
+    view = memoryview(b"first" + b"second")
+    track.put(
+        Segment(
+            1,
+            view,
+            1.0,
+            parts=[Part(1, 0, 0.5, view[:5], True), Part(1, 1, 0.5, view[5:])],
+        )
+    )
+    track.put_part(Part(2, 0, 0.4, memoryview(b"third"), True))
+
+    with patch.object(Stream, "start"):
+        client = await hass_client()
+
+        resp = await client.get("/api/hls/abc0/playlist.m3u8")
+        assert resp.status == 200
+        playlist = (await resp.text()).splitlines()
+        assert "#EXT-X-PART-INF:PART-TARGET=0.500" in playlist
+        assert "#EXT-X-SERVER-CONTROL:CAN-BLOCK-RELOAD=YES,PART-HOLD-BACK=1.500" in (
+            playlist
+        )
+        assert playlist[-6:] == [
+            '#EXT-X-PART:DURATION=0.500,URI="./segment/1.0.m4s",INDEPENDENT=YES',
+            '#EXT-X-PART:DURATION=0.500,URI="./segment/1.1.m4s"',
+            "#EXTINF:1.0000,",
+            "./segment/1.m4s",
+            '#EXT-X-PART:DURATION=0.400,URI="./segment/2.0.m4s",INDEPENDENT=YES',
+            '#EXT-X-PRELOAD-HINT:TYPE=PART,URI="./segment/2.1.m4s"',
+        ]
+
+        resp = await client.get("/api/hls/abc0/segment/1.1.m4s")
+        assert await resp.read() == b"second"
+        resp = await client.get("/api/hls/abc0/segment/2.0.m4s")
+        assert await resp.read() == b"third"
+
+        # Blocking reload waits for the requested part
+        reload = hass.async_create_task(
+            client.get("/api/hls/abc0/playlist.m3u8?_HLS_msn=2&_HLS_part=1")
+        )
+        hinted = hass.async_create_task(client.get("/api/hls/abc0/segment/2.1.m4s"))
+        await asyncio.sleep(0.1)
+        assert not reload.done()
+        assert not hinted.done()
+
+        track.put_part(Part(2, 1, 0.4, memoryview(b"fourth")))
+        resp = await reload
+        assert '#EXT-X-PRELOAD-HINT:TYPE=PART,URI="./segment/2.2.m4s"' in (
+            await resp.text()
+        )
+        resp = await hinted
+        assert await resp.read() == b"fourth"
+
+        resp = await client.get("/api/hls/abc0/playlist.m3u8?_HLS_msn=9")
+        assert resp.status == 400
+        resp = await client.get("/api/hls/abc0/playlist.m3u8?_HLS_part=1")
+        assert resp.status == 400
@@ -5,6 +5,7 @@ from io import BytesIO
 import av
 import pytest
 
+from homeassistant.components.stream import Stream
 from homeassistant.components.stream.core import Segment
 from homeassistant.components.stream.recorder import recorder_save_worker
 from homeassistant.setup import async_setup_component
@@ -76,7 +77,7 @@ async def test_recorder_save():
     output.name = "test.mp4"
 
     # Run
-    recorder_save_worker(output, [Segment(1, source, 4)], "mp4")
+    recorder_save_worker(output, [Segment(1, source.getbuffer(), 4)], "mp4")
 
     # Assert
     assert output.getvalue()
@@ -118,3 +119,31 @@ async def test_record_stream_audio(hass, hass_client):
             assert len(result.streams.audio) == expected_audio_streams
             result.close()
             stream.stop()
+
+
+async def test_recorder_segments_pinned(hass):
+    """Test segments kept by a recording don't count toward the ceiling."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+    stream = Stream(hass, "source")
+    hls = stream.add_provider("hls")
+    recorder = stream.add_provider("recorder")
+    store = stream.segment_store
+    store.max_memory = 25
+
+    for sequence in range(1, 4):
+        segment = Segment(sequence, memoryview(bytes(10)), 1)
+        hls.put(segment)
+        recorder.put(segment)
+    assert hls.segments == [1, 2, 3]
+    assert recorder.segments == [1, 2, 3]
+    assert store.memory == 30
+    assert store.pinned == 30
+
+    with patch("homeassistant.components.stream.recorder.recorder_save_worker"):
+        recorder.cleanup()
+    assert store.pinned == 0
+    assert store.memory == 30
+
+    hls.put(Segment(4, memoryview(bytes(10)), 1))
+    assert hls.segments == [3, 4]
+    assert store.memory == 20
@@ -257,6 +257,20 @@ async def test_get_group_not_found(zha_client):
     assert msg["error"]["code"] == const.ERR_NOT_FOUND
 
 
+async def test_scheduler_stats(zha_client):
+    """Test getting the statistics of the request scheduler."""
+    await zha_client.send_json({ID: 5, TYPE: "zha/scheduler/stats"})
+
+    msg = await zha_client.receive_json()
+
+    stats = msg["result"]
+    assert stats["in_flight"] == 0
+    assert set(stats["priorities"]) == {"command", "read", "configure"}
+    for priority in stats["priorities"].values():
+        assert priority["queued"] == 0
+        assert priority["average_latency"] <= priority["max_latency"]
+
+
 async def test_list_groupable_devices(zha_client, device_groupable):
     """Test getting zha devices that have a group cluster."""
 
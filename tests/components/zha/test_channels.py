@@ -475,3 +475,19 @@ async def test_poll_control_cluster_command(hass, poll_control_device):
     assert data["args"][1] is mock.sentinel.args2
     assert data["args"][2] is mock.sentinel.args3
     assert data["unique_id"] == "00:11:22:33:44:55:66:77:1:0x0020"
+
+
+async def test_poll_control_commands_scheduled(hass, poll_control_device):
+    """Test channel commands take their turn from the gateway scheduler."""
+    poll_control_ch = poll_control_device.channels.pools[0].all_channels["1:0x0020"]
+    cluster = poll_control_ch.cluster
+    scheduler = get_zha_gateway(hass).request_scheduler
+    requests = scheduler.stats["priorities"]["command"]["requests"]
+    sent = cluster.endpoint.request.await_count
+
+    await poll_control_ch.check_in_response(33)
+
+    assert cluster.endpoint.request.await_count == sent + 2
+    stats = scheduler.stats
+    assert stats["priorities"]["command"]["requests"] == requests + 2
+    assert stats["in_flight"] == 0
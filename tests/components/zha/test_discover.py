@@ -60,6 +60,12 @@ def channels_mock(zha_device_mock):
     "zigpy.zcl.clusters.general.Identify.request",
     new=AsyncMock(return_value=[mock.sentinel.data, zcl_f.Status.SUCCESS]),
 )
+# Restored devices are loaded by a task the test doesn't wait for, so their
+# requests must not wait for the radio rate limit
+@patch(
+    "homeassistant.components.zha.core.scheduler.RequestScheduler._take_token",
+    new=mock.Mock(return_value=True),
+)
 @pytest.mark.parametrize("device", DEVICES)
 async def test_devices(
     device,
@@ -0,0 +1,147 @@
+"""Test ZHA request scheduler."""
+import asyncio
+
+from homeassistant.components.zha.core.const import (
+    REQUEST_PRIORITY_COMMAND,
+    REQUEST_PRIORITY_CONFIGURE,
+    REQUEST_PRIORITY_READ,
+)
+from homeassistant.components.zha.core.scheduler import RequestScheduler
+
+
+async def _run(scheduler, device, priority, order, release):
+    """Hold a turn until released, recording the order turns are given."""
+    async with scheduler.slot(device, priority):
+        order.append((device, priority))
+        await release.wait()
+
+
+async def test_priority_order(hass):
+    """Test commands overtake the reads and configuration already queued."""
+    scheduler = RequestScheduler(hass, max_concurrent=1, rate=1000, burst=1000)
+    order = []
+    release = asyncio.Event()
+
+    tasks = [
+        hass.async_create_task(_run(scheduler, "a", priority, order, release))
+        for priority in (
+            REQUEST_PRIORITY_CONFIGURE,
+            REQUEST_PRIORITY_READ,
+            REQUEST_PRIORITY_CONFIGURE,
+            REQUEST_PRIORITY_COMMAND,
+        )
+    ]
+    await asyncio.sleep(0)
+    assert order == [("a", REQUEST_PRIORITY_CONFIGURE)]
+
+    stats = scheduler.stats
+    assert stats["in_flight"] == 1
+    assert stats["priorities"]["command"]["queued"] == 1
+    assert stats["priorities"]["read"]["queued"] == 1
+    assert stats["priorities"]["configure"]["queued"] == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert order == [
+        ("a", REQUEST_PRIORITY_CONFIGURE),
+        ("a", REQUEST_PRIORITY_COMMAND),
+        ("a", REQUEST_PRIORITY_READ),
+        ("a", REQUEST_PRIORITY_CONFIGURE),
+    ]
+
+    stats = scheduler.stats
+    assert stats["in_flight"] == 0
+    assert stats["max_queue_depth"] == 3
+    assert stats["priorities"]["configure"]["requests"] == 2
+    assert stats["priorities"]["command"]["queued"] == 0
+    assert stats["priorities"]["command"]["max_latency"] > 0
+
+
+async def test_device_limit(hass):
+    """Test a busy device doesn't hold up the requests for other devices."""
+    scheduler = RequestScheduler(
+        hass, max_concurrent=4, max_device_concurrent=1, rate=1000, burst=1000
+    )
+    order = []
+    release = asyncio.Event()
+
+    tasks = [
+        hass.async_create_task(
+            _run(scheduler, device, REQUEST_PRIORITY_READ, order, release)
+        )
+        for device in ("a", "a", "b")
+    ]
+    await asyncio.sleep(0)
+    assert order == [("a", REQUEST_PRIORITY_READ), ("b", REQUEST_PRIORITY_READ)]
+    assert scheduler.stats["priorities"]["read"]["queued"] == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert len(order) == 3
+
+
+async def test_rate_limit(hass):
+    """Test requests beyond the burst wait for the bucket to refill."""
+    scheduler = RequestScheduler(hass, rate=100, burst=2)
+    order = []
+    release = asyncio.Event()
+    release.set()
+
+    tasks = [
+        hass.async_create_task(
+            _run(scheduler, device, REQUEST_PRIORITY_COMMAND, order, release)
+        )
+        for device in ("a", "b", "c")
+    ]
+    await asyncio.sleep(0)
+    assert len(order) == 2
+    assert scheduler.stats["rate_limited"] == 1
+
+    await asyncio.gather(*tasks)
+    assert len(order) == 3
+
+
+async def test_cancelled_request(hass):
+    """Test a cancelled request gives its turn to the next one."""
+    scheduler = RequestScheduler(hass, max_concurrent=1, rate=1000, burst=1000)
+    order = []
+    release = asyncio.Event()
+
+    first = hass.async_create_task(
+        _run(scheduler, "a", REQUEST_PRIORITY_READ, order, release)
+    )
+    cancelled = hass.async_create_task(
+        _run(scheduler, "b", REQUEST_PRIORITY_READ, order, release)
+    )
+    last = hass.async_create_task(
+        _run(scheduler, "c", REQUEST_PRIORITY_READ, order, release)
+    )
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    release.set()
+    await asyncio.gather(first, last)
+
+    assert order == [("a", REQUEST_PRIORITY_READ), ("c", REQUEST_PRIORITY_READ)]
+    assert scheduler.stats["in_flight"] == 0
+
+
+async def test_shutdown(hass):
+    """Test shutdown cancels the requests waiting for their turn."""
+    scheduler = RequestScheduler(hass, max_concurrent=1, rate=1000, burst=1000)
+    order = []
+    release = asyncio.Event()
+
+    first = hass.async_create_task(
+        _run(scheduler, "a", REQUEST_PRIORITY_READ, order, release)
+    )
+    waiting = hass.async_create_task(
+        _run(scheduler, "b", REQUEST_PRIORITY_READ, order, release)
+    )
+    await asyncio.sleep(0)
+
+    scheduler.shutdown()
+    release.set()
+    await first
+    await asyncio.gather(waiting, return_exceptions=True)
+    assert waiting.cancelled()
+    assert order == [("a", REQUEST_PRIORITY_READ)]
@@ -1,4 +1,6 @@
 """Test zone component."""
+import random
+
 import pytest
 
 from homeassistant import setup
@@ -14,6 +16,7 @@ from homeassistant.const import (
 from homeassistant.core import Context
 from homeassistant.exceptions import Unauthorized
 from homeassistant.helpers import entity_registry
+from homeassistant.util.location import distance
 
 from tests.async_mock import patch
 from tests.common import MockConfigEntry
@@ -198,6 +201,96 @@ async def test_active_zone_prefers_smaller_zone_if_same_distance_2(hass):
     assert "zone.smallest_zone" == active.entity_id
 
 
+def _scan_active_zone(zones, latitude, longitude, radius):
+    """Find the active zone by measuring every zone."""
+    closest = None
+    min_dist = None
+    for zone_state in sorted(zones, key=lambda state: state.entity_id):
+        zone_dist = distance(
+            latitude,
+            longitude,
+            zone_state.attributes["latitude"],
+            zone_state.attributes["longitude"],
+        )
+        if zone_dist is None or zone_dist - radius >= zone_state.attributes["radius"]:
+            continue
+        if (
+            closest is None
+            or zone_dist < min_dist
+            or (
+                zone_dist == min_dist
+                and zone_state.attributes["radius"] < closest.attributes["radius"]
+            )
+        ):
+            min_dist = zone_dist
+            closest = zone_state
+    return closest
+
+
+async def test_active_zone_index_matches_scan(hass):
+    """Test the zone index finds the same zones as measuring every zone."""
+    rand = random.Random(42)
+    centers = [(0, 179.99), (0, -179.99), (84.9, 10), (-89, 0), (52.37, 4.89)]
+    for number in range(300):
+        if number < 250:
+            latitude, longitude = rand.choice(centers)
+            latitude = max(-90, min(90, latitude + rand.uniform(-0.5, 0.5)))
+            longitude = (longitude + rand.uniform(-0.5, 0.5) + 180) % 360 - 180
+        else:
+            latitude = rand.uniform(-80, 80)
+            longitude = rand.uniform(-180, 180)
+        hass.states.async_set(
+            f"zone.zone_{number}",
+            "zoning",
+            {
+                "latitude": latitude,
+                "longitude": longitude,
+                "radius": rand.choice((50, 100, 1000, 20000, 500000, 3000000)),
+            },
+        )
+    zones = hass.states.async_all(zone.DOMAIN)
+
+    locations = []
+    for _ in range(500):
+        latitude, longitude = rand.choice(centers)
+        locations.append(
+            (
+                max(-90, min(90, latitude + rand.uniform(-0.6, 0.6))),
+                (longitude + rand.uniform(-0.6, 0.6) + 180) % 360 - 180,
+                rand.choice((0, 10, 100, 5000)),
+            )
+        )
+
+    for location, active in zip(locations, zone.async_active_zones(hass, locations)):
+        assert active is _scan_active_zone(zones, *location)
+        assert active is zone.async_active_zone(hass, *location)
+
+
+async def test_active_zone_index_follows_zone_changes(hass):
+    """Test the zone index is rebuilt when a zone changes."""
+    assert zone.async_active_zone(hass, 32.8806, -117.237561) is None
+
+    hass.states.async_set(
+        "zone.office",
+        "zoning",
+        {"latitude": 32.8806, "longitude": -117.237561, "radius": 250},
+    )
+    assert zone.async_active_zone(hass, 32.8806, -117.237561).entity_id == (
+        "zone.office"
+    )
+
+    hass.states.async_set(
+        "zone.office",
+        "zoning",
+        {"latitude": 40.0, "longitude": -117.237561, "radius": 250},
+    )
+    assert zone.async_active_zone(hass, 32.8806, -117.237561) is None
+    assert zone.async_active_zone(hass, 40.0, -117.237561).entity_id == "zone.office"
+
+    hass.states.async_remove("zone.office")
+    assert zone.async_active_zone(hass, 40.0, -117.237561) is None
+
+
 async def test_in_zone_works_for_passive_zones(hass):
     """Test working in passive zones."""
     latitude = 32.880600
@@ -613,6 +613,33 @@ async def test_numberic_state_attribute(hass):
     assert not test(hass)
 
 
+async def test_numeric_state_parsed_once_per_state(hass, caplog):
+    """Test a compiled numeric state condition parses each state once."""
+    test = await condition.async_from_config(
+        hass,
+        {
+            "condition": "numeric_state",
+            "entity_id": "sensor.temperature",
+            "below": 50,
+        },
+    )
+
+    hass.states.async_set("sensor.temperature", "warm")
+    assert not test(hass)
+    assert not test(hass)
+    assert caplog.text.count("Value cannot be processed as a number") == 1
+
+    hass.states.async_set("sensor.temperature", 49)
+    assert test(hass)
+
+    hass.states.async_set("sensor.temperature", 49, {"unit_of_measurement": "°C"})
+    assert test(hass)
+
+    hass.states.async_set("sensor.temperature", "warm")
+    assert not test(hass)
+    assert caplog.text.count("Value cannot be processed as a number") == 2
+
+
 async def test_numeric_state_using_input_number(hass):
     """Test numeric_state conditions using input_number entities."""
     await async_setup_component(
@@ -578,6 +578,40 @@ async def test_update(registry):
     assert registry.async_get(updated_entry.id) is not None
 
 
+async def test_update_devices(hass, registry, update_events):
+    """Verify that we can update multiple devices at once."""
+    entry = registry.async_get_or_create(
+        config_entry_id="1234",
+        connections={(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    entry2 = registry.async_get_or_create(
+        config_entry_id="1234",
+        connections={(device_registry.CONNECTION_NETWORK_MAC, "34:56:78:CD:EF:12")},
+    )
+    await hass.async_block_till_done()
+    update_events.clear()
+
+    with patch.object(registry, "async_schedule_save") as mock_save:
+        updated = registry.async_update_devices(
+            {
+                entry.id: {"area_id": "12345A"},
+                entry2.id: {"name_by_user": "Test Friendly Name"},
+            }
+        )
+
+    assert mock_save.call_count == 1
+    assert updated[entry.id].area_id == "12345A"
+    assert updated[entry2.id].name_by_user == "Test Friendly Name"
+    assert registry.async_get(entry.id) is updated[entry.id]
+
+    await hass.async_block_till_done()
+
+    assert update_events == [
+        {"action": "update", "device_id": entry.id},
+        {"action": "update", "device_id": entry2.id},
+    ]
+
+
 async def test_update_remove_config_entries(hass, registry, update_events):
     """Make sure we do not get duplicate entries."""
     entry = registry.async_get_or_create(
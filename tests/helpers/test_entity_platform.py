@@ -90,6 +90,56 @@ async def test_polling_updates_entities_with_exception(hass):
     assert len(update_err) == 1
 
 
+async def test_polling_records_statistics(hass):
+    """Test that the duration of polls is tracked per entity."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    poll_ent = MockEntity(should_poll=True)
+    poll_ent.async_update = Mock()
+    no_poll_ent = MockEntity(should_poll=False)
+
+    await component.async_add_entities([poll_ent, no_poll_ent])
+
+    platform = poll_ent.platform
+    assert platform.polling_stats == {}
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    assert no_poll_ent.entity_id not in platform.polling_stats
+    stats = platform.polling_stats[poll_ent.entity_id]
+    assert stats.count == 1
+    assert stats.overruns == 0
+    assert stats.as_dict()["average_time"] == stats.last_time
+
+    await platform.async_remove_entity(poll_ent.entity_id)
+    assert poll_ent.entity_id not in platform.polling_stats
+
+
+async def test_polling_overrun_is_counted(hass):
+    """Test that skipped polling intervals are counted."""
+    platform = MockEntityPlatform(hass)
+    platform._process_updates = asyncio.Lock()
+
+    async with platform._process_updates:
+        await platform._update_entity_states(dt_util.utcnow())
+
+    assert platform.polling_overruns == 1
+
+
+async def test_polling_offset_is_deterministic(hass):
+    """Test that platforms get a stable offset within the jitter window."""
+    platform = MockEntityPlatform(hass, platform_name="first")
+    platform2 = MockEntityPlatform(hass, platform_name="second")
+
+    offset = platform._polling_offset()
+    assert offset == platform._polling_offset()
+    assert offset != platform2._polling_offset()
+    assert (
+        timedelta(0) <= offset < platform.scan_interval * entity_platform.POLLING_JITTER
+    )
+
+
 async def test_update_state_adds_entities(hass):
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -487,6 +487,46 @@ async def test_update_entity(registry):
         entry = updated_entry
 
 
+async def test_update_entities(hass, registry, update_events):
+    """Test updating multiple entities at once."""
+    entry = registry.async_get_or_create("light", "hue", "5678")
+    entry2 = registry.async_get_or_create("light", "hue", "1234")
+    await hass.async_block_till_done()
+    update_events.clear()
+
+    with patch.object(registry, "async_schedule_save") as mock_schedule_save:
+        updated = registry.async_update_entities(
+            {
+                entry.entity_id: {"name": "new name"},
+                entry2.entity_id: {"disabled_by": entity_registry.DISABLED_USER},
+            }
+        )
+
+    assert mock_schedule_save.call_count == 1
+    assert updated[entry.entity_id].name == "new name"
+    assert not updated[entry.entity_id].disabled
+    assert updated[entry2.entity_id].disabled
+    assert registry.async_get(entry2.entity_id) is updated[entry2.entity_id]
+
+    await hass.async_block_till_done()
+
+    assert update_events == [
+        {"action": "update", "entity_id": entry.entity_id, "changes": ["name"]},
+        {"action": "update", "entity_id": entry2.entity_id, "changes": ["disabled_by"]},
+    ]
+
+
+async def test_update_entities_no_changes(registry):
+    """Test updating multiple entities without changes does not save."""
+    entry = registry.async_get_or_create("light", "hue", "5678")
+
+    with patch.object(registry, "async_schedule_save") as mock_schedule_save:
+        updated = registry.async_update_entities({entry.entity_id: {"name": None}})
+
+    assert mock_schedule_save.call_count == 0
+    assert updated[entry.entity_id] is entry
+
+
 async def test_disabled_by(registry):
     """Test that we can disable an entry when we create it."""
     entry = registry.async_get_or_create("light", "hue", "5678", disabled_by="hass")
@@ -735,6 +735,42 @@ def test_render_with_possible_json_value_with_missing_json_value(hass):
     assert tpl.async_render_with_possible_json_value('{"hello": "world"}') == ""
 
 
+@pytest.mark.parametrize(
+    "template_str,expected,json_path",
+    [
+        ("{{ value_json.hello }}", "world", True),
+        ("{{value_json['list'][1].x}}", "True", True),
+        ('{{ value_json["list"] [0] }}', "1.5", True),
+        ("{{ value_json.nested }}", "{'a': None}", True),
+        ("{{ value_json.nested.a }}", "None", True),
+        ("{{ value_json.items }}", None, False),
+        ("{{ value_json.list.x }}", "", False),
+        ("{{ value_json.missing }}", "", False),
+        ("{{ value_json.hello | upper }}", "WORLD", False),
+    ],
+)
+def test_render_with_possible_json_value_json_path(
+    hass, template_str, expected, json_path
+):
+    """Test templates looking up a path in value_json bypass Jinja."""
+    value = '{"hello": "world", "list": [1.5, {"x": true}], "nested": {"a": null}}'
+    tpl = template.Template(template_str, hass)
+    result = tpl.async_render_with_possible_json_value(value)
+    if expected is not None:
+        assert result == expected
+    assert tpl.value_render_count == 1
+    assert tpl.json_path_render_count == (1 if json_path else 0)
+
+    # Jinja renders the same
+    tpl = template.Template(template_str + "{{ '' }}", hass)
+    assert tpl.async_render_with_possible_json_value(value) == result
+    assert tpl.json_path_render_count == 0
+
+    tpl = template.Template(template_str, hass)
+    assert tpl.async_render_with_possible_json_value("not json") == "not json"
+    assert tpl.json_path_render_count == 0
+
+
 def test_render_with_possible_json_value_valid_with_is_defined(hass):
     """Render with possible JSON value with known JSON object."""
     tpl = template.Template("{{ value_json.hello|is_defined }}", hass)
@@ -1,8 +1,10 @@
 """Tests for the update coordinator."""
 import asyncio
 from datetime import timedelta
+import gc
 import logging
 import urllib.error
+import weakref
 
 import aiohttp
 import pytest
@@ -226,6 +228,179 @@ async def test_refresh_recover(crd, caplog):
     assert "Fetching test data recovered" in caplog.text
 
 
+async def test_shared_fetch(hass):
+    """Test coordinators with the same fetch key share a fetch in progress."""
+    calls = 0
+    release = asyncio.Event()
+
+    async def refresh() -> int:
+        nonlocal calls
+        calls += 1
+        result = calls
+        await release.wait()
+        return result
+
+    crd1, crd2, crd3 = (
+        update_coordinator.DataUpdateCoordinator[int](
+            hass, LOGGER, name="test", update_method=refresh, fetch_key=fetch_key
+        )
+        for fetch_key in ("account", "account", "other")
+    )
+
+    tasks = [hass.async_create_task(crd.async_refresh()) for crd in (crd1, crd2, crd3)]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert calls == 2
+    assert crd1.data == crd2.data
+    assert crd1.data != crd3.data
+    assert crd1.stats["fetch_count"] == 1
+    assert crd2.stats["fetch_count"] == 0
+    assert crd2.stats["shared_fetch_count"] == 1
+    assert not hass.data[update_coordinator.DATA_SHARED_FETCHES]
+
+
+async def test_shared_recent_result(hass):
+    """Test scheduled refreshes reuse data another coordinator just fetched."""
+    calls = 0
+
+    async def refresh() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    crd1, crd2 = (
+        update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            LOGGER,
+            name="test",
+            update_method=refresh,
+            update_interval=timedelta(seconds=10),
+            fetch_key="account",
+        )
+        for _ in range(2)
+    )
+
+    await crd1.async_refresh()
+    assert calls == 1
+
+    # pylint: disable=protected-access
+    await crd2._handle_refresh_interval(utcnow())
+    assert calls == 1
+    assert crd2.data == 1
+    assert crd2.stats["shared_fetch_count"] == 1
+
+    # A coordinator doesn't reuse its own data
+    await crd1._handle_refresh_interval(utcnow())
+    assert calls == 2
+
+    # Requested refreshes always fetch
+    await crd2.async_refresh()
+    assert calls == 3
+
+    # Data older than the update interval is fetched again
+    with patch(
+        "homeassistant.helpers.update_coordinator.monotonic",
+        return_value=update_coordinator.monotonic() + 11,
+    ):
+        await crd1._handle_refresh_interval(utcnow())
+    assert calls == 4
+
+
+async def test_shared_result_released(hass):
+    """Test the shared data doesn't keep unused coordinators around."""
+
+    async def refresh() -> int:
+        return 1
+
+    def get_coordinator():
+        return update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            LOGGER,
+            name="test",
+            update_method=refresh,
+            update_interval=timedelta(seconds=10),
+            fetch_key="account",
+        )
+
+    crd = get_coordinator()
+    await crd.async_refresh()
+    results = hass.data[update_coordinator.DATA_SHARED_RESULTS]
+    assert "account" in results
+
+    coordinator_ref = weakref.ref(crd)
+    del crd
+    gc.collect()
+    assert coordinator_ref() is None
+
+    # The data is dropped when the last listener of its coordinator goes away
+    crd = get_coordinator()
+    unsub = crd.async_add_listener(lambda: None)
+    await crd.async_refresh()
+    assert "account" in results
+    unsub()
+    assert "account" not in results
+
+
+async def test_shared_fetch_failure(hass, caplog):
+    """Test a failing shared fetch fails all coordinators sharing it."""
+    release = asyncio.Event()
+
+    async def refresh() -> int:
+        await release.wait()
+        raise update_coordinator.UpdateFailed("Boom")
+
+    crd1, crd2 = (
+        update_coordinator.DataUpdateCoordinator[int](
+            hass, LOGGER, name="test", update_method=refresh, fetch_key="account"
+        )
+        for _ in range(2)
+    )
+
+    tasks = [hass.async_create_task(crd.async_refresh()) for crd in (crd1, crd2)]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert crd1.last_update_success is False
+    assert crd2.last_update_success is False
+    assert caplog.text.count("Error fetching test data: Boom") == 2
+
+
+async def test_adaptive_update_interval(hass):
+    """Test the update interval backs off while the data does not change."""
+    value = 1
+
+    async def refresh() -> int:
+        return value
+
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        LOGGER,
+        name="test",
+        update_method=refresh,
+        update_interval=timedelta(seconds=10),
+        max_update_interval=timedelta(seconds=30),
+    )
+
+    await crd.async_refresh()
+    assert crd.current_update_interval == timedelta(seconds=10)
+
+    await crd.async_refresh()
+    assert crd.current_update_interval == timedelta(seconds=20)
+
+    await crd.async_refresh()
+    await crd.async_refresh()
+    assert crd.current_update_interval == timedelta(seconds=30)
+    assert crd.stats["unchanged_fetch_count"] == 3
+
+    value = 2
+    await crd.async_refresh()
+    assert crd.current_update_interval == timedelta(seconds=10)
+    assert crd.stats["fetch_count"] == 5
+
+
 async def test_coordinator_entity(crd):
     """Test the CoordinatorEntity class."""
     entity = update_coordinator.CoordinatorEntity(crd)
@@ -6,6 +6,7 @@ import functools
 import logging
 import os
 from tempfile import TemporaryDirectory
+import threading
 import unittest
 
 import pytest
@@ -237,6 +238,26 @@ async def test_async_add_job_pending_tasks_executor(hass):
     assert len(call_count) == 2
 
 
+async def test_async_add_executor_partition_job(hass):
+    """Run a job in an executor partition."""
+    thread_names = []
+
+    def test_executor(value):
+        """Test executor."""
+        thread_names.append(threading.current_thread().name)
+        return value
+
+    task = hass.async_add_executor_partition_job("db_read", test_executor, 5)
+
+    assert task in hass._pending_tasks
+    assert await task == 5
+    assert thread_names[0].startswith("SyncWorker_db_read")
+    assert hass.executors.get("db_read").as_dict()["completed"] == 1
+
+    with pytest.raises(ValueError):
+        hass.async_add_executor_partition_job("invalid", test_executor, 5)
+
+
 async def test_async_add_job_pending_tasks_callback(hass):
     """Run a callback in pending tasks."""
     call_count = []
@@ -0,0 +1,66 @@
+"""Test Home Assistant executor partitions."""
+import threading
+
+import pytest
+
+from homeassistant.util import executor
+
+
+async def test_partition_statistics(hass):
+    """Test that jobs are counted and their queue wait is recorded."""
+    partition = executor.ExecutorPartition("test", 1)
+    release = threading.Event()
+
+    def blocking_job():
+        release.wait()
+        return threading.current_thread().name
+
+    first = partition.run_in_executor(hass.loop, blocking_job)
+    second = partition.run_in_executor(hass.loop, blocking_job)
+
+    assert partition.submitted == 2
+    assert partition.queue_depth >= 1
+
+    release.set()
+
+    assert (await first).startswith("SyncWorker_test")
+    await second
+
+    stats = partition.as_dict()
+    assert stats["max_workers"] == 1
+    assert stats["submitted"] == 2
+    assert stats["completed"] == 2
+    assert stats["queue_depth"] == 0
+    assert stats["max_wait"] >= stats["average_wait"] > 0
+
+    await hass.async_add_executor_job(partition.shutdown)
+
+
+async def test_partition_job_exception(hass):
+    """Test that a failing job is counted as completed."""
+    partition = executor.ExecutorPartition("test", 1)
+
+    def failing_job():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        await partition.run_in_executor(hass.loop, failing_job)
+
+    assert partition.completed == 1
+
+    await hass.async_add_executor_job(partition.shutdown)
+
+
+def test_partitions_sizes():
+    """Test overriding partition sizes and looking up partitions."""
+    partitions = executor.ExecutorPartitions({executor.EXECUTOR_CPU: 3})
+
+    assert partitions.get(executor.EXECUTOR_CPU).max_workers == 3
+    assert (
+        partitions.get(executor.EXECUTOR_IO).max_workers
+        == executor.DEFAULT_PARTITION_SIZES[executor.EXECUTOR_IO]
+    )
+    assert set(partitions.as_dict()) == set(executor.DEFAULT_PARTITION_SIZES)
+
+    with pytest.raises(ValueError):
+        partitions.get("invalid")